@@ -1,979 +1,493 @@
 import os
+import sys
+from datetime import datetime
 from time import sleep
 
+from task_manager import cli
+from task_manager.paging import TaskPager
 from task_manager.task_manager import TaskManager
 
 
-def delete(value):
-    tab = TaskManager()
-    tasks = tab.getting_task()
-
-    match value:
-        case "id":
-            while True:
-                os.system("cls")
-                delete_text = (
-                    f"{tasks}\n\n"
-                    "Введите ID задачи, которую необходимо удалить.\n\n"
-                    "[0] Назад\n"
-                )
-
-                try:
-                    print(delete_text)
-                    user_input_delete = int(input(">> "))
-                except ValueError:
-                    print(
-                        "Введите номер варианта в числовом формате\n"
-                        "В данном разделе меню, текст не поддерживается."
-                    )
-                    sleep(2)
-                    delete(value)
-
-                if user_input_delete == 0:
-                    delete_task()
-
-                if tab.data_validation(column="id",
-                                       value=str(user_input_delete),
-                                       intention="delete"):
-                    if tab.delete_task(value=str(user_input_delete),
-                                       choice="id"):
-                        sleep(2)
-                        delete_task()
-                else:
-                    sleep(2)
-                    delete(value)
-
-        case "category":
-            while True:
-                os.system("cls")
-                delete_text = (
-                    f"{tasks}\n\n"
-                    "Введите категорию задач для удаления.\n\n"
-                    "[0] Назад\n"
-                )
-
-                print(delete_text)
-                user_input_delete = str(input(">> "))
-
-                if user_input_delete == "0":
-                    delete_task()
-
-                if tab.data_validation(column="category",
-                                       value=str(user_input_delete),
-                                       intention="delete"):
-                    if tab.delete_task(value=str(user_input_delete),
-                                       choice="category"):
-                        sleep(2)
-                        delete_task()
-                else:
-                    sleep(2)
-                    delete(value)
-
-
-def delete_task():
-    tab = TaskManager()
-    tasks = tab.getting_task()
-
-    while True:
-        os.system("cls")
-        delete_task_text = (
-            f"{tasks}\n\n"
-            "Выберите способ удаления задачи:\n"
-            "По идентификатору (ID) — будет удалена одна задача.\n"
-            "По категории — будут удалены все задачи, принадлежащие\n"
-            "выбранной категории.\n\n"
-            "[1] Удалить по ID\n"
-            "[2] Удалить по категории\n"
-            "[0] Назад\n"
-        )
-
-        try:
-            print(delete_task_text)
-            user_input_delete_task = int(input(">> "))
-        except ValueError:
-            print(
-                "Введите номер варианта в числовом формате\n"
-                "В данном разделе меню, текст не поддерживается."
-            )
-            sleep(2)
-            change_task()
-
-        if user_input_delete_task == 0:
-            main_menu()
-
-        match user_input_delete_task:
-            case 1:
-                delete("id")
-            case 2:
-                delete("category")
-
-
-def change(value, option):
-    tab = TaskManager()
-    task = tab.getting_task(value=str(value), option="id")
-
+# Сообщение о вводе текста там, где ожидается номер варианта
+NUMBER_EXPECTED_TEXT = (
+    "Введите номер варианта в числовом формате\n"
+    "В данном разделе меню, текст не поддерживается."
+)
+
+# Тексты экранов изменения задачи: {поле: (подсказка, приглашение)}
+CHANGE_TEXTS = {
+    "title": (
+        "Заголовок задачи дожен быть не менее 5 символов.\n"
+        "Он должен быть информативным, чтобы вам было по-\n"
+        "нятно, о чем идет речь и он не должен повторяться.\n\n",
+        "Новый заголовок: "
+    ),
+    "description": (
+        "Описание задачи дожно быть не менее 10 символов.\n"
+        "Оно должно четко и подробно объяснять суть зада-\n"
+        "чи. А также иметь достаточно информации для кор-\n"
+        "ректного выполнения и не должно повторяться.\n\n",
+        "Новое описание: "
+    ),
+    "category": (
+        "Категория, необходима для четкого распределения \n"
+        "задачи. Категория может включать в себя только \n"
+        "одно из значений:\n\n"
+        "Личное - задачи связанные с повседневной жизнью.\n"
+        "Например: Поход в кино, прогулка, приготовить "
+        "ужин.\n\n"
+        "Обучение - задачи связанные с получения новых знаний\n"
+        "навыков, умений, опыта.\nНапример: Прохождение курса\n"
+        "по веб-разработке, посещение семинара по финансовой \n"
+        "грамотности.\n\n"
+        "Работа - задачи связанные с рабочей деятельностью.\n"
+        "Например: составление еженедельного отчета или де-\n"
+        "ловая встреча.\n\n"
+        "Новое значение категории не должно повторяться.\n\n",
+        "Новая категория: "
+    ),
+    "due_date": (
+        "Сроки задачи, необходимы для контроля прогресса выпол-\n"
+        "нения задач, а также планирования и распределения ресу-\n"
+        "рсов. Необходимо указать дату в формате YYYY-MM-DD, да-\n"
+        "та должна быть больше или равна сегодняшнему дню.\n\n",
+        "Новый срок задачи: "
+    ),
+    "priority": (
+        "Приоритет задачи необходим для определения её значи-\n"
+        "мости и срочности относительно других задач. Он по-\n"
+        "могает фокусироваться на важных задачах, эффективно \n"
+        "распределять время и ресурсы.\n\n"
+        "Принимается одно из 3-х значений:\n\n"
+        "Низкий - низкий приоритет задачи нужен для обозначе-\n"
+        "ния мелких, бытовых задач.\n"
+        "Напиример: записаться на курсы, оплатить интернет.\n\n"
+        "Средний - средний приоритет задачи нужен для обозна-\n"
+        "чения более серьезных задач.\n"
+        "Например: запись к врачу, застраховать автомобиль.\n\n"
+        "Высокий - высокий приоритет задачи нужен для обозна-\n"
+        "чения задач с наивысшим приоритетом.\n"
+        "Например: составить сводный отчет по продажам за ме-\n"
+        "сяц.\n\n",
+        "Новый приоритет: "
+    ),
+    "status": (
+        "Статус задачи позволяет понять, завершена ли задача \n"
+        "или требует внимания. Если задача помечена как \"Не \n"
+        "выполнена\" её нужно завершить до установленного срока.\n"
+        "Статус может включать в себя только одно из значений:\n\n"
+        "Выполнена - задача которая завершена, что не имеет смы-\n"
+        "сла при создании задачи.\n\n"
+        "Не выполнена - задача которая находится в работе или ра\n"
+        "-бота над которой планируется.\n\n",
+        "Новый статус: "
+    ),
+}
+
+# Шаги создания задачи: (поле, текст, приглашение, пауза после ошибки)
+CREATE_STEPS = (
+    (
+        "title",
+        "Заголовок.\n\n"
+        "Заголовок задачи дожен быть не менее 5 символов.\n"
+        "Он должен быть информативным, чтобы вам было по-\n"
+        "нятно, о чем идет речь.\n\n",
+        "Заголовок: ",
+        2
+    ),
+    (
+        "description",
+        "Описание.\n\n"
+        "Описание задачи дожно быть не менее 10 символов.\n"
+        "Оно должно четко и подробно объяснять суть зада-\n"
+        "чи. А также иметь достаточно информации для кор-\n"
+        "ректного выполнения.\n\n",
+        "Описание: ",
+        2
+    ),
+    (
+        "category",
+        "Категория.\n\n"
+        "Категория, необходима для четкого распределения \n"
+        "задачи. Категория может включать в себя только \n"
+        "одно из значений:\n\n"
+        "Личное - задачи связанные с повседневной жизнью.\n"
+        "Например: Поход в кино, прогулка, приготовить "
+        "ужин.\n\n"
+        "Обучение - задачи связанные с получения новых знаний\n"
+        "навыков, умений, опыта.\nНапример: Прохождение курса\n"
+        "по веб-разработке, посещение семинара по финансовой \n"
+        "грамотности.\n\n"
+        "Работа - задачи связанные с рабочей деятельностью.\n"
+        "Например: составление еженедельного отчета или де-\n"
+        "ловая встреча.\n\n",
+        "Категория: ",
+        4
+    ),
+    (
+        "due_date",
+        "Сроки задачи.\n\n"
+        "Сроки задачи, необходимы для контроля прогресса выпол-\n"
+        "нения задач, а также планирования и распределения ресу-\n"
+        "рсов. Необходимо указать дату в формате YYYY-MM-DD, да-\n"
+        "та должна быть больше или равна сегодняшнему дню.\n\n",
+        "Сроки задачи: ",
+        5
+    ),
+    (
+        "priority",
+        "Приоритет.\n\n"
+        "Приоритет задачи необходим для определения её значи-\n"
+        "мости и срочности относительно других задач. Он по-\n"
+        "могает фокусироваться на важных задачах, эффективно \n"
+        "распределять время и ресурсы.\n\n"
+        "Принимается одно из 3-х значений:\n\n"
+        "Низкий - низкий приоритет задачи нужен для обозначе-\n"
+        "ния мелких, бытовых задач.\n"
+        "Напиример: записаться на курсы, оплатить интернет.\n\n"
+        "Средний - средний приоритет задачи нужен для обозна-\n"
+        "чения более серьезных задач.\n"
+        "Например: запись к врачу, застраховать автомобиль.\n\n"
+        "Высокий - высокий приоритет задачи нужен для обозна-\n"
+        "чения задач с наивысшим приоритетом.\n"
+        "Например: составить сводный отчет по продажам за ме-\n"
+        "сяц.\n\n",
+        "Приоритет: ",
+        5
+    ),
+    (
+        "status",
+        "Статус задачи.\n\n"
+        "Статус задачи позволяет понять, завершена ли задача \n"
+        "или требует внимания. Если задача помечена как \"Не \n"
+        "выполнена\" её нужно завершить до установленного срока.\n"
+        "Статус может включать в себя только одно из значений:\n\n"
+        "Выполнена - задача которая завершена, что не имеет смы-\n"
+        "сла при создании задачи.\n\n"
+        "Не выполнена - задача которая находится в работе или ра-\n"
+        "бота над которой планируется.\n\n",
+        "Статус [Не выполнена]: ",
+        5
+    ),
+)
+
+# Значения полей новой задачи, если ввод пустой
+CREATE_DEFAULTS = {"status": "Не выполнена"}
+
+# Тексты экранов поиска: {поле: текст приглашения}
+VIEW_TEXTS = {
+    "id": "Введите ID задачи, которую нужно найти.\n\n",
+    "category": "Введите категорию задач, которые нужно найти.\n\n",
+    "status": "Введите статус задач, которые нужно найти.\n\n",
+    "priority": "Введите приоритет задач, которые нужно найти.\n\n",
+    "keywords": "Введите ключевое слово, по которому нужно найти задачи\n\n",
+}
+
+
+def render_tasks(tab, value="", option=""):
+    # Задачи запрашиваются списком и отрисовываются отдельным шагом
+    tasks = tab.getting_task(value=value, option=option, as_records=True)
+    if tasks is False:
+        return tasks
+    return tab.format_tasks(tasks)
+
+
+def task_query(option="", value=""):
+    # Аргументы query_tasks для поиска задач по option и value
     match option:
-        case "title":
-            while True:
-                os.system("cls")
-                change_text = (
-                    f"{task}\n\n"
-                    "Заголовок задачи дожен быть не менее 5 символов.\n"
-                    "Он должен быть информативным, чтобы вам было по-\n"
-                    "нятно, о чем идет речь и он не должен повторяться.\n\n"
-                    "[0] Отмена\n"
-                )
-
-                print(change_text)
-                user_input_change = input("Новый заголовок: ")
-
-                if user_input_change == "0":
-                    change_task_sett(value)
-
-                if tab.data_validation(column="title",
-                                       value=user_input_change,
-                                       intention="change",
-                                       _id=value):
-                    if tab.change_task(_id=value,
-                                       column="title",
-                                       value=str(user_input_change)):
-                        sleep(2)
-                        change_task_sett(value)
-
-                else:
-                    sleep(2)
-                    change(value, option)
-
-        case "description":
-            while True:
-                os.system("cls")
-                change_text = (
-                    f"{task}\n\n"
-                    "Описание задачи дожно быть не менее 10 символов.\n"
-                    "Оно должно четко и подробно объяснять суть зада-\n"
-                    "чи. А также иметь достаточно информации для кор-\n"
-                    "ректного выполнения и не должно повторяться.\n\n"
-                    "[0] Отмена\n"
-                )
-
-                print(change_text)
-                user_input_change = input("Новое описание: ")
-
-                if user_input_change == "0":
-                    change_task_sett(value)
-
-                if tab.data_validation(column="description",
-                                       value=user_input_change,
-                                       intention="change",
-                                       _id=value):
-                    if tab.change_task(_id=value,
-                                       column="description",
-                                       value=str(user_input_change)):
-                        sleep(2)
-                        change_task_sett(value)
-
-                else:
-                    sleep(2)
-                    change(value, option)
-
-        case "category":
-            while True:
-                os.system("cls")
-                change_text = (
-                    f"{task}\n\n"
-                    "Категория, необходима для четкого распределения \n"
-                    "задачи. Категория может включать в себя только \n"
-                    "одно из значений:\n\n"
-                    "Личное - задачи связанные с повседневной жизнью.\n"
-                    "Например: Поход в кино, прогулка, приготовить "
-                    "ужин.\n\n"
-                    "Обучение - задачи связанные с получения новых знаний\n"
-                    "навыков, умений, опыта.\nНапример: Прохождение курса\n"
-                    "по веб-разработке, посещение семинара по финансовой \n"
-                    "грамотности.\n\n"
-                    "Работа - задачи связанные с рабочей деятельностью.\n"
-                    "Например: составление еженедельного отчета или де-\n"
-                    "ловая встреча.\n\n"
-                    "Новое значение категории не должно повторяться.\n\n"
-                    "[0] Отмена\n"
-                )
-
-                print(change_text)
-                user_input_change = input("Новая категория: ")
-
-                if user_input_change == "0":
-                    change_task_sett(value)
-
-                if tab.data_validation(column="category",
-                                       value=user_input_change,
-                                       intention="change",
-                                       _id=value):
-                    if tab.change_task(_id=value,
-                                       column="category",
-                                       value=str(user_input_change)):
-                        sleep(2)
-                        change_task_sett(value)
-
-                else:
-                    sleep(2)
-                    change(value, option)
-
+        case "":
+            return {}
+        case "keywords":
+            return {"keywords": value}
         case "due_date":
-            while True:
-                os.system("cls")
-                change_text = (
-                    f"{task}\n\n"
-                    "Сроки задачи, необходимы для контроля прогресса выпол-\n"
-                    "нения задач, а также планирования и распределения ресу-\n"
-                    "рсов. Необходимо указать дату в формате YYYY-MM-DD, да-\n"
-                    "та должна быть больше или равна сегодняшнему дню.\n\n"
-                    "[0] Отмена\n"
-                )
-
-                print(change_text)
-                user_input_change = input("Новый срок задачи: ")
-
-                if user_input_change == "0":
-                    change_task_sett(value)
-
-                if tab.data_validation(column="due_date",
-                                       value=user_input_change,
-                                       intention="change",
-                                       _id=value):
-                    if tab.change_task(_id=value,
-                                       column="due_date",
-                                       value=str(user_input_change)):
-                        sleep(2)
-                        change_task_sett(value)
-
-                else:
-                    sleep(2)
-                    change(value, option)
-
-        case "priority":
-            while True:
-                os.system("cls")
-                change_text = (
-                    f"{task}\n\n"
-                    "Приоритет задачи необходим для определения её значи-\n"
-                    "мости и срочности относительно других задач. Он по-\n"
-                    "могает фокусироваться на важных задачах, эффективно \n"
-                    "распределять время и ресурсы.\n\n"
-                    "Принимается одно из 3-х значений:\n\n"
-                    "Низкий - низкий приоритет задачи нужен для обозначе-\n"
-                    "ния мелких, бытовых задач.\n"
-                    "Напиример: записаться на курсы, оплатить интернет.\n\n"
-                    "Средний - средний приоритет задачи нужен для обозна-\n"
-                    "чения более серьезных задач.\n"
-                    "Например: запись к врачу, застраховать автомобиль.\n\n"
-                    "Высокий - высокий приоритет задачи нужен для обозна-\n"
-                    "чения задач с наивысшим приоритетом.\n"
-                    "Например: составить сводный отчет по продажам за ме-\n"
-                    "сяц.\n\n"
-                    "[0] Отмена\n"
-                )
-
-                print(change_text)
-                user_input_change = input("Новый приоритет: ")
-
-                if user_input_change == "0":
-                    change_task_sett(value)
-
-                if tab.data_validation(column="priority",
-                                       value=user_input_change,
-                                       intention="change",
-                                       _id=value):
-                    if tab.change_task(_id=value,
-                                       column="priority",
-                                       value=str(user_input_change)):
-                        sleep(2)
-                        change_task_sett(value)
-
-                else:
-                    sleep(2)
-                    change(value, option)
-
-        case "status":
-            while True:
-                os.system("cls")
-                change_text = (
-                    f"{task}\n\n"
-                    "Статус задачи позволяет понять, завершена ли задача \n"
-                    "или требует внимания. Если задача помечена как \"Не \n"
-                    "выполнена\" её нужно завершить до установленного срока.\n"
-                    "Статус может включать в себя только одно из значений:\n\n"
-                    "Выполнена - задача которая завершена, что не имеет смы-\n"
-                    "сла при создании задачи.\n\n"
-                    "Не выполнена - задача которая находится в работе или ра\n"
-                    "-бота над которой планируется.\n\n"
-                    "[0] Отмена\n"
-                )
-
-                print(change_text)
-                user_input_change = input("Новый статус: ")
-
-                if user_input_change == "0":
-                    change_task_sett(value)
-
-                if tab.data_validation(column="status",
-                                       value=user_input_change,
-                                       intention="change",
-                                       _id=value):
-                    if tab.change_task(_id=value,
-                                       column="status",
-                                       value=str(user_input_change)):
-                        sleep(2)
-                        change_task_sett(value)
-
-                else:
-                    sleep(2)
-                    change(value, option)
-
-
-def change_task_sett(value):
-    tab = TaskManager()
+            today = datetime.today().date().strftime("%Y-%m-%d")
+            return {"due_to": today, "order_by": "due_date"}
+        case _:
+            return {"filters": {option: value}}
 
-    while True:
-        os.system("cls")
-        task = tab.getting_task(value=str(value), option="id")
-        change_task_sett_text = (
-            f"{task}\n\n"
-            f"Выберите, редактируемый раздел:\n\n"
-            f"[1] Заголовок\n"
-            f"[2] Описание\n"
-            f"[3] Категория\n"
-            f"[4] Сроки задачи\n"
-            f"[5] Приоритет\n"
-            f"[6] Статус\n"
-            f"[0] Назад\n"
-        )
 
-        try:
-            print(change_task_sett_text)
-            user_input_change_task_sett = int(input(">> "))
-        except ValueError:
-            print(
-                "Введите номер варианта в числовом формате\n"
-                "В данном разделе меню, текст не поддерживается."
-            )
-            sleep(2)
-            change_task_sett(value)
+def read_number(pager=None):
+    # Номер варианта меню или None, если введен текст
+    # или команда перехода между страницами
+    user_input = input(">> ")
+    if pager is not None and pager.navigate(user_input):
+        return None
 
-        if user_input_change_task_sett == 0:
-            change_task()
+    try:
+        return int(user_input)
+    except ValueError:
+        print(NUMBER_EXPECTED_TEXT)
+        sleep(2)
+        return None
 
-        match user_input_change_task_sett:
-            case 1:
-                change(value, option="title")
-            case 2:
-                change(value, option="description")
-            case 3:
-                change(value, option="category")
-            case 4:
-                change(value, option="due_date")
-            case 5:
-                change(value, option="priority")
-            case 6:
-                change(value, option="status")
 
+# Экраны меню. Каждый экран получает общий TaskManager и возвращает
+# следующее состояние - кортеж (экран, *аргументы) - или None для выхода.
+# Экраны не вызывают друг друга, поэтому глубина стека не растет.
 
-def change_task():
-    tab = TaskManager()
+def delete(tab, value):
+    pager = TaskPager(tab)
 
     while True:
         os.system("cls")
-        change_task_text = (
-            f"{tab.getting_task()}\n\n"
-            "Укажите идентификатор (ID) задачи, которую требуется "
-            "отредактировать.\n\n"
-            "[0] Назад\n"
-        )
+        tasks = pager.render()
 
-        try:
-            print(change_task_text)
-            user_input_change_task = int(input(">> "))
-        except ValueError:
+        if value == "id":
             print(
-                "Введите номер варианта в числовом формате\n"
-                "В данном разделе меню, текст не поддерживается."
+                f"{tasks}\n\n"
+                "Введите ID задачи, которую необходимо удалить.\n\n"
+                "[0] Назад\n"
             )
-            sleep(2)
-            change_task()
-
-        if user_input_change_task == 0:
-            main_menu()
-
-        if tab.getting_task(value=str(user_input_change_task), option="id"):
-            change_task_sett(user_input_change_task)
+            user_input_delete = read_number(pager)
+            if user_input_delete is None:
+                continue
+            if user_input_delete == 0:
+                return (delete_task,)
         else:
-            sleep(2)
-            change_task()
-
-
-def add_new_task(*args):
-    tab = TaskManager()
-
-    title = args[0]
-    description = args[1]
-    category = args[2]
-    due_date = args[3]
-    priority = args[4]
-    status = args[5]
-
-    while True:
-        os.system("cls")
-        result_task_text = (
-            "Содать новую задачу?\n\n"
-            f"Заголовок: {title}\n"
-            f"Описание: {description}\n"
-            f"Категория: {category}\n"
-            f"Сроки задачи: {due_date}\n"
-            f"Приоритет: {priority}\n"
-            f"Статус: {status}\n\n"
-            "[1] Создать задачу\n"
-            "[0] Отмена\n"
-        )
-
-        try:
-            print(result_task_text)
-            user_input_final = int(input(">> "))
-        except ValueError:
             print(
-                "Введите номер варианта в числовом формате\n"
-                "В данном разделе меню, текст не поддерживается."
+                f"{tasks}\n\n"
+                "Введите категорию задач для удаления.\n\n"
+                "[0] Назад\n"
             )
-            sleep(2)
-            add_new_task(title, description, category,
-                         due_date, priority, status)
-
-        match user_input_final:
-            case 1:
-                tab.add_task(
-                    title=title,
-                    description=description,
-                    category=category,
-                    due_date=due_date,
-                    priority=priority,
-                    status=status
-                )
+            user_input_delete = str(input(">> "))
+            if pager.navigate(user_input_delete):
+                continue
+            if user_input_delete == "0":
+                return (delete_task,)
+
+        if tab.data_validation(column=value,
+                               value=str(user_input_delete),
+                               intention="delete"):
+            if tab.delete_task(value=str(user_input_delete), choice=value):
                 sleep(2)
-                main_menu()
-            case 0:
-                main_menu()
-
+                return (delete_task,)
+        else:
+            sleep(2)
 
-def create_task():
-    tab = TaskManager()
 
-    new_task_title = ""
-    new_task_description = ""
-    new_task_category = ""
-    new_task_due_date = ""
-    new_task_priority = ""
-    new_task_status = "Не выполнена"
+def delete_task(tab):
+    pager = TaskPager(tab)
 
-    # Раздел заголовка
     while True:
         os.system("cls")
-        create_task_title_text = (
-            "Заголовок.\n\n"
-            "Заголовок задачи дожен быть не менее 5 символов.\n"
-            "Он должен быть информативным, чтобы вам было по-\n"
-            "нятно, о чем идет речь.\n\n"
-            "[0] Отмена\n"
+        print(
+            f"{pager.render()}\n\n"
+            "Выберите способ удаления задачи:\n"
+            "По идентификатору (ID) — будет удалена одна задача.\n"
+            "По категории — будут удалены все задачи, принадлежащие\n"
+            "выбранной категории.\n\n"
+            "[1] Удалить по ID\n"
+            "[2] Удалить по категории\n"
+            "[0] Назад\n"
         )
 
-        print(create_task_title_text)
-        ui_title = str(input("Заголовок: "))
+        match read_number(pager):
+            case 0:
+                return (main_menu,)
+            case 1:
+                return (delete, "id")
+            case 2:
+                return (delete, "category")
 
-        if ui_title == "0":
-            main_menu()
 
-        if tab.data_validation(column="title",
-                               value=str(ui_title),
-                               intention="add"
-                               ):
-            new_task_title = new_task_title + ui_title
-            break
-        else:
-            sleep(2)
+def change(tab, value, option):
+    text, prompt = CHANGE_TEXTS[option]
 
-    # Раздел описания
     while True:
         os.system("cls")
-        create_task_description_text = (
-            "Описание.\n\n"
-            "Описание задачи дожно быть не менее 10 символов.\n"
-            "Оно должно четко и подробно объяснять суть зада-\n"
-            "чи. А также иметь достаточно информации для кор-\n"
-            "ректного выполнения.\n\n"
-            "[0] Отмена\n"
-        )
-
-        print(create_task_description_text)
-        ui_description = str(input("Описание: "))
-
-        if ui_description == "0":
-            main_menu()
-
-        if tab.data_validation(column="description",
-                               value=str(ui_description),
-                               intention="add"
-                               ):
-            new_task_description = new_task_description + ui_description
-            break
+        task = render_tasks(tab, value=str(value), option="id")
+        print(f"{task}\n\n{text}[0] Отмена\n")
+        user_input_change = input(prompt)
+
+        if user_input_change == "0":
+            return (change_task_sett, value)
+
+        if tab.data_validation(column=option,
+                               value=user_input_change,
+                               intention="change",
+                               _id=value):
+            if tab.change_task(_id=value,
+                               column=option,
+                               value=str(user_input_change)):
+                sleep(2)
+                return (change_task_sett, value)
         else:
             sleep(2)
 
-    # Раздел категории
-    while True:
-        os.system("cls")
-        create_task_category_text = (
-            "Категория.\n\n"
-            "Категория, необходима для четкого распределения \n"
-            "задачи. Категория может включать в себя только \n"
-            "одно из значений:\n\n"
-            "Личное - задачи связанные с повседневной жизнью.\n"
-            "Например: Поход в кино, прогулка, приготовить "
-            "ужин.\n\n"
-            "Обучение - задачи связанные с получения новых знаний\n"
-            "навыков, умений, опыта.\nНапример: Прохождение курса\n"
-            "по веб-разработке, посещение семинара по финансовой \n"
-            "грамотности.\n\n"
-            "Работа - задачи связанные с рабочей деятельностью.\n"
-            "Например: составление еженедельного отчета или де-\n"
-            "ловая встреча.\n\n"
-            "[0] Отмена\n"
-        )
-
-        print(create_task_category_text)
-        ui_category = str(input("Категория: "))
 
-        if ui_category == "0":
-            main_menu()
+def change_task_sett(tab, value):
+    options = ("title", "description", "category",
+               "due_date", "priority", "status")
 
-        if tab.data_validation(column="category",
-                               value=str(ui_category),
-                               intention="add"
-                               ):
-            new_task_category = new_task_category + ui_category
-            break
-        else:
-            sleep(4)
-
-    # Раздел даты
     while True:
         os.system("cls")
-        create_task_due_date_text = (
-            "Сроки задачи.\n\n"
-            "Сроки задачи, необходимы для контроля прогресса выпол-\n"
-            "нения задач, а также планирования и распределения ресу-\n"
-            "рсов. Необходимо указать дату в формате YYYY-MM-DD, да-\n"
-            "та должна быть больше или равна сегодняшнему дню.\n\n"
-            "[0] Отмена\n"
+        task = render_tasks(tab, value=str(value), option="id")
+        print(
+            f"{task}\n\n"
+            "Выберите, редактируемый раздел:\n\n"
+            "[1] Заголовок\n"
+            "[2] Описание\n"
+            "[3] Категория\n"
+            "[4] Сроки задачи\n"
+            "[5] Приоритет\n"
+            "[6] Статус\n"
+            "[0] Назад\n"
         )
 
-        print(create_task_due_date_text)
-        ui_due_date = str(input("Сроки задачи: "))
+        user_input_change_task_sett = read_number()
+        if user_input_change_task_sett == 0:
+            return (change_task,)
+        if user_input_change_task_sett in range(1, len(options) + 1):
+            return (change, value, options[user_input_change_task_sett - 1])
 
-        if ui_due_date == "0":
-            main_menu()
 
-        if tab.data_validation(column="due_date",
-                               value=str(ui_due_date),
-                               intention="add"
-                               ):
-            new_task_due_date = new_task_due_date + ui_due_date
-            break
-        else:
-            sleep(5)
+def change_task(tab):
+    pager = TaskPager(tab)
 
-    # Раздел приоритета
     while True:
         os.system("cls")
-        create_task_priority_text = (
-            "Приоритет.\n\n"
-            "Приоритет задачи необходим для определения её значи-\n"
-            "мости и срочности относительно других задач. Он по-\n"
-            "могает фокусироваться на важных задачах, эффективно \n"
-            "распределять время и ресурсы.\n\n"
-            "Принимается одно из 3-х значений:\n\n"
-            "Низкий - низкий приоритет задачи нужен для обозначе-\n"
-            "ния мелких, бытовых задач.\n"
-            "Напиример: записаться на курсы, оплатить интернет.\n\n"
-            "Средний - средний приоритет задачи нужен для обозна-\n"
-            "чения более серьезных задач.\n"
-            "Например: запись к врачу, застраховать автомобиль.\n\n"
-            "Высокий - высокий приоритет задачи нужен для обозна-\n"
-            "чения задач с наивысшим приоритетом.\n"
-            "Например: составить сводный отчет по продажам за ме-\n"
-            "сяц.\n\n"
-            "[0] Отмена\n"
+        print(
+            f"{pager.render()}\n\n"
+            "Укажите идентификатор (ID) задачи, которую требуется "
+            "отредактировать.\n\n"
+            "[0] Назад\n"
         )
 
-        print(create_task_priority_text)
-        user_input_priority = str(input("Приоритет: "))
+        user_input_change_task = read_number(pager)
+        if user_input_change_task is None:
+            continue
+        if user_input_change_task == 0:
+            return (main_menu,)
 
-        if user_input_priority == "0":
-            main_menu()
+        if tab.getting_task(value=str(user_input_change_task), option="id",
+                            as_records=True):
+            return (change_task_sett, user_input_change_task)
+        sleep(2)
 
-        if tab.data_validation(column="priority",
-                               value=str(user_input_priority),
-                               intention="add"
-                               ):
-            new_task_priority = new_task_priority + user_input_priority
-            break
-        else:
-            sleep(5)
 
-    # Раздел статуса
+def add_new_task(tab, fields):
     while True:
         os.system("cls")
-        create_task_status_text = (
-            "Статус задачи.\n\n"
-            "Статус задачи позволяет понять, завершена ли задача \n"
-            "или требует внимания. Если задача помечена как \"Не \n"
-            "выполнена\" её нужно завершить до установленного срока.\n"
-            "Статус может включать в себя только одно из значений:\n\n"
-            "Выполнена - задача которая завершена, что не имеет смы-\n"
-            "сла при создании задачи.\n\n"
-            "Не выполнена - задача которая находится в работе или ра-\n"
-            "бота над которой планируется.\n\n"
+        print(
+            "Содать новую задачу?\n\n"
+            f"Заголовок: {fields['title']}\n"
+            f"Описание: {fields['description']}\n"
+            f"Категория: {fields['category']}\n"
+            f"Сроки задачи: {fields['due_date']}\n"
+            f"Приоритет: {fields['priority']}\n"
+            f"Статус: {fields['status']}\n\n"
+            "[1] Создать задачу\n"
             "[0] Отмена\n"
         )
 
-        print(create_task_status_text)
-        user_input_status = str(input("Статус [Не выполнена]: "))
+        match read_number():
+            case 1:
+                tab.add_task(**fields)
+                sleep(2)
+                return (main_menu,)
+            case 0:
+                return (main_menu,)
 
-        if user_input_status == "0":
-            main_menu()
 
-        if tab.data_validation(column="status",
-                               value=str(user_input_status),
-                               intention="add"
-                               ):
-            new_task_status = new_task_status + user_input_status
-            break
-        else:
-            sleep(5)
+def create_task(tab):
+    fields = {}
 
-    # Добавление задачи в таблицу
-    add_new_task(
-        new_task_title,
-        new_task_description,
-        new_task_category,
-        new_task_due_date,
-        new_task_priority,
-        new_task_status
-    )
+    for column, text, prompt, pause in CREATE_STEPS:
+        while True:
+            os.system("cls")
+            print(f"{text}[0] Отмена\n")
+            user_input = str(input(prompt))
 
+            if user_input == "0":
+                return (main_menu,)
 
-def get_task(option: str = "", value: str = ""):
-    tab = TaskManager()
+            user_input = user_input or CREATE_DEFAULTS.get(column, "")
+            if tab.data_validation(column=column,
+                                   value=user_input,
+                                   intention="add"):
+                fields[column] = user_input
+                break
+            sleep(pause)
 
-    match option:
-        # Вернет все таблицу
-        case "":
-            return tab.getting_task()
+    # Добавление задачи в таблицу
+    return (add_new_task, fields)
 
-        # Вернет только одну задачу по id
-        case "id":
-            if tab.data_validation(column="id",
-                                   value=value,
-                                   intention="search"):
-                return tab.getting_task(value=str(value), option="id")
 
-        case "category":
-            if tab.data_validation(column="category",
+def find_tasks(tab, option, value):
+    # Постраничный вывод найденных задач или False, если значение
+    # не прошло проверку или задачи не найдены
+    if option not in ("keywords", "due_date"):
+        if not tab.data_validation(column=option,
                                    value=value,
                                    intention="search"):
-                return tab.getting_task(value=str(value), option="category")
+            return False
 
-        # Вернет все задачи по статусу
-        case "status":
-            if tab.data_validation(column="status",
-                                   value=value,
-                                   intention="search"):
-                return tab.getting_task(value=value, option="status")
+    pager = TaskPager(tab, **task_query(option, value))
+    if not pager.fetch():
+        print("По вашему запросу задачи не найдены.")
+        return False
+    return pager
 
-        # Вернет все задачи по приоритету
-        case "priority":
-            if tab.data_validation(column="priority",
-                                   value=value,
-                                   intention="search"):
-                return tab.getting_task(value=value, option="priority")
 
-        # Вернет все задачи по ключевым словам
-        case "keywords":
-            return tab.getting_task(value=value, option="keywords")
+def show_result(pager):
+    # Вывод результата поиска до ввода номера варианта
+    while True:
+        os.system("cls")
+        print(f"{pager.render()}\n\n[0] Назад\n")
+        if read_number(pager) is not None:
+            return
 
-        # Вернет все просроченные задачи
-        case "due_date":
-            return tab.getting_task(option="due_date")
 
+def view_task_by(tab, option):
+    pager = TaskPager(tab)
 
-def view_task_by_id():
     while True:
         os.system("cls")
-        view_task_by_id_text = (
-            f"{get_task()}\n\n"
-            "Введите ID задачи, которую нужно найти.\n\n"
-            "[0] Назад\n"
-        )
+        print(f"{pager.render()}\n\n{VIEW_TEXTS[option]}[0] Назад\n")
 
-        try:
-            print(view_task_by_id_text)
-            ui_view_task_by_id = int(input(">> "))
-        except ValueError:
-            print(
-                "Введите номер варианта в числовом формате. В\n"
-                "данном разделе меню, текст не поддерживается."
-            )
-            sleep(2)
-            view_task_by_id()
+        if option == "id":
+            user_input = read_number(pager)
+            if user_input is None:
+                continue
+        else:
+            user_input = str(input(">> "))
+            if pager.navigate(user_input):
+                continue
 
-        match ui_view_task_by_id:
-            case 0:
-                viewing_tasks()
-            case _:
-                os.system("cls")
-                res = get_task(option="id",
-                               value=ui_view_task_by_id)
-
-                if res is True:
-                    ans = (
-                        f"{res}\n\n"
-                        f"[0] Назад\n"
-                    )
-                else:
-                    ans = (
-                        f"{get_task()}\n\n"
-                    )
-                    sleep(2)
-                    view_task_by_id()
-                while True:
-                    try:
-                        os.system("cls")
-                        print(ans)
-                        int(input(">> "))
-                        break
-                    except ValueError:
-                        print(
-                            "Введите номер варианта в числовом формате. В\n"
-                            "данном разделе меню, текст не поддерживается."
-                        )
-                        sleep(2)
-
-
-def view_task_by_category():
-    while True:
-        os.system("cls")
-        view_task_by_category_text = (
-            f"{get_task()}\n\n"
-            "Введите категорию задач, которые нужно найти.\n\n"
-            "[0] Назад\n"
-        )
+        if str(user_input) == "0":
+            return (viewing_tasks,)
 
-        print(view_task_by_category_text)
-        ui_view_task_by_category = str(input(">> "))
-
-        match ui_view_task_by_category:
-            case "0":
-                viewing_tasks()
-            case _:
-                os.system("cls")
-                res = get_task(option="category",
-                               value=ui_view_task_by_category)
-                if res:
-                    ans = (
-                        f"{res}\n\n"
-                        f"[0] Назад\n"
-                    )
-                else:
-                    ans = (
-                        f"{get_task()}\n\n"
-                    )
-                    sleep(2)
-                    view_task_by_category()
-
-                while True:
-                    try:
-                        os.system("cls")
-                        print(ans)
-                        int(input(">> "))
-                        break
-                    except ValueError:
-                        print(
-                            "Введите номер варианта в числовом формате. В\n"
-                            "данном разделе меню, текст не поддерживается."
-                        )
-                        sleep(2)
-
-
-def view_task_by_status():
-    while True:
         os.system("cls")
-        view_task_by_status_text = (
-            f"{get_task()}\n\n"
-            "Введите статус задач, которые нужно найти.\n\n"
-            "[0] Назад\n"
-        )
+        res = find_tasks(tab, option=option, value=user_input)
+        if res:
+            show_result(res)
+        else:
+            sleep(2)
 
-        print(view_task_by_status_text)
-        ui_view_task_by_status = str(input(">> "))
-
-        match ui_view_task_by_status:
-            case "0":
-                viewing_tasks()
-            case _:
-                os.system("cls")
-                res = get_task(option="status",
-                               value=ui_view_task_by_status)
-                if res:
-                    ans = (
-                        f"{res}\n\n"
-                        f"[0] Назад\n"
-                    )
-                else:
-                    ans = (
-                        f"{get_task()}\n\n"
-                    )
-                    sleep(2)
-                    view_task_by_status()
-
-                while True:
-                    try:
-                        os.system("cls")
-                        print(ans)
-                        int(input(">> "))
-                        break
-                    except ValueError:
-                        print(
-                            "Введите номер варианта в числовом формате. В\n"
-                            "данном разделе меню, текст не поддерживается."
-                        )
-                        sleep(2)
-
-
-def view_task_by_priority():
-    while True:
-        os.system("cls")
-        view_task_by_priority_text = (
-            f"{get_task()}\n\n"
-            "Введите приоритет задач, которые нужно найти.\n\n"
-            "[0] Назад\n"
-        )
 
-        print(view_task_by_priority_text)
-        ui_view_task_by_priority = str(input(">> "))
-
-        match ui_view_task_by_priority:
-            case "0":
-                viewing_tasks()
-            case _:
-                os.system("cls")
-                res = get_task(option="priority",
-                               value=ui_view_task_by_priority)
-                if res:
-                    ans = (
-                        f"{res}\n\n"
-                        f"[0] Назад\n"
-                    )
-                else:
-                    ans = (
-                        f"{get_task()}\n\n"
-                    )
-                    sleep(2)
-                    view_task_by_priority()
-
-                while True:
-                    try:
-                        os.system("cls")
-                        print(ans)
-                        int(input(">> "))
-                        break
-                    except ValueError:
-                        print(
-                            "Введите номер варианта в числовом формате. В\n"
-                            "данном разделе меню, текст не поддерживается."
-                        )
-                        sleep(2)
-
-
-def view_task_by_keywords():
-    while True:
-        os.system("cls")
-        view_task_by_keywords_text = (
-            f"{get_task()}\n\n"
-            "Введите ключевое слово, по которому нужно найти задачи\n\n"
-            "[0] Назад\n"
-        )
+def view_task_by_due_date(tab):
+    pager = TaskPager(tab, **task_query("due_date"))
 
-        print(view_task_by_keywords_text)
-        ui_view_task_by_keywords = str(input(">> "))
-
-        match ui_view_task_by_keywords:
-            case "0":
-                viewing_tasks()
-            case _:
-                os.system("cls")
-                res = get_task(option="keywords",
-                               value=ui_view_task_by_keywords)
-                if res:
-                    ans = (
-                        f"{res}\n\n"
-                        f"[0] Назад\n"
-                    )
-                else:
-                    ans = (
-                        f"{get_task()}\n\n"
-                    )
-                    sleep(2)
-                    view_task_by_keywords()
-
-                while True:
-                    try:
-                        os.system("cls")
-                        print(ans)
-                        int(input(">> "))
-                        break
-                    except ValueError:
-                        print(
-                            "Введите номер варианта в числовом формате. В\n"
-                            "данном разделе меню, текст не поддерживается."
-                        )
-                        sleep(2)
-
-
-def view_task_by_due_date():
     while True:
         os.system("cls")
-        view_task_by_due_date_text = (
-            f"{get_task(option='due_date')}\n\n"
+        print(
+            f"{pager.render()}\n\n"
             "Задачи с истекшим сроком выволнения.\n\n"
             "[0] Назад\n"
         )
-        try:
-            print(view_task_by_due_date_text)
-            ui_view_task_by_due_date = int(input(">> "))
-        except ValueError:
-            print(
-                "Введите номер варианта в числовом формате. В\n"
-                "данном разделе меню, текст не поддерживается."
-            )
-            sleep(2)
-            view_task_by_due_date()
 
-        match ui_view_task_by_due_date:
-            case 0:
-                viewing_tasks()
+        if read_number(pager) == 0:
+            return (viewing_tasks,)
+
 
+def viewing_tasks(tab):
+    options = ("id", "category", "status", "priority", "keywords")
+    pager = TaskPager(tab)
 
-def viewing_tasks():
     while True:
         os.system("cls")
-        viewing_tasks_text = (
-            f"{get_task()}\n\n"
+        print(
+            f"{pager.render()}\n\n"
             "Вы можете найти интересующие вас задачи, воспользов"
             "авшись поиском по:"
             "Идентификатору (ID) — будет найдена одна задача.\n\n"
@@ -996,39 +510,19 @@ def viewing_tasks():
             "[0] Назад\n"
         )
 
-        try:
-            print(viewing_tasks_text)
-            ui_viewing_tasks = int(input(">> "))
-        except ValueError:
-            print(
-                "Введите номер варианта в числовом формате. В\n"
-                "данном разделе меню, текст не поддерживается."
-            )
-            sleep(2)
-            viewing_tasks()
-
+        ui_viewing_tasks = read_number(pager)
         if ui_viewing_tasks == 0:
-            main_menu()
-
-        match ui_viewing_tasks:
-            case 1:
-                view_task_by_id()
-            case 2:
-                view_task_by_category()
-            case 3:
-                view_task_by_status()
-            case 4:
-                view_task_by_priority()
-            case 5:
-                view_task_by_keywords()
-            case 6:
-                view_task_by_due_date()
+            return (main_menu,)
+        if ui_viewing_tasks in range(1, len(options) + 1):
+            return (view_task_by, options[ui_viewing_tasks - 1])
+        if ui_viewing_tasks == 6:
+            return (view_task_by_due_date,)
 
 
-def main_menu():
+def main_menu(tab):
     while True:
         os.system("cls")
-        main_menu_text = (
+        print(
             "TaskManager — это модуль для создания, управления\n"
             "и отслеживания задач. Он предоставляет функциона-\n"
             "льность для работы с задачами в формате JSON, по-\n"
@@ -1041,36 +535,46 @@ def main_menu():
             "[0] Выход\n"
         )
 
-        try:
-            print(main_menu_text)
-            user_input_main_menu = int(input(">> "))
-        except ValueError:
-            print(
-                "Введите номер варианта в числовом формате. В\n"
-                "данном разделе меню, текст не поддерживается."
-            )
-            sleep(2)
-            main_menu()
-
-        match user_input_main_menu:
+        match read_number():
             case 1:
-                viewing_tasks()
+                return (viewing_tasks,)
             case 2:
-                create_task()
+                return (create_task,)
             case 3:
-                change_task()
-                pass
+                return (change_task,)
             case 4:
-                delete_task()
-                pass
+                return (delete_task,)
             case 0:
                 print("Goodbuy!")
-                quit()
+                return None
+
+
+def run_menu(tab, state=(main_menu,)):
+    """
+    Цикл интерактивного меню.
+
+    Текущий экран выполняется, пока не вернет следующее состояние,
+    после чего цикл переходит к нему. Все экраны работают с одним
+    TaskManager, поэтому резидентная копия задач загружается один раз.
+
+    Аргументы:
+        tab (TaskManager): Общий менеджер задач.
+        state (tuple): Начальное состояние (экран, *аргументы).
+    """
+    while state is not None:
+        screen, *args = state
+        state = screen(tab, *args)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
 
+    # С аргументами командной строки выполняется одна команда без меню
+    if argv:
+        return cli.run(argv)
 
-def main():
-    main_menu()
+    run_menu(TaskManager())
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
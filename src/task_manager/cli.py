@@ -0,0 +1,269 @@
+import sys
+import json
+import argparse
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Optional
+
+from task_manager.index import SEARCH_MODES
+from task_manager.query import ORDER_FIELDS
+from task_manager.task_manager import TaskManager
+
+
+# Коды завершения команд
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_USAGE = 2
+
+# Форматы вывода: "json" - документ JSON, "ndjson" - задача на строку
+OUTPUT_FORMATS = ("json", "ndjson")
+
+# Изменяемые поля задачи и соответствующие им параметры командной строки
+TASK_FIELDS = ("title", "description", "category",
+               "due_date", "priority", "status")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Создает разбор аргументов командной строки.
+
+    Возвращает:
+        argparse.ArgumentParser: Разбор с подкомандами list, get, add,
+                                 change, delete, overdue, search и run.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Неинтерактивная работа с задачами TaskManager. "
+                    "Без подкоманды запускается интерактивное меню."
+    )
+    parser.add_argument("--path", default="src/task_manager/data/data.json",
+                        help="путь к файлу данных")
+    parser.add_argument("--journal", action="store_true",
+                        help="файл данных ведется с журналом изменений")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="json",
+                        dest="output", help="формат вывода (json, ndjson)")
+
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    commands.required = True
+
+    list_parser = commands.add_parser("list", help="список задач")
+    list_parser.add_argument("--category")
+    list_parser.add_argument("--priority")
+    list_parser.add_argument("--status")
+    list_parser.add_argument("--due-from", default="",
+                             help="начало диапазона сроков (YYYY-MM-DD)")
+    list_parser.add_argument("--due-to", default="",
+                             help="конец диапазона сроков (YYYY-MM-DD)")
+    list_parser.add_argument("--order-by", choices=ORDER_FIELDS,
+                             default="id")
+    list_parser.add_argument("--desc", action="store_true",
+                             help="сортировка по убыванию")
+    list_parser.add_argument("--limit", type=int)
+    list_parser.add_argument("--offset", type=int, default=0)
+
+    get_parser = commands.add_parser("get", help="задача по ID")
+    get_parser.add_argument("id", type=int)
+
+    add_parser = commands.add_parser("add", help="добавить задачу")
+    add_parser.add_argument("--title", required=True)
+    add_parser.add_argument("--description", required=True)
+    add_parser.add_argument("--category", required=True)
+    add_parser.add_argument("--due-date", required=True,
+                            help="срок выполнения (YYYY-MM-DD)")
+    add_parser.add_argument("--priority", required=True)
+    add_parser.add_argument("--status", default="Не выполнена")
+
+    change_parser = commands.add_parser("change", help="изменить задачу")
+    change_parser.add_argument("id", type=int)
+    for field in TASK_FIELDS:
+        change_parser.add_argument(f"--{field.replace('_', '-')}")
+
+    delete_parser = commands.add_parser("delete", help="удалить задачи")
+    delete_target = delete_parser.add_mutually_exclusive_group(required=True)
+    delete_target.add_argument("ids", type=int, nargs="*", default=[],
+                               metavar="id")
+    delete_target.add_argument("--category")
+
+    commands.add_parser("overdue", help="просроченные задачи")
+
+    search_parser = commands.add_parser("search",
+                                        help="поиск по ключевым словам")
+    search_parser.add_argument("keywords")
+    search_parser.add_argument("--mode", choices=SEARCH_MODES,
+                               default="substring")
+
+    run_parser = commands.add_parser(
+        "run", help="выполнить сценарий операций (YAML, JSON, NDJSON)"
+    )
+    run_parser.add_argument("script", help="путь к файлу сценария")
+
+    return parser
+
+
+def write_tasks(tasks, output: str, single: bool = False):
+    """
+    Выводит задачи в stdout в формате output.
+
+    Аргументы:
+        tasks (Iterable[dict]): Задачи.
+        output (str): Формат вывода из OUTPUT_FORMATS.
+        single (bool): Вывести в формате json одну задачу объектом,
+                       а не массивом.
+    """
+    if output == "ndjson":
+        for task in tasks:
+            sys.stdout.write(json.dumps(task, ensure_ascii=False) + "\n")
+        return
+
+    tasks = list(tasks)
+    document = tasks[0] if single else tasks
+    sys.stdout.write(json.dumps(document, indent=4, ensure_ascii=False) + "\n")
+
+
+def find_by_id(manager: TaskManager, ids: list) -> list:
+    """Задачи с ID из ids (в порядке ID)."""
+    tasks = manager.query_tasks(filters={"id": ids})
+    return [] if tasks is False else list(tasks)
+
+
+def run_script_file(manager: TaskManager, path: str) -> Optional[list]:
+    """
+    Выполняет сценарий операций из файла path (см. load_script).
+
+    Возвращает:
+        Optional[list]: Отчет по операциям или None, если сценарий
+                        не удалось прочитать или файл данных занят.
+    """
+    # Модуль сценариев нужен только команде run и не замедляет запуск
+    # остальных команд.
+    from task_manager.script import load_script, run_script
+
+    try:
+        operations = load_script(path)
+    except (OSError, ValueError) as err:
+        print(f"Не удалось прочитать сценарий \"{path}\": {err}")
+        return None
+
+    try:
+        return run_script(manager, operations)
+    except TimeoutError:
+        print(
+            "Файл с задачами сейчас занят другим процессом. "
+            "Повторите попытку позже."
+        )
+        return None
+
+
+def run_command(manager: TaskManager, args) -> Optional[list]:
+    """
+    Выполняет подкоманду.
+
+    Аргументы:
+        manager (TaskManager): Менеджер задач.
+        args (argparse.Namespace): Разобранные аргументы.
+
+    Возвращает:
+        Optional[list]: Задачи для вывода или None, если команда
+                        не выполнена.
+    """
+    if args.command == "run":
+        return run_script_file(manager, args.script)
+
+    if args.command == "list":
+        filters = {column: getattr(args, column)
+                   for column in ("category", "priority", "status")
+                   if getattr(args, column) is not None}
+        tasks = manager.query_tasks(filters=filters, due_from=args.due_from,
+                                    due_to=args.due_to,
+                                    order_by=args.order_by,
+                                    descending=args.desc, limit=args.limit,
+                                    offset=args.offset)
+
+    elif args.command == "get":
+        tasks = find_by_id(manager, [args.id]) or False
+        if tasks is False:
+            print(f"Задача с ID {args.id} не найдена.")
+
+    elif args.command == "add":
+        report = manager.add_tasks([{field: getattr(args, field)
+                                     for field in TASK_FIELDS}])
+        tasks = (find_by_id(manager, report["added"])
+                 if report and report["added"] else False)
+
+    elif args.command == "change":
+        fields = {field: getattr(args, field) for field in TASK_FIELDS
+                  if getattr(args, field) is not None}
+        if not fields:
+            print("Необходимо указать хотя бы одно изменяемое поле.")
+            return None
+        tasks = (find_by_id(manager, [args.id])
+                 if manager.change_tasks(changes={args.id: fields})
+                 else False)
+
+    elif args.command == "delete":
+        # Удаленные задачи выводятся в том виде, в каком они были найдены
+        if args.category is not None:
+            tasks = manager.query_tasks(
+                filters={"category": args.category}
+            )
+            tasks = False if tasks is False else list(tasks)
+        else:
+            tasks = find_by_id(manager, args.ids)
+        if tasks is not False and not manager.delete_tasks(
+            ids=[task["id"] for task in tasks]
+        ):
+            tasks = False
+
+    elif args.command == "overdue":
+        today = datetime.today().date().strftime("%Y-%m-%d")
+        tasks = manager.query_tasks(due_to=today, order_by="due_date")
+
+    else:
+        tasks = manager.query_tasks(keywords=args.keywords,
+                                    search_mode=args.mode)
+
+    return None if tasks is False else list(tasks)
+
+
+def run(argv: Optional[list] = None) -> int:
+    """
+    Точка входа неинтерактивного режима.
+
+    Результат команды выводится в stdout в формате JSON или NDJSON,
+    а сообщения TaskManager перенаправляются в stderr, чтобы не смешиваться
+    с результатом. Запросы только на чтение выполняются потоковым чтением
+    файла данных без построения индексов, что для одного запуска процесса
+    быстрее полной загрузки.
+
+    Аргументы:
+        argv (Optional[list]): Аргументы командной строки
+                               (по умолчанию sys.argv[1:]).
+
+    Возвращает:
+        int: Код завершения: EXIT_OK - команда выполнена, EXIT_FAILURE -
+             задача не найдена, данные не прошли проверку или не выполнена
+             одна из операций сценария, EXIT_USAGE - некорректные
+             аргументы.
+    """
+    try:
+        args = build_parser().parse_args(argv)
+    except SystemExit as err:
+        return EXIT_OK if err.code == 0 else EXIT_USAGE
+
+    manager = TaskManager(path=args.path, journal=args.journal,
+                          streaming=True)
+
+    with redirect_stdout(sys.stderr):
+        tasks = run_command(manager, args)
+
+    if tasks is None:
+        return EXIT_FAILURE
+
+    write_tasks(tasks, args.output,
+                single=args.command in ("get", "add", "change"))
+
+    # Сценарий выполнен не полностью, если хотя бы одна операция
+    # не выполнена
+    if args.command == "run" and not all(item["ok"] for item in tasks):
+        return EXIT_FAILURE
+    return EXIT_OK
@@ -0,0 +1,351 @@
+import re
+import heapq
+from array import array
+from datetime import date
+from itertools import islice
+from typing import Iterator, Optional
+
+from task_manager.index import SEARCH_FIELDS, WORD_PATTERN, search_terms
+
+
+# Поля, значения которых хранятся кодами словаря (повторяются у многих задач)
+CODED_FIELDS = ("category", "priority", "status")
+
+# Шаблон срока выполнения, который хранится порядковым номером даты
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Порядковый номер для срока, который не является датой YYYY-MM-DD
+# (date.min.toordinal() == 1)
+INVALID_DUE = 0
+
+
+class ColumnarTaskIndex:
+    """
+    Класс ColumnarTaskIndex хранит задачи по столбцам вместо списка
+    словарей, чтобы большие таблицы занимали меньше памяти.
+
+    ID хранятся в массиве целых чисел, сроки выполнения - в массиве
+    порядковых номеров дат (date.toordinal), а category, priority
+    и status - в массивах кодов общего словаря значений, поэтому
+    каждое значение хранится один раз. title и description хранятся
+    списками строк. Словари задач создаются только на границе API
+    (при выдаче результата запроса), поэтому класс реализует те же
+    методы, что и TaskIndex, и взаимозаменяем с ним.
+
+    Срок, который не является датой YYYY-MM-DD (например, записанный
+    до проверки существования даты), хранится как есть в словаре
+    {id: срок} и сравнивается как строка, как в TaskIndex.
+
+    Запросы выполняются перебором столбцов: условия по category,
+    priority, status и сроку выполнения проверяются по кодам и датам
+    без создания словарей задач.
+    """
+
+    def __init__(self, tasks: list):
+        """
+        Инициализация класса ColumnarTaskIndex.
+
+        Аргументы:
+            tasks (Iterable[dict]): Задачи.
+        """
+        self._ids = array("q")
+        self._titles = []
+        self._descriptions = []
+        self._due = array("l")
+        # {id: срок} для сроков с порядковым номером INVALID_DUE
+        self._raw_due = {}
+        self._codes = {column: array("H") for column in CODED_FIELDS}
+
+        # Словари значений: {поле: [значение]} и {поле: {значение: код}}
+        self._values = {column: [] for column in CODED_FIELDS}
+        self._value_codes = {column: {} for column in CODED_FIELDS}
+
+        # {id: номер строки}
+        self._rows = {}
+        # Наибольший ID (None - пересчитать после удаления)
+        self._max_id = 0
+
+        for task in tasks:
+            self._append(task)
+
+    # Преобразование значений
+
+    def _code(self, column: str, value: str) -> int:
+        """Код значения поля, при необходимости добавленного в словарь."""
+        codes = self._value_codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self._values[column])
+            self._values[column].append(value)
+        return code
+
+    @staticmethod
+    def _ordinal(value: str) -> int:
+        """
+        Порядковый номер даты в формате YYYY-MM-DD или INVALID_DUE.
+
+        Другие формы, которые принимает date.fromisoformat (например,
+        20991231), не преобразуются, чтобы срок сохранился без изменений.
+        """
+        if isinstance(value, str) and DATE_PATTERN.fullmatch(value):
+            try:
+                return date.fromisoformat(value).toordinal()
+            except ValueError:
+                pass
+        return INVALID_DUE
+
+    @staticmethod
+    def _bound(value: str, default: int) -> int:
+        """Граница диапазона дат; пустая строка - без ограничения."""
+        return date.fromisoformat(value).toordinal() if value else default
+
+    def _set_due(self, row: int, value: str):
+        """Записывает срок выполнения задачи в строке row."""
+        day = self._ordinal(value)
+        self._due[row] = day
+        if day == INVALID_DUE:
+            self._raw_due[self._ids[row]] = value
+        else:
+            self._raw_due.pop(self._ids[row], None)
+
+    def _due_date(self, row: int) -> str:
+        """Срок выполнения задачи в строке row в исходном виде."""
+        day = self._due[row]
+        if day == INVALID_DUE:
+            return self._raw_due[self._ids[row]]
+        return date.fromordinal(day).isoformat()
+
+    def _due_rows(self, start: str, end: str) -> Iterator[int]:
+        """Строки со сроком выполнения от start до end включительно."""
+        low = self._bound(start, date.min.toordinal())
+        high = self._bound(end, date.max.toordinal())
+
+        for row, day in enumerate(self._due):
+            if day != INVALID_DUE:
+                if low <= day <= high:
+                    yield row
+            else:
+                # Срок не является датой: сравнение строк, как в TaskIndex
+                value = str(self._raw_due[self._ids[row]])
+                if start <= value and (not end or value <= end):
+                    yield row
+
+    def _task(self, row: int) -> dict:
+        """Словарь задачи по номеру строки."""
+        return {
+            "id": self._ids[row],
+            "title": self._titles[row],
+            "description": self._descriptions[row],
+            "category": self._values["category"][
+                self._codes["category"][row]],
+            "due_date": self._due_date(row),
+            "priority": self._values["priority"][
+                self._codes["priority"][row]],
+            "status": self._values["status"][self._codes["status"][row]],
+        }
+
+    # Изменение строк
+
+    def _append(self, task: dict):
+        """Добавляет задачу в конец столбцов."""
+        self._rows[task["id"]] = len(self._ids)
+        self._ids.append(task["id"])
+        if self._max_id is not None and task["id"] > self._max_id:
+            self._max_id = task["id"]
+        self._titles.append(task["title"])
+        self._descriptions.append(task["description"])
+        self._due.append(INVALID_DUE)
+        self._set_due(len(self._ids) - 1, task["due_date"])
+        for column in CODED_FIELDS:
+            self._codes[column].append(self._code(column, task[column]))
+
+    def _update(self, row: int, changes: dict):
+        """Изменяет поля задачи в строке row."""
+        for column, value in changes.items():
+            if column == "title":
+                self._titles[row] = value
+            elif column == "description":
+                self._descriptions[row] = value
+            elif column == "due_date":
+                self._set_due(row, value)
+            elif column in self._codes:
+                self._codes[column][row] = self._code(column, value)
+            else:
+                raise ValueError(f"Недопустимое поле \"{column}\".")
+
+    def _delete(self, ids: set):
+        """Удаляет задачи с ID из ids за один проход по столбцам."""
+        keep = [row for row, _id in enumerate(self._ids) if _id not in ids]
+        if len(keep) == len(self._ids):
+            return
+
+        self._ids = array("q", (self._ids[row] for row in keep))
+        self._titles = [self._titles[row] for row in keep]
+        self._descriptions = [self._descriptions[row] for row in keep]
+        self._due = array("l", (self._due[row] for row in keep))
+        for column in CODED_FIELDS:
+            codes = self._codes[column]
+            self._codes[column] = array("H", (codes[row] for row in keep))
+
+        self._rows = {_id: row for row, _id in enumerate(self._ids)}
+        self._max_id = None
+        for _id in ids:
+            self._raw_due.pop(_id, None)
+
+    # Методы представления задач (см. TaskIndex)
+
+    @property
+    def tasks(self) -> list:
+        """Список задач в порядке хранения."""
+        return [self._task(row) for row in range(len(self._ids))]
+
+    def __len__(self) -> int:
+        """Количество задач."""
+        return len(self._ids)
+
+    def all(self) -> list:
+        """Возвращает все задачи."""
+        return self.tasks
+
+    def get(self, _id: int) -> Optional[dict]:
+        """
+        Возвращает задачу по ID или None, если задачи нет.
+        """
+        row = self._rows.get(_id)
+        return None if row is None else self._task(row)
+
+    def find(self, column: str, value: str) -> list:
+        """
+        Возвращает задачи, у которых значение поля column равно value.
+        """
+        if column in self._codes:
+            code = self._value_codes[column].get(value)
+            if code is None:
+                return []
+            return [self._task(row)
+                    for row, item in enumerate(self._codes[column])
+                    if item == code]
+
+        if column == "id":
+            task = self.get(value)
+            return [task] if task is not None else []
+
+        return [task for task in self.tasks if task[column] == value]
+
+    def overdue(self, today: str) -> list:
+        """
+        Возвращает задачи со сроком выполнения не позже today (YYYY-MM-DD)
+        в порядке срока выполнения.
+        """
+        return self.due_between("", today)
+
+    def due_between(self, start: str, end: str) -> list:
+        """
+        Возвращает задачи со сроком выполнения от start до end
+        включительно (YYYY-MM-DD) в порядке срока выполнения.
+        """
+        if self._raw_due:
+            # Порядок строк сроков совпадает с порядком дат
+            def key(row):
+                return (str(self._due_date(row)), self._ids[row])
+        else:
+            def key(row):
+                return (self._due[row], self._ids[row])
+
+        rows = sorted(self._due_rows(start, end), key=key)
+        return [self._task(row) for row in rows]
+
+    def search(self, keyword: str, mode: str = "substring") -> list:
+        """
+        Возвращает задачи, в полях которых встречается keyword
+        (без учета регистра), в порядке ID (см. TaskIndex.search).
+        """
+        keyword = keyword.lower()
+
+        if mode == "words":
+            words = set(WORD_PATTERN.findall(keyword))
+            if not words:
+                return []
+            tasks = [task for task in self.tasks
+                     if words <= search_terms(task, "words")]
+        else:
+            tasks = [task for task in self.tasks
+                     if any(keyword in str(task[field]).lower()
+                            for field in SEARCH_FIELDS)]
+
+        return sorted(tasks, key=lambda task: task["id"])
+
+    def _candidate_rows(self, query) -> Iterator[int]:
+        """
+        Строки, проходящие условия запроса по кодам и датам.
+        Остальные условия проверяются по словарям задач.
+        """
+        allowed = {}
+        for column, values in query.filters.items():
+            if column in self._codes:
+                allowed[column] = {self._value_codes[column][value]
+                                   for value in values
+                                   if value in self._value_codes[column]}
+
+        for row in self._due_rows(query.due_from, query.due_to):
+            if all(self._codes[column][row] in codes
+                   for column, codes in allowed.items()):
+                yield row
+
+    def run_query(self, query) -> Iterator[dict]:
+        """
+        Выполняет составной запрос (см. Query) за один проход
+        по столбцам.
+
+        Аргументы:
+            query (Query): Запрос.
+
+        Возвращает:
+            Iterator[dict]: Задачи, удовлетворяющие запросу.
+        """
+        stop = None if query.limit is None else query.offset + query.limit
+        tasks = (task for task in map(self._task, self._candidate_rows(query))
+                 if query.matches(task))
+
+        if stop is None:
+            tasks = sorted(tasks, key=query.sort_key,
+                           reverse=query.descending)
+        elif query.descending:
+            tasks = heapq.nlargest(stop, tasks, key=query.sort_key)
+        else:
+            tasks = heapq.nsmallest(stop, tasks, key=query.sort_key)
+
+        return islice(tasks, query.offset, stop)
+
+    def max_id(self) -> int:
+        """Возвращает наибольший ID или 0, если задач нет."""
+        if self._max_id is None:
+            self._max_id = max(self._ids, default=0)
+        return self._max_id
+
+    def apply(self, records: list):
+        """
+        Применяет записи журнала к задачам (см. TaskIndex.apply).
+
+        Аргументы:
+            records (Iterable[dict]): Записи журнала.
+        """
+        for record in records:
+            op = record.get("op")
+
+            if op == "add":
+                task = record["task"]
+                row = self._rows.get(task["id"])
+                if row is None:
+                    self._append(task)
+                else:
+                    self._update(row, {column: task[column]
+                                       for column in task if column != "id"})
+
+            elif op == "change":
+                row = self._rows.get(record["id"])
+                if row is not None:
+                    self._update(row, record["changes"])
+
+            elif op == "delete":
+                self._delete(set(record["ids"]))
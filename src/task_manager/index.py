@@ -0,0 +1,515 @@
+import re
+import heapq
+import threading
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Iterator, Optional
+
+
+# Поля задачи, по которым выполняется поиск по ключевым словам
+SEARCH_FIELDS = ["title", "description", "category",
+                 "due_date", "priority", "status"]
+
+# Поля с небольшим числом допустимых значений, для которых
+# ведутся списки задач по каждому значению
+POSTING_FIELDS = ("category", "status", "priority")
+
+# Порядок приоритетов при сортировке по возрастанию
+PRIORITY_ORDER = ("Низкий", "Средний", "Высокий")
+
+# Режимы поиска по ключевым словам:
+# "substring" - вхождение подстроки (через индекс n-грамм),
+# "words" - совпадение целых слов (через индекс слов).
+SEARCH_MODES = ("substring", "words")
+
+# Длина n-граммы для поиска подстроки
+NGRAM_SIZE = 3
+
+# Шаблон слова для поиска по словам
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def search_terms(task: dict, mode: str) -> set:
+    """
+    Возвращает термы задачи для поискового индекса.
+
+    Аргументы:
+        task (dict): Задача.
+        mode (str): Режим поиска ("substring" или "words").
+
+    Возвращает:
+        set: n-граммы или слова полей задачи в нижнем регистре.
+    """
+    terms = set()
+    for field in SEARCH_FIELDS:
+        text = str(task[field]).lower()
+        if mode == "words":
+            terms.update(WORD_PATTERN.findall(text))
+        else:
+            terms.update(text[i:i + NGRAM_SIZE]
+                         for i in range(len(text) - NGRAM_SIZE + 1))
+    return terms
+
+
+class TaskIndex:
+    """
+    Класс TaskIndex представляет загруженный в память список задач
+    вместе с операциями поиска и изменения.
+
+    Этот же набор методов (all, get, find, overdue, search, max_id,
+    apply) реализуют хранилища, которые выполняют поиск сами
+    (например, SQLiteStorage), поэтому TaskManager работает с ними
+    одинаково.
+
+    Задачи хранятся в словаре {id: задача}, который сохраняет порядок
+    хранения, поэтому поиск, изменение и удаление одной задачи выполняются
+    за O(1). Наибольший ID отслеживается при изменениях.
+
+    Для полей category, status и priority ведутся списки задач по каждому
+    значению поля, поэтому фильтр по ним затрагивает только подходящие
+    задачи. Списки обновляются при каждом изменении.
+
+    Сроки выполнения хранятся в отсортированном списке пар (due_date, id),
+    поэтому просроченные задачи и задачи в диапазоне дат находятся
+    двоичным поиском за O(log n + k).
+
+    Для поиска по ключевым словам строятся инвертированные индексы
+    {терм: множество ID}: по словам и по n-граммам (для поиска
+    подстроки). Индекс строится при первом поиске в данном режиме
+    и затем обновляется при каждом изменении.
+
+    Атрибуты:
+        SELECTIVE_FRACTION (float): Доля задач, до которой в составном
+        запросе выгоднее отобрать задачи по индексу и отсортировать их,
+        чем перебирать все задачи в порядке сортировки.
+    """
+
+    SELECTIVE_FRACTION = 0.125
+
+    def __init__(self, tasks: list):
+        """
+        Инициализация класса TaskIndex.
+
+        Аргументы:
+            tasks (list): Список задач.
+        """
+        self._by_id = {task["id"]: task for task in tasks}
+        self._max_id = max(self._by_id, default=0)
+
+        # {поле: {значение: {id: задача}}}
+        self._postings = {column: {} for column in POSTING_FIELDS}
+        for task in self._by_id.values():
+            self._index_task(task)
+
+        # Отсортированный список пар (due_date, id)
+        self._due = sorted((task["due_date"], task["id"])
+                           for task in self._by_id.values())
+
+        # {режим поиска: {терм: множество ID}}, строится при первом поиске
+        self._terms = {}
+        self._terms_lock = threading.Lock()
+
+        # Номер изменения задач, увеличивается при каждом apply
+        self._version = 0
+
+    def _term_postings(self, mode: str) -> dict:
+        """
+        Возвращает инвертированный индекс режима, строя его при нужде.
+
+        Построение и apply выполняются под одной блокировкой: иначе
+        изменение задач из другого потока во время построения прерывает
+        перебор или не попадает в индекс.
+        """
+        postings = self._terms.get(mode)
+        if postings is not None:
+            return postings
+
+        with self._terms_lock:
+            if mode not in self._terms:
+                postings = {}
+                for task in self._by_id.values():
+                    for term in search_terms(task, mode):
+                        postings.setdefault(term, set()).add(task["id"])
+                self._terms[mode] = postings
+            return self._terms[mode]
+
+    def _reindex_terms(self, old: Optional[dict], new: Optional[dict]):
+        """
+        Обновляет построенные инвертированные индексы при замене
+        задачи old на new (любая из них может быть None).
+        """
+        for mode, postings in self._terms.items():
+            old_terms = search_terms(old, mode) if old else set()
+            new_terms = search_terms(new, mode) if new else set()
+
+            for term in old_terms - new_terms:
+                ids = postings.get(term)
+                if ids is not None:
+                    ids.discard(old["id"])
+                    if not ids:
+                        del postings[term]
+
+            for term in new_terms - old_terms:
+                postings.setdefault(term, set()).add(new["id"])
+
+    def _index_due(self, task: dict):
+        """Добавляет срок выполнения задачи в отсортированный список."""
+        insort(self._due, (task["due_date"], task["id"]))
+
+    def _unindex_due(self, task: dict):
+        """Удаляет срок выполнения задачи из отсортированного списка."""
+        key = (task["due_date"], task["id"])
+        position = bisect_left(self._due, key)
+        if position < len(self._due) and self._due[position] == key:
+            del self._due[position]
+
+    def _due_slice(self, start: int, end: int) -> list:
+        """Возвращает задачи из отсортированного списка сроков."""
+        return [self._by_id[_id] for _, _id in self._due[start:end]]
+
+    def _due_bounds(self, start: str, end: str) -> tuple:
+        """
+        Границы задач со сроком от start до end включительно
+        в отсортированном списке сроков (пустые значения не ограничивают).
+        """
+        # Кортеж (start,) меньше любой пары с датой start,
+        # а (end, inf) больше любой пары с датой end.
+        first = bisect_left(self._due, (start,)) if start else 0
+        last = (bisect_right(self._due, (end, float("inf")))
+                if end else len(self._due))
+        return first, max(first, last)
+
+    def _index_task(self, task: dict, columns=POSTING_FIELDS):
+        """Добавляет задачу в списки по значениям полей."""
+        for column in columns:
+            postings = self._postings[column]
+            postings.setdefault(task.get(column), {})[task["id"]] = task
+
+    def _unindex_task(self, task: dict, columns=POSTING_FIELDS):
+        """Удаляет задачу из списков по значениям полей."""
+        for column in columns:
+            posting = self._postings[column].get(task.get(column))
+            if posting is not None:
+                posting.pop(task["id"], None)
+
+    @property
+    def tasks(self) -> list:
+        """Список задач в порядке хранения."""
+        return list(self._by_id.values())
+
+    def __len__(self) -> int:
+        """Количество задач."""
+        return len(self._by_id)
+
+    def all(self) -> list:
+        """Возвращает все задачи."""
+        return self.tasks
+
+    def get(self, _id: int) -> Optional[dict]:
+        """
+        Возвращает задачу по ID или None, если задачи нет.
+        """
+        return self._by_id.get(_id)
+
+    def find(self, column: str, value: str) -> list:
+        """
+        Возвращает задачи, у которых значение поля column равно value.
+
+        Задачи из списков по значениям возвращаются в порядке ID
+        (как в search): изменение задачи переносит ее в конец списка,
+        и порядок результата зависел бы от истории изменений.
+        """
+        if column in self._postings:
+            posting = self._postings[column].get(value, {})
+            return [posting[_id] for _id in sorted(posting)]
+
+        return [task for task in self._by_id.values()
+                if task[column] == value]
+
+    def overdue(self, today: str) -> list:
+        """
+        Возвращает задачи со сроком выполнения не позже today (YYYY-MM-DD)
+        в порядке срока выполнения.
+        """
+        return self.due_between("", today)
+
+    def due_between(self, start: str, end: str) -> list:
+        """
+        Возвращает задачи со сроком выполнения от start до end
+        включительно (YYYY-MM-DD) в порядке срока выполнения.
+        """
+        return self._due_slice(*self._due_bounds(start, end))
+
+    def search(self, keyword: str, mode: str = "substring") -> list:
+        """
+        Возвращает задачи, в полях которых встречается keyword
+        (без учета регистра), в порядке ID.
+
+        Аргументы:
+            keyword (str): Искомая строка.
+            mode (str): "substring" - keyword входит в одно из полей;
+                        "words" - каждое слово keyword является
+                        словом одного из полей.
+        """
+        keyword = keyword.lower()
+
+        if mode == "words":
+            terms = set(WORD_PATTERN.findall(keyword))
+        else:
+            terms = {keyword[i:i + NGRAM_SIZE]
+                     for i in range(len(keyword) - NGRAM_SIZE + 1)}
+
+        if not terms:
+            if mode == "words":
+                return []
+            # Строка короче n-граммы: проверяются все задачи
+            return [
+                task for task in self._by_id.values()
+                if any(keyword in str(task[field]).lower()
+                       for field in SEARCH_FIELDS)
+            ]
+
+        # Пересечение множеств ID, начиная с самого короткого
+        postings = self._term_postings(mode)
+        sets = sorted((postings.get(term, set()) for term in terms), key=len)
+        ids = set(sets[0])
+        for other in sets[1:]:
+            if not ids:
+                break
+            ids &= other
+
+        tasks = [self._by_id[_id] for _id in sorted(ids)]
+        if mode == "words":
+            return tasks
+
+        # n-граммы дают кандидатов, вхождение проверяется по полям
+        return [
+            task for task in tasks
+            if any(keyword in str(task[field]).lower()
+                   for field in SEARCH_FIELDS)
+        ]
+
+    def _query_candidates(self, query) -> Optional[tuple]:
+        """
+        Выбирает индекс, который отбирает меньше всего задач
+        по условиям запроса.
+
+        Возвращает:
+            tuple: (оценка числа задач, функция, возвращающая задачи)
+                   или None, если ни одно условие не поддерживается
+                   индексом.
+        """
+        best = None
+
+        def consider(size, source):
+            nonlocal best
+            if best is None or size < best[0]:
+                best = (size, source)
+
+        for column, values in query.filters.items():
+            if column == "id":
+                consider(len(values), lambda values=values: [
+                    self._by_id[_id] for _id in values if _id in self._by_id
+                ])
+            elif column in self._postings:
+                postings = self._postings[column]
+                consider(
+                    sum(len(postings.get(value, ())) for value in values),
+                    lambda postings=postings, values=values: [
+                        task for value in values
+                        for task in postings.get(value, {}).values()
+                    ]
+                )
+
+        if query.due_from or query.due_to:
+            first, last = self._due_bounds(query.due_from, query.due_to)
+            consider(last - first, lambda: self._due_slice(first, last))
+
+        # Поиск по ключевым словам выполняется, только если остальные
+        # условия недостаточно избирательны.
+        threshold = len(self._by_id) * self.SELECTIVE_FRACTION
+        if query.keywords and (best is None or best[0] > threshold):
+            found = self.search(query.keywords, mode=query.search_mode)
+            consider(len(found), lambda: found)
+
+        return best
+
+    def _ordered_tasks(self, query) -> Optional[Iterator[dict]]:
+        """
+        Перебирает задачи сразу в порядке сортировки запроса,
+        если для нее есть индекс.
+
+        Возвращает:
+            Iterator[dict]: Задачи в порядке сортировки или None.
+        """
+        order = query.order_by
+        reverse = query.descending
+
+        if order == ("id",):
+            return (self._by_id[_id]
+                    for _id in sorted(self._by_id, reverse=reverse))
+
+        if order == ("due_date", "id"):
+            first, last = self._due_bounds(query.due_from, query.due_to)
+            positions = range(first, last)
+            if reverse:
+                positions = reversed(positions)
+            return (self._by_id[self._due[position][1]]
+                    for position in positions)
+
+        if order == ("priority", "id"):
+            postings = self._postings["priority"]
+            groups = [postings.get(value, {}) for value in PRIORITY_ORDER]
+            # Недопустимые значения приоритета идут после допустимых
+            groups.append({
+                _id: task
+                for value, posting in postings.items()
+                if value not in PRIORITY_ORDER
+                for _id, task in posting.items()
+            })
+            if reverse:
+                groups.reverse()
+            return (group[_id] for group in groups
+                    for _id in sorted(group, reverse=reverse))
+
+        return None
+
+    def run_query(self, query) -> Iterator[dict]:
+        """
+        Выполняет составной запрос (см. Query) лениво.
+
+        Если какое-либо условие отбирает по индексу немного задач,
+        отбираются и сортируются только они (при заданном limit -
+        частичной сортировкой кучей). Иначе, если для порядка сортировки
+        есть индекс (id, due_date или priority), задачи перебираются
+        в этом порядке и проверяются по условиям, пока не наберется
+        страница. В остальных случаях задачи отбираются и сортируются.
+
+        Возвращаются копии задач, поэтому их изменение не затрагивает
+        индекс. Результат следует получить до следующего изменения
+        задач: чтение после изменения вызывает RuntimeError.
+
+        Аргументы:
+            query (Query): Запрос.
+
+        Возвращает:
+            Iterator[dict]: Задачи, удовлетворяющие запросу.
+        """
+        return self._copies(self._run_query(query))
+
+    def _run_query(self, query) -> Iterator[dict]:
+        """Выполняет запрос (см. run_query) над задачами индекса."""
+        best = self._query_candidates(query)
+        stop = None if query.limit is None else query.offset + query.limit
+
+        if (best is None
+                or best[0] > len(self._by_id) * self.SELECTIVE_FRACTION):
+            ordered = self._ordered_tasks(query)
+            if ordered is not None:
+                return islice((task for task in ordered
+                               if query.matches(task)),
+                              query.offset, stop)
+
+        source = best[1]() if best is not None else self._by_id.values()
+        tasks = (task for task in source if query.matches(task))
+
+        if stop is None:
+            tasks = sorted(tasks, key=query.sort_key,
+                           reverse=query.descending)
+        elif query.descending:
+            tasks = heapq.nlargest(stop, tasks, key=query.sort_key)
+        else:
+            tasks = heapq.nsmallest(stop, tasks, key=query.sort_key)
+
+        return islice(tasks, query.offset, stop)
+
+    def _copies(self, tasks: Iterator[dict]) -> Iterator[dict]:
+        """
+        Перебирает копии задач результата запроса.
+
+        Исключения:
+            RuntimeError: Задачи изменены до окончания чтения результата.
+        """
+        version = self._version
+        tasks = iter(tasks)
+        while True:
+            # Проверка до next: после изменения перебор индекса
+            # может пропустить задачи или завершиться KeyError.
+            if self._version != version:
+                raise RuntimeError(
+                    "Задачи изменены во время чтения результата запроса. "
+                    "Получите результат до изменения задач."
+                )
+            try:
+                task = next(tasks)
+            except StopIteration:
+                return
+            yield dict(task)
+
+    def max_id(self) -> int:
+        """Возвращает наибольший ID или 0, если задач нет."""
+        if self._max_id is None:
+            # Задача с наибольшим ID была удалена, ищем следующий
+            self._max_id = max(self._by_id, default=0)
+        return self._max_id
+
+    def apply(self, records: list):
+        """
+        Применяет записи журнала к задачам.
+
+        Повторное применение тех же записей (например, после прерванного
+        сжатия журнала) не меняет результат.
+
+        Аргументы:
+            records (Iterable[dict]): Записи вида
+                {"op": "add", "task": {...}},
+                {"op": "change", "id": 1, "changes": {"title": "..."}},
+                {"op": "delete", "ids": [1, 2]}.
+        """
+        # Под той же блокировкой строится индекс по ключевым словам,
+        # поэтому изменение не попадает в середину построения.
+        with self._terms_lock:
+            self._version += 1
+
+            for record in records:
+                op = record.get("op")
+
+                if op == "add":
+                    task = record["task"]
+                    previous = self._by_id.get(task["id"])
+                    if previous is not None:
+                        self._unindex_task(previous)
+                        self._unindex_due(previous)
+                    self._by_id[task["id"]] = task
+                    self._index_task(task)
+                    self._index_due(task)
+                    self._reindex_terms(previous, task)
+                    if self._max_id is not None and task["id"] > self._max_id:
+                        self._max_id = task["id"]
+
+                elif op == "change":
+                    task = self._by_id.get(record["id"])
+                    if task is not None:
+                        columns = [column for column in record["changes"]
+                                   if column in self._postings]
+                        due_changed = "due_date" in record["changes"]
+                        previous = dict(task) if self._terms else None
+                        self._unindex_task(task, columns)
+                        if due_changed:
+                            self._unindex_due(task)
+                        task.update(record["changes"])
+                        if previous is not None:
+                            self._reindex_terms(previous, task)
+                        self._index_task(task, columns)
+                        if due_changed:
+                            self._index_due(task)
+
+                elif op == "delete":
+                    for _id in record["ids"]:
+                        task = self._by_id.pop(_id, None)
+                        if task is not None:
+                            self._unindex_task(task)
+                            self._unindex_due(task)
+                            self._reindex_terms(task, None)
+                        if _id == self._max_id:
+                            self._max_id = None
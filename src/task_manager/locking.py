@@ -0,0 +1,170 @@
+import os
+import time
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: межпроцессная блокировка недоступна
+    fcntl = None
+
+
+class FileLock:
+    """
+    Класс FileLock - межпроцессная блокировка файла данных.
+
+    Блокировка ставится через fcntl.flock на отдельный lock-файл рядом
+    с файлом данных (data.json.lock), потому что сам data.json при записи
+    заменяется новым файлом. Разделяемая блокировка (shared) допускает
+    одновременное чтение несколькими процессами, исключительная
+    (exclusive) - только одного владельца на весь цикл
+    "чтение - проверка - запись".
+
+    Внутри одного объекта блокировка повторно входима: вложенный захват
+    разделяемой блокировки под исключительной ничего не делает. Потоки
+    одного процесса, работающие с одним объектом, выполняются по очереди.
+    Там, где fcntl недоступен (Windows), блокируются только потоки.
+
+    Атрибуты:
+        POLL_INTERVAL (float): Пауза между попытками захвата в секундах.
+        path (str): Путь к lock-файлу.
+        timeout (Optional[float]): Наибольшее время ожидания в секундах.
+                                   None - ждать без ограничения.
+    """
+
+    POLL_INTERVAL = 0.01
+
+    def __init__(self, path: str, timeout: Optional[float] = 10.0):
+        """
+        Инициализация класса FileLock.
+
+        Аргументы:
+            path (str): Путь к lock-файлу. Файл создается при первом захвате.
+            timeout (Optional[float]): Наибольшее время ожидания в секундах.
+        """
+        self.path = path
+        self.timeout = timeout
+
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._exclusive = False
+
+    def shared(self):
+        """Разделяемая блокировка (для чтения)."""
+        return self._hold(exclusive=False)
+
+    def exclusive(self):
+        """Исключительная блокировка (для чтения с последующей записью)."""
+        return self._hold(exclusive=True)
+
+    @contextmanager
+    def local(self):
+        """
+        Блокировка только потоков этого процесса, без lock-файла (для
+        чтения резидентной копии задач, общей для потоков).
+
+        Исключения:
+            TimeoutError: Блокировку не удалось получить за timeout секунд.
+        """
+        if self.timeout is None:
+            acquired = self._thread_lock.acquire()
+        else:
+            acquired = self._thread_lock.acquire(timeout=self.timeout)
+        if not acquired:
+            raise self._timeout_error()
+
+        try:
+            yield
+        finally:
+            self._thread_lock.release()
+
+    def _deadline(self) -> Optional[float]:
+        """Момент, после которого ожидание прекращается."""
+        if self.timeout is None:
+            return None
+        return time.monotonic() + self.timeout
+
+    def _timeout_error(self) -> TimeoutError:
+        """Ошибка истечения времени ожидания."""
+        return TimeoutError(
+            f"Не удалось заблокировать \"{self.path}\" "
+            f"за {self.timeout} с: файл занят другим процессом."
+        )
+
+    @contextmanager
+    def _hold(self, exclusive: bool):
+        """
+        Захватывает блокировку на время блока with.
+
+        Исключения:
+            TimeoutError: Блокировку не удалось получить за timeout секунд.
+            RuntimeError: Попытка повысить разделяемую блокировку
+                          до исключительной внутри вложенного захвата.
+        """
+        deadline = self._deadline()
+
+        if deadline is None:
+            acquired = self._thread_lock.acquire()
+        else:
+            acquired = self._thread_lock.acquire(
+                timeout=max(deadline - time.monotonic(), 0)
+            )
+        if not acquired:
+            raise self._timeout_error()
+
+        try:
+            # Вложенный захват тем же потоком
+            if self._depth:
+                if exclusive and not self._exclusive:
+                    raise RuntimeError(
+                        "Нельзя повысить разделяемую блокировку "
+                        "до исключительной."
+                    )
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+                return
+
+            if fcntl is None:
+                self._depth = 1
+                self._exclusive = exclusive
+                try:
+                    yield
+                finally:
+                    self._depth = 0
+                return
+
+            descriptor = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+            try:
+                self._flock(descriptor, exclusive, deadline)
+                self._depth = 1
+                self._exclusive = exclusive
+                try:
+                    yield
+                finally:
+                    self._depth = 0
+                    fcntl.flock(descriptor, fcntl.LOCK_UN)
+            finally:
+                os.close(descriptor)
+
+        finally:
+            self._thread_lock.release()
+
+    def _flock(self, descriptor: int, exclusive: bool,
+               deadline: Optional[float]):
+        """
+        Ставит flock на lock-файл, повторяя попытки до deadline.
+        """
+        operation = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+
+        while True:
+            try:
+                fcntl.flock(descriptor, operation | fcntl.LOCK_NB)
+                return
+            except BlockingIOError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise self._timeout_error()
+                time.sleep(self.POLL_INTERVAL)
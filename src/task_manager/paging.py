@@ -0,0 +1,171 @@
+import shutil
+from typing import Optional, Union
+
+
+# Столбцы таблицы задач: (заголовок, поле задачи)
+TABLE_COLUMNS = (
+    ("ID", "id"),
+    ("Title", "title"),
+    ("Description", "description"),
+    ("Category", "category"),
+    ("Due_date", "due_date"),
+    ("Priority", "priority"),
+    ("Status", "status"),
+)
+
+# Столбцы, текст которых переносится, если таблица шире терминала
+FLEXIBLE_COLUMNS = ("Title", "Description")
+
+# Наименьшая ширина переносимого столбца
+MIN_COLUMN_WIDTH = 10
+
+# Количество задач на странице
+PAGE_SIZE = 20
+
+# Ввод для перехода на следующую и предыдущую страницу
+NEXT_PAGE = ">"
+PREVIOUS_PAGE = "<"
+
+
+def column_widths(tasks: list, width: int) -> dict:
+    """
+    Наибольшая ширина столбцов Title и Description, при которой
+    таблица с задачами tasks помещается в width символов.
+
+    Остальные столбцы сохраняют свою ширину, а переносимым столбцам
+    достается оставшееся место: Title - не больше трети, Description -
+    остальное, но не меньше MIN_COLUMN_WIDTH каждому.
+
+    Аргументы:
+        tasks (list): Задачи, выводимые в таблице.
+        width (int): Ширина терминала.
+
+    Возвращает:
+        dict: {заголовок столбца: наибольшая ширина}; пустой, если
+              таблица и так помещается.
+    """
+    natural = {
+        header: max([len(header)] + [len(str(task[field]))
+                                     for task in tasks])
+        for header, field in TABLE_COLUMNS
+    }
+    # Каждый столбец занимает еще 3 символа (отступы и граница)
+    # и 1 символ - правая граница таблицы.
+    borders = 3 * len(TABLE_COLUMNS) + 1
+    if sum(natural.values()) + borders <= width:
+        return {}
+
+    fixed = sum(size for header, size in natural.items()
+                if header not in FLEXIBLE_COLUMNS)
+    available = width - fixed - borders
+
+    title = max(MIN_COLUMN_WIDTH, min(natural["Title"], available // 3))
+    description = max(MIN_COLUMN_WIDTH, available - title)
+    return {"Title": title, "Description": description}
+
+
+class TaskPager:
+    """
+    Класс TaskPager выводит задачи постранично.
+
+    Запрашивается и форматируется только текущая страница: задачи
+    выбираются через query_tasks с limit и offset, поэтому стоимость
+    вывода не зависит от размера таблицы. Ширина столбцов подбирается
+    под ширину терминала (см. column_widths).
+
+    Атрибуты:
+        manager (TaskManager): Менеджер задач.
+        query (dict): Аргументы query_tasks, задающие список задач.
+        page_size (int): Количество задач на странице.
+        width (Optional[int]): Ширина вывода; None - ширина терминала.
+        page (int): Номер текущей страницы (с нуля).
+        has_next (bool): Есть ли задачи после текущей страницы.
+    """
+
+    def __init__(self, manager, page_size: int = PAGE_SIZE,
+                 width: Optional[int] = None, **query):
+        """
+        Инициализация класса TaskPager.
+
+        Аргументы:
+            manager (TaskManager): Менеджер задач.
+            page_size (int): Количество задач на странице.
+            width (Optional[int]): Ширина вывода.
+            **query: Аргументы query_tasks (filters, keywords, due_to,
+                     order_by и т.д.) кроме limit и offset.
+        """
+        self.manager = manager
+        self.query = query
+        self.page_size = page_size
+        self.width = width
+        self.page = 0
+        self.has_next = False
+
+    def fetch(self) -> Union[list, bool]:
+        """
+        Задачи текущей страницы.
+
+        Запрашивается на одну задачу больше размера страницы, чтобы
+        узнать, есть ли следующая страница, не считая все задачи.
+
+        Возвращает:
+            list | bool: Задачи или `False`, если запрос некорректен.
+        """
+        tasks = self.manager.query_tasks(
+            **self.query, limit=self.page_size + 1,
+            offset=self.page * self.page_size
+        )
+        if tasks is False:
+            return False
+
+        tasks = list(tasks)
+        self.has_next = len(tasks) > self.page_size
+        return tasks[:self.page_size]
+
+    def render(self) -> Union[str, bool]:
+        """
+        Отформатированная текущая страница с подсказкой о переходе
+        между страницами.
+
+        Возвращает:
+            str | bool: Текст страницы или `False`, если запрос
+                        некорректен.
+        """
+        tasks = self.fetch()
+        if tasks is False:
+            return False
+
+        width = self.width or shutil.get_terminal_size().columns
+        text = str(self.manager.format_tasks(tasks, width=width))
+
+        navigation = [f"Страница {self.page + 1}."]
+        if self.page:
+            navigation.append(f"[{PREVIOUS_PAGE}] Предыдущая страница")
+        if self.has_next:
+            navigation.append(f"[{NEXT_PAGE}] Следующая страница")
+        return f"{text}\n{' '.join(navigation)}"
+
+    def navigate(self, user_input: str) -> bool:
+        """
+        Переход между страницами по вводу пользователя.
+
+        Аргументы:
+            user_input (str): Ввод пользователя.
+
+        Возвращает:
+            bool: True, если ввод - команда перехода (NEXT_PAGE или
+                  PREVIOUS_PAGE), иначе False.
+        """
+        user_input = user_input.strip()
+
+        if user_input == NEXT_PAGE:
+            if self.has_next:
+                self.page += 1
+            return True
+
+        if user_input == PREVIOUS_PAGE:
+            if self.page:
+                self.page -= 1
+            return True
+
+        return False
@@ -0,0 +1,101 @@
+from typing import Optional
+
+from task_manager.index import PRIORITY_ORDER, SEARCH_FIELDS, WORD_PATTERN
+
+
+# Поля, по которым допускается фильтрация на равенство
+FILTER_FIELDS = ("id", "title", "description", "category",
+                 "due_date", "priority", "status")
+
+# Поля, по которым допускается сортировка
+ORDER_FIELDS = ("id", "due_date", "priority")
+
+
+class Query:
+    """
+    Класс Query описывает составной запрос к задачам: условия отбора,
+    порядок сортировки и страницу результата.
+
+    Атрибуты:
+        filters (dict): Условия на равенство {поле: значение}. Значением
+                        может быть список, тогда подходит любое из значений.
+        keywords (str): Строка для поиска по ключевым словам.
+        search_mode (str): Режим поиска ("substring" или "words").
+        due_from (str): Начало диапазона сроков (YYYY-MM-DD).
+        due_to (str): Конец диапазона сроков (YYYY-MM-DD, включительно).
+        order_by (tuple): Поля сортировки; ID всегда добавляется последним.
+        descending (bool): Сортировка по убыванию.
+        limit (Optional[int]): Наибольшее число задач в результате.
+        offset (int): Число пропускаемых задач.
+    """
+
+    def __init__(self, filters: Optional[dict] = None,
+                 keywords: str = "", search_mode: str = "substring",
+                 due_from: str = "", due_to: str = "",
+                 order_by="id", descending: bool = False,
+                 limit: Optional[int] = None, offset: int = 0):
+        """
+        Инициализация класса Query.
+
+        Аргументы описаны в атрибутах класса. order_by может быть
+        строкой или последовательностью полей.
+        """
+        self.filters = {
+            column: (set(value) if isinstance(value, (list, tuple, set))
+                     else {value})
+            for column, value in (filters or {}).items()
+        }
+        self.keywords = keywords.lower()
+        self.search_mode = search_mode
+        # Слова строки поиска (для режима "words")
+        self.words = set(WORD_PATTERN.findall(self.keywords))
+        self.due_from = due_from
+        self.due_to = due_to
+
+        if isinstance(order_by, str):
+            order_by = (order_by,)
+        order_by = tuple(order_by)
+        if "id" in order_by:
+            order_by = order_by[:order_by.index("id")]
+        self.order_by = order_by + ("id",)
+
+        self.descending = descending
+        self.limit = limit
+        self.offset = offset
+
+    def sort_key(self, task: dict) -> tuple:
+        """Ключ сортировки задачи."""
+        key = []
+        for column in self.order_by:
+            if column == "priority":
+                value = task["priority"]
+                key.append(PRIORITY_ORDER.index(value)
+                           if value in PRIORITY_ORDER
+                           else len(PRIORITY_ORDER))
+            else:
+                key.append(task[column])
+        return tuple(key)
+
+    def matches(self, task: dict) -> bool:
+        """Проверяет, удовлетворяет ли задача всем условиям запроса."""
+        for column, values in self.filters.items():
+            if task[column] not in values:
+                return False
+
+        if self.due_from and task["due_date"] < self.due_from:
+            return False
+
+        if self.due_to and task["due_date"] > self.due_to:
+            return False
+
+        if self.keywords:
+            if self.search_mode == "words":
+                text = " ".join(str(task[field]).lower()
+                                for field in SEARCH_FIELDS)
+                if not self.words <= set(WORD_PATTERN.findall(text)):
+                    return False
+            elif not any(self.keywords in str(task[field]).lower()
+                         for field in SEARCH_FIELDS):
+                return False
+
+        return True
@@ -0,0 +1,173 @@
+import json
+from typing import Iterator
+
+from task_manager.storage import NDJSON_EXTENSIONS
+
+
+# Расширения файлов сценариев в формате YAML
+YAML_EXTENSIONS = (".yaml", ".yml")
+
+# Операции сценария
+OPERATIONS = ("add", "change", "delete")
+
+
+def load_script(path: str) -> list:
+    """
+    Загружает сценарий операций над задачами.
+
+    Формат определяется по расширению файла: .yaml и .yml - YAML
+    (нужен пакет PyYAML), .ndjson и .jsonl - одна операция на строку,
+    остальные - JSON-массив операций. Операция - словарь с ключом "op":
+
+        {"op": "add", "task": {...}} или {"op": "add", "tasks": [...]}
+        {"op": "change", "id": 1, "changes": {"status": "Выполнена"}}
+        {"op": "change", "where": {...}, "patch": {...}}
+        {"op": "delete", "id": 1}, {"op": "delete", "ids": [1, 2]}
+        или {"op": "delete", "where": {...}}
+
+    где where - аргументы query_tasks (filters, keywords, search_mode,
+    due_from, due_to).
+
+    Аргументы:
+        path (str): Путь к файлу сценария.
+
+    Возвращает:
+        list: Операции. Строка NDJSON, которую не удалось разобрать,
+              заменяется словарем {"error": описание}, чтобы попасть
+              в отчет, не прерывая сценарий.
+
+    Исключения:
+        ValueError: Сценарий не является списком операций
+                    или не установлен PyYAML.
+        json.JSONDecodeError: Файл JSON поврежден.
+    """
+    lower = path.lower()
+
+    if lower.endswith(NDJSON_EXTENSIONS):
+        return list(iter_script_lines(path))
+
+    with open(path, "r", encoding="utf-8") as file:
+        if lower.endswith(YAML_EXTENSIONS):
+            # Необязательная зависимость, загружается только для YAML
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError(
+                    "Для сценариев YAML не установлен пакет PyYAML."
+                ) from None
+            operations = yaml.safe_load(file)
+        else:
+            operations = json.load(file)
+
+    if not isinstance(operations, list):
+        raise ValueError("Сценарий должен быть списком операций.")
+    return operations
+
+
+def iter_script_lines(path: str) -> Iterator[dict]:
+    """
+    Читает сценарий NDJSON (одна операция на строку).
+
+    Аргументы:
+        path (str): Путь к файлу сценария.
+
+    Возвращает:
+        Iterator[dict]: Операции в порядке следования в файле.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as err:
+                yield {"error": f"Строка {number} повреждена: {err}."}
+
+
+def run_operation(manager, operation) -> dict:
+    """
+    Выполняет одну операцию сценария.
+
+    Аргументы:
+        manager (TaskManager): Менеджер задач.
+        operation (dict): Операция (см. load_script).
+
+    Возвращает:
+        dict: Результат {"op": операция, "ok": выполнена ли операция}
+              и для add - отчет add_tasks ("added", "failed"),
+              для ошибок формата - "error".
+    """
+    if not isinstance(operation, dict):
+        return {"op": None, "ok": False,
+                "error": "Операция должна быть словарем."}
+    if "error" in operation:
+        return {"op": None, "ok": False, "error": operation["error"]}
+
+    op = operation.get("op")
+    result = {"op": op, "ok": False}
+
+    if op == "add":
+        tasks = (operation["tasks"] if "tasks" in operation
+                 else [operation.get("task")])
+        report = manager.add_tasks(tasks)
+        if report is not False:
+            result.update(report, ok=not report["failed"])
+
+    elif op == "change":
+        keys = set(operation) - {"op"}
+        if keys == {"id", "changes"}:
+            result["ok"] = manager.change_tasks(
+                changes={operation["id"]: operation["changes"]}
+            )
+        elif keys == {"where", "patch"}:
+            result["ok"] = manager.change_tasks(
+                where=operation["where"], patch=operation["patch"]
+            )
+        else:
+            result["error"] = (
+                "Операция change должна содержать ключи \"id\" и "
+                "\"changes\" или \"where\" и \"patch\"."
+            )
+
+    elif op == "delete":
+        if "id" in operation:
+            result["ok"] = manager.delete_tasks(ids=[operation["id"]])
+        else:
+            result["ok"] = manager.delete_tasks(ids=operation.get("ids"),
+                                                where=operation.get("where"))
+
+    else:
+        result["error"] = (
+            "Операция \"op\" должна принимать одно из значений: "
+            f"{', '.join(OPERATIONS)}."
+        )
+
+    return result
+
+
+def run_script(manager, operations: list) -> list:
+    """
+    Выполняет сценарий одним пакетом изменений (см. TaskManager.batch):
+    задачи загружаются один раз, а изменения всех операций сохраняются
+    одной записью после последней операции. Операция, которая
+    не выполнена, не прерывает сценарий.
+
+    Аргументы:
+        manager (TaskManager): Менеджер задач.
+        operations (list): Операции (см. load_script).
+
+    Возвращает:
+        list: Результаты операций {"index": номер операции, ...}
+              (см. run_operation).
+
+    Исключения:
+        TimeoutError: Файл данных занят другим процессом.
+    """
+    report = []
+
+    with manager.batch():
+        for index, operation in enumerate(operations):
+            result = run_operation(manager, operation)
+            report.append({"index": index, **result})
+
+    return report
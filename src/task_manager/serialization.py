@@ -0,0 +1,229 @@
+import json
+from typing import Callable, Iterator
+
+from task_manager.stream import iter_json_array, map_file
+
+try:
+    import orjson
+except ImportError:  # Необязательная зависимость
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Необязательная зависимость
+    msgpack = None
+
+
+# Форматы записи файла данных:
+#   "pretty" - JSON с отступами (indent=4), удобен для чтения человеком;
+#   "compact" - JSON без пробелов между элементами;
+#   "orjson" - компактный JSON, кодируемый пакетом orjson;
+#   "msgpack" - двоичный формат MessagePack (пакет msgpack).
+SERIALIZATIONS = ("pretty", "compact", "orjson", "msgpack")
+
+# Первые байты массива в формате MessagePack (fixarray, array 16, array 32)
+MSGPACK_ARRAY_MARKERS = frozenset(range(0x90, 0xa0)) | {0xdc, 0xdd}
+
+
+def check_serialization(serialization: str):
+    """
+    Проверяет, что формат записи известен и его пакет установлен.
+
+    Аргументы:
+        serialization (str): Формат из SERIALIZATIONS.
+
+    Исключения:
+        ValueError: Неизвестный формат или не установлен нужный пакет.
+    """
+    if serialization not in SERIALIZATIONS:
+        raise ValueError(
+            "Формат записи должен быть одним из значений: "
+            f"{', '.join(SERIALIZATIONS)}."
+        )
+
+    if serialization == "orjson" and orjson is None:
+        raise ValueError("Для формата \"orjson\" не установлен пакет orjson.")
+
+    if serialization == "msgpack" and msgpack is None:
+        raise ValueError(
+            "Для формата \"msgpack\" не установлен пакет msgpack."
+        )
+
+
+def dumper(serialization: str, data) -> tuple:
+    """
+    Функция записи данных в файл в заданном формате.
+
+    Аргументы:
+        serialization (str): Формат из SERIALIZATIONS.
+        data: Записываемые данные (список задач).
+
+    Возвращает:
+        tuple: (binary, dump) - нужно ли открывать файл в двоичном
+               режиме и функция, записывающая данные в открытый файл.
+    """
+    if serialization == "msgpack":
+        return True, lambda file: file.write(
+            msgpack.packb(data, use_bin_type=True)
+        )
+
+    if serialization == "orjson":
+        return True, lambda file: file.write(orjson.dumps(data))
+
+    if serialization == "compact":
+        return False, lambda file: json.dump(data, file,
+                                             separators=(",", ":"),
+                                             ensure_ascii=False)
+
+    return False, lambda file: json.dump(data, file, indent=4,
+                                         ensure_ascii=False)
+
+
+def dumps_line(record: dict, serialization: str = "pretty") -> str:
+    """
+    Кодирует запись в одну строку JSON (для NDJSON и журнала).
+
+    Для "pretty" используется вид по умолчанию модуля json, для
+    остальных форматов - JSON без лишних пробелов. Двоичный формат
+    в построчных файлах не используется.
+
+    Аргументы:
+        record (dict): Запись.
+        serialization (str): Формат из SERIALIZATIONS.
+
+    Возвращает:
+        str: Строка JSON с переводом строки в конце.
+    """
+    if serialization == "pretty":
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+    if orjson is not None and serialization == "orjson":
+        return orjson.dumps(record).decode("utf-8") + "\n"
+
+    return json.dumps(record, separators=(",", ":"),
+                      ensure_ascii=False) + "\n"
+
+
+def load_tasks(path: str, serialization: str = "pretty",
+               use_mmap: bool = False) -> list:
+    """
+    Загружает задачи из файла данных, определяя формат по содержимому.
+
+    Файлы JSON (с отступами или без) читаются любым способом, а файл
+    MessagePack не является корректным текстом UTF-8 и распознается
+    по ошибке декодирования. Поэтому формат записи можно менять,
+    не преобразуя существующий файл.
+
+    Аргументы:
+        path (str): Путь к файлу данных.
+        serialization (str): Формат записи; для "orjson" JSON
+                             разбирается пакетом orjson.
+        use_mmap (bool): Читать файл через отображение в память
+                         (см. load_mapped).
+
+    Возвращает:
+        list: Список задач.
+
+    Исключения:
+        ValueError: Файл в формате MessagePack, а пакет msgpack
+                    не установлен.
+    """
+    if use_mmap:
+        return load_mapped(path)
+
+    try:
+        # Открытие файла data.json в режиме чтения и кодировкой UTF-8.
+        with open(path, "r", encoding="UTF-8") as file:
+            if orjson is not None and serialization == "orjson":
+                return orjson.loads(file.read())
+            return json.load(file)
+
+    except UnicodeDecodeError:
+        return load_msgpack(path)
+
+
+def load_mapped(path: str) -> list:
+    """
+    Загружает задачи из файла данных через его отображение в память.
+
+    Файл не читается в буфер Python: orjson и msgpack разбирают
+    отображение напрямую, поэтому повторная загрузка неизмененного
+    файла обходится чтением страниц из кэша операционной системы.
+    Без orjson JSON разбирается по блокам отображения (см.
+    iter_json_array), а не из копии всего содержимого.
+
+    Аргументы:
+        path (str): Путь к файлу данных.
+
+    Возвращает:
+        list: Список задач.
+    """
+    with open(path, "rb") as file, map_file(file) as mapped:
+        if len(mapped) and mapped[0] in MSGPACK_ARRAY_MARKERS:
+            check_serialization("msgpack")
+            return msgpack.unpackb(mapped, raw=False)
+
+        if orjson is not None:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+    return list(iter_json_array(path, use_mmap=True))
+
+
+def load_msgpack(path: str) -> list:
+    """
+    Загружает задачи из файла в формате MessagePack.
+
+    Аргументы:
+        path (str): Путь к файлу данных.
+
+    Возвращает:
+        list: Список задач.
+    """
+    check_serialization("msgpack")
+
+    with open(path, "rb") as file:
+        return msgpack.unpackb(file.read(), raw=False)
+
+
+def iter_msgpack_array(path: str) -> Iterator[dict]:
+    """
+    Потоково читает массив MessagePack и выдает его элементы по одному.
+
+    Аргументы:
+        path (str): Путь к файлу данных.
+
+    Возвращает:
+        Iterator[dict]: Элементы массива в порядке следования в файле.
+    """
+    check_serialization("msgpack")
+
+    with open(path, "rb") as file:
+        unpacker = msgpack.Unpacker(file, raw=False)
+        for _ in range(unpacker.read_array_header()):
+            yield unpacker.unpack()
+
+
+def stream_reader(path: str,
+                  use_mmap: bool = False) -> Callable[[], Iterator[dict]]:
+    """
+    Функция потокового чтения задач из файла данных с определением
+    формата по первому байту файла.
+
+    Аргументы:
+        path (str): Путь к файлу данных.
+        use_mmap (bool): Читать JSON через отображение файла в память.
+
+    Возвращает:
+        Callable[[], Iterator[dict]]: Функция, возвращающая новый перебор
+                                      задач (см. TaskStream).
+    """
+    def read():
+        with open(path, "rb") as file:
+            head = file.read(1)
+
+        if head and head[0] in MSGPACK_ARRAY_MARKERS:
+            return iter_msgpack_array(path)
+        return iter_json_array(path, use_mmap=use_mmap)
+
+    return read
@@ -0,0 +1,901 @@
+import os
+import json
+import stat
+import uuid
+import logging
+import threading
+from itertools import islice
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from task_manager.columnar import ColumnarTaskIndex
+from task_manager.index import (PRIORITY_ORDER, TaskIndex, WORD_PATTERN,
+                                search_terms)
+from task_manager.serialization import (check_serialization, dumper,
+                                        dumps_line, load_tasks,
+                                        stream_reader)
+from task_manager.stream import TaskStream, iter_ndjson
+
+if TYPE_CHECKING:  # sqlite3 импортируется только для базы SQLite
+    import sqlite3
+
+# Общий логер приложения (настраивается в task_manager.py)
+logger = logging.getLogger("keyword_color_logger")
+
+
+def fsync_directory(path: str):
+    """
+    Сбрасывает на диск запись каталога, чтобы переименование файла
+    в нем пережило сбой питания. На системах, где каталог нельзя
+    открыть (Windows), ничего не делает.
+
+    Аргументы:
+        path (str): Путь к каталогу.
+    """
+    try:
+        descriptor = os.open(path or ".", os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def atomic_write(path: str, dump, sync_directory: bool = True,
+                 binary: bool = False):
+    """
+    Атомарная запись файла.
+
+    Данные записываются во временный файл рядом с path, сбрасываются
+    на диск (fsync) и заменяют path через os.replace. Читатели видят
+    либо старое, либо новое содержимое файла целиком, а сбой во время
+    записи не повреждает файл.
+
+    Аргументы:
+        path (str): Путь к файлу.
+        dump (Callable[[TextIO], None]): Функция, записывающая данные
+                                         в открытый файл.
+        sync_directory (bool): Сбросить на диск и запись каталога
+                               после замены файла.
+        binary (bool): Открыть временный файл в двоичном режиме.
+    """
+    temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+
+    try:
+        if binary:
+            file = open(temp_path, "wb")
+        else:
+            file = open(temp_path, "w", encoding="utf-8")
+
+        with file:
+            dump(file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        # Новый файл получает права доступа заменяемого
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except OSError:
+            mode = None
+        if mode is not None:
+            os.chmod(temp_path, mode)
+
+        os.replace(temp_path, path)
+
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    if sync_directory:
+        fsync_directory(os.path.dirname(path))
+
+
+class JsonStorage:
+    """
+    Класс JsonStorage хранит задачи в JSON-файле (data.json).
+
+    Любое изменение приводит к полной перезаписи файла. Запись
+    атомарная (см. atomic_write): файл никогда не бывает записан
+    наполовину.
+
+    Атрибуты:
+        SYNC_DIRECTORY (bool): Сбрасывать на диск каталог после замены
+        файла, чтобы замена пережила сбой питания.
+        path (str): Путь к файлу данных.
+        serialization (str): Формат записи файла (см. SERIALIZATIONS).
+                             При чтении формат определяется по файлу.
+        use_mmap (bool): Читать файл через отображение в память (mmap).
+        columnar (bool): Хранить загруженные задачи по столбцам
+                         (ColumnarTaskIndex) вместо TaskIndex.
+    """
+
+    SYNC_DIRECTORY = True
+
+    def __init__(self, path: str, serialization: str = "pretty",
+                 use_mmap: bool = False, columnar: bool = False):
+        """
+        Инициализация класса JsonStorage.
+
+        Аргументы:
+            path (str): Путь к файлу данных.
+            serialization (str): Формат записи файла: "pretty", "compact",
+                                 "orjson" или "msgpack".
+            use_mmap (bool): Читать файл через отображение в память.
+            columnar (bool): Хранить загруженные задачи по столбцам.
+
+        Исключения:
+            ValueError: Неизвестный формат или не установлен его пакет.
+        """
+        check_serialization(serialization)
+        self.path = path
+        self.serialization = serialization
+        self.use_mmap = use_mmap
+        self.columnar = columnar
+
+    def view(self, tasks: list):
+        """
+        Представление загруженных задач с операциями поиска и изменения.
+
+        Аргументы:
+            tasks (list): Задачи.
+
+        Возвращает:
+            TaskIndex | ColumnarTaskIndex: Представление задач.
+        """
+        if self.columnar:
+            return ColumnarTaskIndex(tasks)
+        return TaskIndex(tasks)
+
+    def _stat_signature(self, path: str) -> Optional[tuple]:
+        """
+        Подпись файла: путь, inode, размер и время изменения.
+
+        Возвращает None, если файл недоступен для os.stat.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (path, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def signature(self) -> Optional[tuple]:
+        """
+        Подпись хранилища, по которой определяется, изменились ли данные.
+
+        Возвращает:
+            tuple: Подпись или None, если определить ее нельзя
+                   (в этом случае данные перечитываются при каждом вызове).
+        """
+        return self._stat_signature(self.path)
+
+    def load(self) -> list:
+        """
+        Загружает все задачи из файла данных.
+
+        Возвращает:
+            list: Список задач.
+        """
+        return load_tasks(self.path, self.serialization, self.use_mmap)
+
+    def open_view(self) -> TaskIndex:
+        """
+        Загружает задачи в память.
+
+        Возвращает:
+            TaskIndex: Задачи с операциями поиска и изменения.
+        """
+        return self.view(self.load())
+
+    def stream_view(self) -> Optional[TaskStream]:
+        """
+        Представление задач для запросов только на чтение, которое
+        читает файл потоково, не загружая список задач целиком.
+
+        Возвращает:
+            TaskStream: Задачи для поиска без резидентной копии.
+        """
+        return TaskStream(stream_reader(self.path, self.use_mmap))
+
+    def save(self, data: list):
+        """
+        Атомарно перезаписывает файл данных списком задач.
+
+        Аргументы:
+            data (list): Список задач.
+        """
+        binary, dump = dumper(self.serialization, data)
+        atomic_write(self.path, dump,
+                     sync_directory=self.SYNC_DIRECTORY, binary=binary)
+
+    def commit(self, view: TaskIndex, records: list):
+        """
+        Применяет изменение к задачам в памяти и сохраняет его.
+
+        Аргументы:
+            view (TaskIndex): Задачи, загруженные через open_view.
+            records (list): Записи журнала, описывающие изменение.
+        """
+        view.apply(records)
+        self.persist(view, records)
+
+    def persist(self, view: TaskIndex, records: list):
+        """
+        Сохраняет изменения, уже примененные к задачам в памяти
+        (например, накопленные в пакете, см. TaskManager.batch).
+
+        Аргументы:
+            view (TaskIndex): Задачи с примененными изменениями.
+            records (list): Записи журнала, описывающие изменения.
+        """
+        self.save(view.tasks)
+
+    def compact(self, view: TaskIndex):
+        """
+        Сжатие хранилища. Для JSON-файла данные и так хранятся целиком.
+        """
+
+
+class JournalStorage(JsonStorage):
+    """
+    Класс JournalStorage хранит снимок задач в data.json и журнал
+    изменений рядом с ним (data.json.journal).
+
+    Добавление, изменение и удаление дописывают в журнал короткие
+    записи (одна JSON-запись на строку), поэтому стоимость записи
+    пропорциональна изменению, а не размеру списка. При чтении журнал
+    применяется поверх снимка. Сжатие переносит журнал в data.json.
+
+    Атрибуты:
+        COMPACT_MIN_SIZE (int): Размер журнала в байтах, до которого
+        автоматическое сжатие не выполняется. Сверх него журнал сжимается,
+        как только становится больше снимка.
+    """
+
+    COMPACT_MIN_SIZE = 64 * 1024
+
+    @property
+    def journal_path(self) -> str:
+        """Путь к файлу журнала."""
+        return f"{self.path}.journal"
+
+    def signature(self) -> Optional[tuple]:
+        """
+        Подпись снимка вместе с подписью журнала.
+        """
+        snapshot = self._stat_signature(self.path)
+        if snapshot is None:
+            return None
+        return (snapshot, self._stat_signature(self.journal_path))
+
+    def read_journal(self) -> list:
+        """
+        Читает записи журнала.
+
+        Недописанная последняя строка (например, после аварийного
+        завершения) пропускается.
+
+        Возвращает:
+            list: Список записей журнала.
+        """
+        records = []
+
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as file:
+                lines = file.read().splitlines()
+        except FileNotFoundError:
+            return records
+
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                message_warning = (
+                    f"Строка {number} журнала \"{self.journal_path}\" "
+                    "повреждена и была пропущена."
+                )
+                logger.warning(message_warning)
+
+        return records
+
+    def open_view(self) -> TaskIndex:
+        """
+        Загружает снимок и применяет к нему журнал.
+
+        Возвращает:
+            TaskIndex: Задачи с операциями поиска и изменения.
+        """
+        view = self.view(super().load())
+        view.apply(self.read_journal())
+        return view
+
+    def stream_view(self) -> None:
+        """
+        Журнал применяется к снимку целиком, поэтому потоковое чтение
+        недоступно (используется резидентная копия).
+        """
+        return None
+
+    def load(self) -> list:
+        """
+        Загружает снимок и применяет к нему журнал.
+
+        Возвращает:
+            list: Список задач.
+        """
+        return self.open_view().tasks
+
+    def persist(self, view: TaskIndex, records: list):
+        """
+        Дописывает в журнал изменения, уже примененные к задачам в памяти,
+        и при необходимости сжимает его.
+
+        Аргументы:
+            view (TaskIndex): Задачи с примененными изменениями.
+            records (list): Записи журнала, описывающие изменения.
+        """
+        lines = "".join(dumps_line(record, self.serialization)
+                        for record in records)
+
+        with open(self.journal_path, "a", encoding="utf-8") as file:
+            file.write(lines)
+            file.flush()
+            os.fsync(file.fileno())
+            journal_size = file.tell()
+
+        try:
+            snapshot_size = os.stat(self.path).st_size
+        except OSError:
+            snapshot_size = 0
+
+        if journal_size > max(self.COMPACT_MIN_SIZE, snapshot_size):
+            self.compact(view)
+
+    def compact(self, view: TaskIndex):
+        """
+        Переносит журнал в data.json и очищает журнал.
+
+        Если процесс прервется между записью снимка и очисткой журнала,
+        повторное применение журнала к новому снимку ничего не изменит.
+
+        Аргументы:
+            view (TaskIndex): Актуальные задачи.
+        """
+        self.save(view.tasks)
+
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+
+
+class NdjsonStorage(JsonStorage):
+    """
+    Класс NdjsonStorage хранит задачи в файле NDJSON (data.ndjson):
+    одна задача в виде JSON-записи на строку.
+
+    Добавление задач дописывает в конец файла по строке на задачу,
+    без перезаписи файла. Изменение и удаление атомарно перезаписывают
+    файл (см. atomic_write). Запросы только на чтение перебирают файл
+    построчно (см. stream_view). Формат записи serialization задает
+    вид строк JSON; двоичный формат в файле NDJSON не используется.
+    """
+
+    def load(self) -> list:
+        """
+        Загружает все задачи из файла NDJSON.
+
+        Возвращает:
+            list: Список задач.
+        """
+        return list(iter_ndjson(self.path, self.use_mmap))
+
+    def stream_view(self) -> TaskStream:
+        """
+        Представление задач для запросов только на чтение,
+        перебирающее файл построчно.
+        """
+        return TaskStream(lambda: iter_ndjson(self.path, self.use_mmap))
+
+    def save(self, data: list):
+        """
+        Атомарно перезаписывает файл данных списком задач.
+
+        Аргументы:
+            data (list): Список задач.
+        """
+        atomic_write(
+            self.path,
+            lambda file: file.writelines(
+                dumps_line(task, self.serialization) for task in data
+            ),
+            sync_directory=self.SYNC_DIRECTORY
+        )
+
+    def append(self, tasks: list):
+        """
+        Дописывает задачи в конец файла.
+
+        Если последняя строка файла недописана (после аварийного
+        завершения), новые задачи начинаются с новой строки, чтобы
+        не повредить их.
+
+        Аргументы:
+            tasks (list): Новые задачи.
+        """
+        lines = "".join(dumps_line(task, self.serialization)
+                        for task in tasks)
+
+        with open(self.path, "ab") as file:
+            if file.tell():
+                with open(self.path, "rb") as tail:
+                    tail.seek(-1, os.SEEK_END)
+                    if tail.read(1) != b"\n":
+                        lines = "\n" + lines
+
+            file.write(lines.encode("utf-8"))
+            file.flush()
+            os.fsync(file.fileno())
+
+    def commit(self, view: TaskIndex, records: list):
+        """
+        Применяет изменение к задачам в памяти и сохраняет его.
+
+        Добавление новых задач дописывается в конец файла, остальные
+        изменения перезаписывают файл целиком.
+
+        Аргументы:
+            view (TaskIndex): Задачи, загруженные через open_view.
+            records (list): Записи журнала, описывающие изменение.
+        """
+        appended = all(record.get("op") == "add"
+                       and view.get(record["task"]["id"]) is None
+                       for record in records)
+
+        view.apply(records)
+
+        if appended:
+            self.append([record["task"] for record in records])
+        else:
+            self.save(view.tasks)
+
+
+class SQLiteStorage:
+    """
+    Класс SQLiteStorage хранит задачи в базе SQLite.
+
+    Поиск по id, category, status, priority и due_date выполняется
+    по индексам базы, а не перебором всех задач. Класс реализует те же
+    методы поиска и изменения, что и TaskIndex, и сам выступает
+    представлением задач для TaskManager.
+
+    Соединение sqlite3 можно использовать только в создавшем его
+    потоке, поэтому каждый поток открывает свое соединение с базой.
+
+    Атрибуты:
+        FIELDS (tuple): Поля задачи в порядке столбцов таблицы.
+        path (str): Путь к файлу базы.
+    """
+
+    FIELDS = ("id", "title", "description", "category",
+              "due_date", "priority", "status")
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            description TEXT NOT NULL,
+            category TEXT NOT NULL,
+            due_date TEXT NOT NULL,
+            priority TEXT NOT NULL,
+            status TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS tasks_category ON tasks (category);
+        CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status);
+        CREATE INDEX IF NOT EXISTS tasks_priority ON tasks (priority);
+        CREATE INDEX IF NOT EXISTS tasks_due_date ON tasks (due_date);
+    """
+
+    def __init__(self, path: str):
+        """
+        Инициализация класса SQLiteStorage.
+
+        Аргументы:
+            path (str): Путь к файлу базы. Если базы нет, она будет создана.
+        """
+        self.path = path
+        # Соединение и путь к базе для каждого потока
+        self._local = threading.local()
+
+    @property
+    def connection(self) -> "sqlite3.Connection":
+        """
+        Соединение текущего потока с базой (открывается при первом
+        обращении из потока).
+        """
+        local = self._local
+        connection = getattr(local, "connection", None)
+        if connection is None or local.path != self.path:
+            if connection is not None:
+                connection.close()
+
+            # Модуль загружается только при работе с базой, чтобы
+            # не замедлять запуск для файлов JSON и NDJSON.
+            import sqlite3
+
+            connection = sqlite3.connect(self.path)
+            connection.row_factory = sqlite3.Row
+            # Поиск по ключевым словам без учета регистра для кириллицы
+            connection.create_function("py_lower", 1, str.lower,
+                                       deterministic=True)
+            connection.executescript(self.SCHEMA)
+            local.connection = connection
+            local.path = self.path
+
+        return connection
+
+    def close(self):
+        """Закрывает соединение текущего потока с базой."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _select(self, where: str = "", params: tuple = (),
+                order: str = "id") -> list:
+        """
+        Выполняет SELECT по таблице задач.
+
+        Возвращает:
+            list: Список задач в виде словарей, упорядоченный по order.
+        """
+        query = f"SELECT {', '.join(self.FIELDS)} FROM tasks"
+        if where:
+            query += f" WHERE {where}"
+        query += f" ORDER BY {order}"
+
+        return [dict(row) for row in self.connection.execute(query, params)]
+
+    def signature(self) -> None:
+        """
+        База всегда читается напрямую, резидентная копия не нужна.
+        """
+        return None
+
+    def open_view(self) -> "SQLiteStorage":
+        """Представлением задач служит само хранилище."""
+        return self
+
+    def stream_view(self) -> "SQLiteStorage":
+        """Запросы к базе и так читают только подходящие строки."""
+        return self
+
+    def load(self) -> list:
+        """
+        Загружает все задачи из базы.
+
+        Возвращает:
+            list: Список задач.
+        """
+        return self._select()
+
+    def all(self) -> list:
+        """Возвращает все задачи."""
+        return self._select()
+
+    def get(self, _id: int) -> Optional[dict]:
+        """
+        Возвращает задачу по ID или None, если задачи нет.
+        """
+        tasks = self._select("id = ?", (_id,))
+        return tasks[0] if tasks else None
+
+    def find(self, column: str, value: str) -> list:
+        """
+        Возвращает задачи, у которых значение поля column равно value.
+        """
+        if column not in self.FIELDS:
+            raise ValueError(f"Недопустимое поле \"{column}\".")
+        return self._select(f"{column} = ?", (value,))
+
+    def overdue(self, today: str) -> list:
+        """
+        Возвращает задачи со сроком выполнения не позже today (YYYY-MM-DD)
+        в порядке срока выполнения.
+        """
+        return self._select("due_date <= ?", (today,), "due_date, id")
+
+    def due_between(self, start: str, end: str) -> list:
+        """
+        Возвращает задачи со сроком выполнения от start до end
+        включительно (YYYY-MM-DD) в порядке срока выполнения.
+        """
+        return self._select("due_date BETWEEN ? AND ?", (start, end),
+                            "due_date, id")
+
+    def search(self, keyword: str, mode: str = "substring") -> list:
+        """
+        Возвращает задачи, в полях которых встречается keyword
+        (без учета регистра), в порядке ID.
+
+        Аргументы:
+            keyword (str): Искомая строка.
+            mode (str): "substring" или "words" (см. TaskIndex.search).
+        """
+        keyword = keyword.lower()
+
+        if mode != "words":
+            conditions = " OR ".join(
+                f"instr(py_lower({field}), ?) > 0"
+                for field in self.FIELDS[1:]
+            )
+            return self._select(conditions,
+                                (keyword,) * (len(self.FIELDS) - 1))
+
+        # Каждое слово должно встречаться хотя бы в одном поле;
+        # совпадение целых слов проверяется по найденным задачам.
+        words = set(WORD_PATTERN.findall(keyword))
+        if not words:
+            return []
+
+        field_text = " || ' ' || ".join(
+            f"py_lower({field})" for field in self.FIELDS[1:]
+        )
+        conditions = " AND ".join(
+            f"instr({field_text}, ?) > 0" for _ in words
+        )
+        return [
+            task for task in self._select(conditions, tuple(words))
+            if words <= search_terms(task, "words")
+        ]
+
+    def run_query(self, query) -> Iterator[dict]:
+        """
+        Выполняет составной запрос (см. Query) одним SELECT.
+
+        Условия, сортировка и страница передаются в базу, план
+        выполнения по индексам выбирает SQLite. Строки читаются
+        из курсора по мере перебора результата.
+
+        Аргументы:
+            query (Query): Запрос.
+
+        Возвращает:
+            Iterator[dict]: Задачи, удовлетворяющие запросу.
+        """
+        conditions = []
+        params = []
+
+        for column, values in query.filters.items():
+            if column not in self.FIELDS:
+                raise ValueError(f"Недопустимое поле \"{column}\".")
+            conditions.append(
+                f"{column} IN ({', '.join('?' * len(values))})"
+            )
+            params.extend(values)
+
+        if query.due_from:
+            conditions.append("due_date >= ?")
+            params.append(query.due_from)
+
+        if query.due_to:
+            conditions.append("due_date <= ?")
+            params.append(query.due_to)
+
+        if query.keywords:
+            # Для режима "words" здесь отбираются кандидаты,
+            # совпадение целых слов проверяется ниже.
+            terms = (query.words if query.search_mode == "words"
+                     else {query.keywords})
+            for term in terms:
+                conditions.append("(" + " OR ".join(
+                    f"instr(py_lower({field}), ?) > 0"
+                    for field in self.FIELDS[1:]
+                ) + ")")
+                params.extend([term] * (len(self.FIELDS) - 1))
+
+        direction = " DESC" if query.descending else ""
+        priority_rank = " ".join(
+            f"WHEN '{value}' THEN {rank}"
+            for rank, value in enumerate(PRIORITY_ORDER)
+        )
+        order = ", ".join(
+            (f"CASE priority {priority_rank} "
+             f"ELSE {len(PRIORITY_ORDER)} END"
+             if column == "priority" else column) + direction
+            for column in query.order_by
+        )
+
+        sql = f"SELECT {', '.join(self.FIELDS)} FROM tasks"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {order}"
+
+        post_filter = bool(query.keywords) and query.search_mode == "words"
+        if not post_filter and query.limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([query.limit, query.offset])
+
+        tasks = (dict(row)
+                 for row in self.connection.execute(sql, params))
+
+        if post_filter:
+            stop = (None if query.limit is None
+                    else query.offset + query.limit)
+            return islice((task for task in tasks if query.matches(task)),
+                          query.offset, stop)
+
+        if query.limit is None and query.offset:
+            return islice(tasks, query.offset, None)
+
+        return tasks
+
+    def max_id(self) -> int:
+        """Возвращает наибольший ID или 0, если задач нет."""
+        row = self.connection.execute("SELECT MAX(id) FROM tasks").fetchone()
+        return row[0] or 0
+
+    def apply(self, records: list):
+        """
+        Применяет записи журнала к базе в одной транзакции.
+
+        Аргументы:
+            records (Iterable[dict]): Записи того же вида, что и для
+                                      TaskIndex.apply.
+        """
+        insert = (
+            f"INSERT OR REPLACE INTO tasks ({', '.join(self.FIELDS)}) "
+            f"VALUES ({', '.join('?' * len(self.FIELDS))})"
+        )
+
+        with self.connection:
+            for record in records:
+                op = record.get("op")
+
+                if op == "add":
+                    task = record["task"]
+                    self.connection.execute(
+                        insert, tuple(task[field] for field in self.FIELDS)
+                    )
+
+                elif op == "change":
+                    changes = record["changes"]
+                    for column in changes:
+                        if column not in self.FIELDS[1:]:
+                            raise ValueError(
+                                f"Недопустимое поле \"{column}\"."
+                            )
+                    assignments = ", ".join(f"{column} = ?"
+                                            for column in changes)
+                    self.connection.execute(
+                        f"UPDATE tasks SET {assignments} WHERE id = ?",
+                        (*changes.values(), record["id"])
+                    )
+
+                elif op == "delete":
+                    self.connection.executemany(
+                        "DELETE FROM tasks WHERE id = ?",
+                        [(_id,) for _id in record["ids"]]
+                    )
+
+    def commit(self, view: "SQLiteStorage", records: list):
+        """
+        Сохраняет изменение в базе.
+
+        Аргументы:
+            view (SQLiteStorage): Представление задач (само хранилище).
+            records (list): Записи журнала, описывающие изменение.
+        """
+        self.apply(records)
+
+    def persist(self, view: "SQLiteStorage", records: list):
+        """
+        Изменения уже сохранены в базе при их применении (см. apply).
+        """
+
+    def compact(self, view: "SQLiteStorage"):
+        """
+        Сжатие хранилища. База SQLite изменяется на месте.
+        """
+
+
+# Расширения файлов, для которых используется SQLiteStorage
+SQLITE_EXTENSIONS = (".sqlite", ".sqlite3", ".db")
+
+# Расширения файлов, для которых используется NdjsonStorage
+NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+
+
+def open_storage(path: str, journal: bool = False, ndjson: bool = False,
+                 serialization: str = "pretty", use_mmap: bool = False,
+                 columnar: bool = False):
+    """
+    Выбирает хранилище по пути к файлу данных.
+
+    Аргументы:
+        path (str): Путь к файлу данных. Для файлов .sqlite, .sqlite3
+                    и .db используется SQLiteStorage, для .ndjson
+                    и .jsonl - NdjsonStorage.
+        journal (bool): Использовать журнал изменений для JSON-файла.
+        ndjson (bool): Хранить задачи в формате NDJSON независимо
+                       от расширения файла.
+        serialization (str): Формат записи файла (см. JsonStorage).
+                             Для SQLite не используется.
+        use_mmap (bool): Читать файл через отображение в память.
+                         Для SQLite не используется.
+        columnar (bool): Хранить загруженные задачи по столбцам.
+                         Для SQLite не используется.
+
+    Возвращает:
+        JsonStorage | JournalStorage | NdjsonStorage | SQLiteStorage:
+            Хранилище задач.
+    """
+    if path.lower().endswith(SQLITE_EXTENSIONS):
+        return SQLiteStorage(path)
+    if ndjson or path.lower().endswith(NDJSON_EXTENSIONS):
+        return NdjsonStorage(path, serialization, use_mmap, columnar)
+    if journal:
+        return JournalStorage(path, serialization, use_mmap, columnar)
+    return JsonStorage(path, serialization, use_mmap, columnar)
+
+
+def migrate_json_to_sqlite(json_path: str, sqlite_path: str) -> int:
+    """
+    Переносит задачи из data.json (с учетом журнала, если он есть)
+    в базу SQLite. Задачи с уже существующими ID перезаписываются.
+
+    Аргументы:
+        json_path (str): Путь к файлу data.json.
+        sqlite_path (str): Путь к файлу базы SQLite.
+
+    Возвращает:
+        int: Количество перенесенных задач.
+    """
+    tasks = JournalStorage(json_path).load()
+
+    storage = SQLiteStorage(sqlite_path)
+    try:
+        storage.apply([{"op": "add", "task": task} for task in tasks])
+    finally:
+        storage.close()
+
+    return len(tasks)
+
+
+def convert_json_to_ndjson(json_path: str, ndjson_path: str) -> int:
+    """
+    Переносит задачи из data.json (с учетом журнала, если он есть)
+    в файл NDJSON. Файл NDJSON перезаписывается.
+
+    Аргументы:
+        json_path (str): Путь к файлу data.json.
+        ndjson_path (str): Путь к файлу NDJSON.
+
+    Возвращает:
+        int: Количество перенесенных задач.
+    """
+    tasks = JournalStorage(json_path).load()
+    NdjsonStorage(ndjson_path).save(tasks)
+    return len(tasks)
+
+
+def convert_ndjson_to_json(ndjson_path: str, json_path: str) -> int:
+    """
+    Переносит задачи из файла NDJSON в data.json. Файл data.json
+    перезаписывается.
+
+    Аргументы:
+        ndjson_path (str): Путь к файлу NDJSON.
+        json_path (str): Путь к файлу data.json.
+
+    Возвращает:
+        int: Количество перенесенных задач.
+    """
+    tasks = NdjsonStorage(ndjson_path).load()
+    JsonStorage(json_path).save(tasks)
+    return len(tasks)
@@ -0,0 +1,319 @@
+import os
+import json
+import mmap
+import heapq
+import codecs
+import logging
+from contextlib import contextmanager
+from itertools import islice
+from typing import Callable, Iterator, Optional
+
+from task_manager.index import SEARCH_FIELDS, WORD_PATTERN, search_terms
+
+
+# Общий логер приложения (настраивается в task_manager.py)
+logger = logging.getLogger("keyword_color_logger")
+
+# Размер блока, читаемого из файла за один раз (в символах)
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_json_array(path: str, chunk_size: int = CHUNK_SIZE,
+                    use_mmap: bool = False) -> Iterator:
+    """
+    Потоково читает JSON-массив из файла и выдает его элементы по одному.
+
+    Файл читается блоками по chunk_size символов, в памяти одновременно
+    находятся только текущий блок и разбираемый элемент, поэтому память
+    не зависит от размера файла. Элементами массива должны быть объекты
+    или массивы (задачи), иначе элемент на границе блоков может быть
+    разобран не полностью.
+
+    Аргументы:
+        path (str): Путь к файлу с JSON-массивом.
+        chunk_size (int): Размер читаемого блока.
+        use_mmap (bool): Читать блоки из отображения файла в память
+                         (mmap) вместо буферизованного чтения.
+
+    Возвращает:
+        Iterator: Элементы массива в порядке следования в файле.
+
+    Исключения:
+        json.JSONDecodeError: Файл не является JSON-массивом.
+    """
+    if use_mmap:
+        with open(path, "rb") as file, map_file(file) as mapped:
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            chunks = (
+                decoder.decode(mapped[offset:offset + chunk_size],
+                               final=offset + chunk_size >= len(mapped))
+                for offset in range(0, len(mapped), chunk_size)
+            )
+            yield from parse_json_array(chunks)
+        return
+
+    with open(path, "r", encoding="utf-8") as file:
+        yield from parse_json_array(iter(lambda: file.read(chunk_size), ""))
+
+
+def parse_json_array(chunks: Iterator[str]) -> Iterator:
+    """
+    Разбирает JSON-массив, поступающий частями, и выдает его элементы
+    по одному (см. iter_json_array).
+
+    Аргументы:
+        chunks (Iterator[str]): Последовательные части текста массива.
+
+    Возвращает:
+        Iterator: Элементы массива.
+
+    Исключения:
+        json.JSONDecodeError: Текст не является JSON-массивом.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def fill():
+        """Добавляет следующую часть; False, если частей больше нет."""
+        nonlocal buffer, position, eof
+        # Пустая часть возможна на границе многобайтового символа
+        for chunk in chunks:
+            if chunk:
+                buffer = buffer[position:] + chunk
+                position = 0
+                return True
+        eof = True
+        return False
+
+    def skip_whitespace():
+        """Пропускает пробелы; возвращает следующий символ или ""."""
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not fill():
+                return ""
+
+    if skip_whitespace() != "[":
+        raise json.JSONDecodeError("Ожидается JSON-массив", buffer, position)
+    position += 1
+
+    if skip_whitespace() == "]":
+        return
+
+    while True:
+        skip_whitespace()
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            # Элемент не поместился в прочитанные части
+            if eof or not fill():
+                raise
+            continue
+
+        position = end
+        yield item
+
+        separator = skip_whitespace()
+        position += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise json.JSONDecodeError("Ожидается \",\" или \"]\"",
+                                       buffer, position - 1)
+
+
+@contextmanager
+def map_file(file) -> Iterator:
+    """
+    Отображает открытый файл в память только для чтения.
+
+    Страницы файла читаются операционной системой по мере обращения
+    и остаются в ее кэше, поэтому повторный перебор неизмененного файла
+    не копирует его в буферы Python. Для пустого файла возвращается
+    пустая строка байтов (отобразить пустой файл нельзя).
+
+    Аргументы:
+        file (BinaryIO): Файл, открытый в двоичном режиме.
+
+    Возвращает:
+        mmap.mmap | bytes: Содержимое файла.
+    """
+    if os.fstat(file.fileno()).st_size == 0:
+        yield b""
+        return
+
+    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield mapped
+    finally:
+        mapped.close()
+
+
+def iter_ndjson(path: str, use_mmap: bool = False) -> Iterator[dict]:
+    """
+    Потоково читает файл NDJSON (одна JSON-запись на строку).
+
+    Пустые строки пропускаются. Поврежденная строка (например,
+    недописанная последняя строка после аварийного завершения)
+    пропускается с предупреждением в логе.
+
+    Аргументы:
+        path (str): Путь к файлу NDJSON.
+        use_mmap (bool): Искать строки в отображении файла в память
+                         (mmap); в буферы Python копируется только
+                         разбираемая строка.
+
+    Возвращает:
+        Iterator[dict]: Записи в порядке следования в файле.
+    """
+    with open(path, "rb" if use_mmap else "r",
+              encoding=None if use_mmap else "utf-8") as file:
+        lines = mapped_lines(file) if use_mmap else file
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                message_warning = (
+                    f"Строка {number} файла \"{path}\" "
+                    "повреждена и была пропущена."
+                )
+                logger.warning(message_warning)
+
+
+def mapped_lines(file) -> Iterator[bytes]:
+    """
+    Перебирает строки файла через его отображение в память.
+
+    Аргументы:
+        file (BinaryIO): Файл, открытый в двоичном режиме.
+
+    Возвращает:
+        Iterator[bytes]: Строки файла без символа перевода строки.
+    """
+    with map_file(file) as mapped:
+        position = 0
+        size = len(mapped)
+        while position < size:
+            end = mapped.find(b"\n", position)
+            if end == -1:
+                end = size
+            yield mapped[position:end]
+            position = end + 1
+
+
+class TaskStream:
+    """
+    Класс TaskStream - представление задач для запросов только на чтение,
+    которое не загружает список задач целиком.
+
+    Каждый запрос заново перебирает задачи из источника (например,
+    iter_json_array) и сохраняет в памяти только подходящие, поэтому
+    пиковая память отбора не зависит от размера файла. Реализует те же
+    методы чтения, что и TaskIndex, и возвращает задачи в том же порядке.
+
+    Атрибуты:
+        source (Callable[[], Iterator[dict]]): Функция, возвращающая
+                                               новый перебор задач.
+    """
+
+    def __init__(self, source: Callable[[], Iterator[dict]]):
+        """
+        Инициализация класса TaskStream.
+
+        Аргументы:
+            source (Callable[[], Iterator[dict]]): Источник задач.
+        """
+        self.source = source
+
+    def __iter__(self) -> Iterator[dict]:
+        """Перебор задач в порядке хранения."""
+        return self.source()
+
+    def all(self) -> list:
+        """Возвращает все задачи."""
+        return list(self)
+
+    def get(self, _id: int) -> Optional[dict]:
+        """
+        Возвращает задачу по ID или None, если задачи нет.
+        """
+        for task in self:
+            if task["id"] == _id:
+                return task
+        return None
+
+    def find(self, column: str, value: str) -> list:
+        """
+        Возвращает задачи, у которых значение поля column равно value.
+        """
+        return [task for task in self if task[column] == value]
+
+    def overdue(self, today: str) -> list:
+        """
+        Возвращает задачи со сроком выполнения не позже today (YYYY-MM-DD)
+        в порядке срока выполнения.
+        """
+        return self.due_between("", today)
+
+    def due_between(self, start: str, end: str) -> list:
+        """
+        Возвращает задачи со сроком выполнения от start до end
+        включительно (YYYY-MM-DD) в порядке срока выполнения.
+        """
+        return sorted(
+            (task for task in self if start <= task["due_date"] <= end),
+            key=lambda task: (task["due_date"], task["id"])
+        )
+
+    def search(self, keyword: str, mode: str = "substring") -> list:
+        """
+        Возвращает задачи, в полях которых встречается keyword
+        (без учета регистра), в порядке ID (см. TaskIndex.search).
+        """
+        keyword = keyword.lower()
+
+        if mode == "words":
+            words = set(WORD_PATTERN.findall(keyword))
+            if not words:
+                return []
+            tasks = (task for task in self
+                     if words <= search_terms(task, "words"))
+        else:
+            tasks = (task for task in self
+                     if any(keyword in str(task[field]).lower()
+                            for field in SEARCH_FIELDS))
+
+        return sorted(tasks, key=lambda task: task["id"])
+
+    def run_query(self, query) -> Iterator[dict]:
+        """
+        Выполняет составной запрос (см. Query) за один проход по задачам.
+
+        Сохраняются только подходящие задачи, а при заданном limit -
+        не более offset + limit из них (частичная сортировка кучей).
+
+        Аргументы:
+            query (Query): Запрос.
+
+        Возвращает:
+            Iterator[dict]: Задачи, удовлетворяющие запросу.
+        """
+        stop = None if query.limit is None else query.offset + query.limit
+        tasks = (task for task in self if query.matches(task))
+
+        if stop is None:
+            tasks = sorted(tasks, key=query.sort_key,
+                           reverse=query.descending)
+        elif query.descending:
+            tasks = heapq.nlargest(stop, tasks, key=query.sort_key)
+        else:
+            tasks = heapq.nsmallest(stop, tasks, key=query.sort_key)
+
+        return islice(tasks, query.offset, stop)
@@ -1,11 +1,20 @@
 import re
 import json
 import logging
-from typing import Optional
-from datetime import datetime
+from typing import Iterator, Optional
+from datetime import datetime, timedelta
 import traceback
+from contextlib import contextmanager
 
-from prettytable import PrettyTable
+from task_manager.index import SEARCH_MODES, TaskIndex
+from task_manager.locking import FileLock
+from task_manager.paging import TABLE_COLUMNS, column_widths
+from task_manager.query import FILTER_FIELDS, ORDER_FIELDS, Query
+from task_manager.storage import open_storage
+
+# Аргументы query_tasks, которые отбирают задачи (остальные задают
+# только порядок и страницу результата)
+SELECTION_KEYS = ("filters", "keywords", "due_from", "due_to")
 
 
 class KeywordColorFormatter(logging.Formatter):
@@ -47,26 +56,19 @@ logger.addHandler(handler)
 logger.setLevel(logging.DEBUG)
 logger.disabled = True
 
-# Создание таблицы для удобного отображения данных
-table = PrettyTable()
-
-# Именования заголовков таблицы
-table.field_names = [
-    "ID",
-    "Title",
-    "Description",
-    "Category",
-    "Due_date",
-    "Priority",
-    "Status",
-]
-
 
 class Task:
     """
     Класс Task представляет модель данных для задачи.
+
+    Поля объявлены в __slots__: у объектов нет словаря атрибутов,
+    поэтому они занимают меньше памяти. В хранилище задача передается
+    словарем (см. to_dict).
     """
 
+    __slots__ = ("id", "title", "description", "category",
+                 "due_date", "priority", "status")
+
     def __init__(self, id: Optional[int] = None,
                  title: str = "", description: str = "",
                  category: str = "", due_date: str = "",
@@ -83,7 +85,7 @@ class Task:
             priority (str): Приоритет задачи.
             status (str): Статус задачи.
         """
-        self.id = None
+        self.id = id
         self.title = title
         self.description = description
         self.category = category
@@ -91,6 +93,15 @@ class Task:
         self.priority = priority
         self.status = status
 
+    def to_dict(self) -> dict:
+        """Задача в виде словаря для хранилища."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, task: dict) -> "Task":
+        """Задача из словаря хранилища."""
+        return cls(**task)
+
 
 class TaskManager():
     """Описание класса TaskManager"""
@@ -98,35 +109,336 @@ class TaskManager():
     # Вывод в формате "pretty print json" вместо таблицы.
     pretty_printed_JSON = False
 
-    def __init__(self, path: str = "src/task_manager/data/data.json"):
-        """Инициализация класса"""
-        self.path = path
+    def __init__(self, path: str = "src/task_manager/data/data.json",
+                 journal: bool = False,
+                 lock_timeout: Optional[float] = 10.0,
+                 streaming: bool = False,
+                 ndjson: bool = False,
+                 serialization: str = "pretty",
+                 use_mmap: bool = False,
+                 columnar: bool = False):
+        """
+        Инициализация класса
 
-    def format_tasks_table(self, tasks: list):
+        Аргументы:
+            path (str): Путь к файлу данных. Для файлов .sqlite, .sqlite3
+                        и .db задачи хранятся в базе SQLite.
+            journal (bool): Хранить изменения в журнале рядом с data.json
+                            вместо полной перезаписи файла.
+            lock_timeout (Optional[float]): Наибольшее время ожидания
+                            блокировки файла данных в секундах
+                            (None - ждать без ограничения).
+            streaming (bool): Выполнять запросы только на чтение
+                            (getting_task, query_tasks) потоковым чтением
+                            файла вместо загрузки всех задач в память.
+            ndjson (bool): Хранить задачи в формате NDJSON (одна задача
+                            на строку). Для файлов .ndjson и .jsonl
+                            формат выбирается автоматически.
+            serialization (str): Формат записи файла данных:
+                            "pretty" (JSON с отступами), "compact"
+                            (JSON без пробелов), "orjson" или "msgpack"
+                            (если установлены соответствующие пакеты).
+                            При чтении формат определяется по файлу.
+            use_mmap (bool): Читать файл данных через отображение
+                            в память (mmap) без копирования в буферы
+                            Python. Вместе с проверкой подписи файла
+                            повторные запросы к неизмененному файлу
+                            почти ничего не стоят.
+            columnar (bool): Хранить резидентную копию задач по столбцам
+                            (см. ColumnarTaskIndex): меньше памяти
+                            на больших таблицах ценой перебора при поиске.
         """
-        Форматирование задач в таблицу
+        self.journal = journal
+        self.lock_timeout = lock_timeout
+        self.streaming = streaming
+        self.ndjson = ndjson
+        self.serialization = serialization
+        self.use_mmap = use_mmap
+        self.columnar = columnar
+        self.storage = open_storage(path, journal=journal, ndjson=ndjson,
+                                    serialization=serialization,
+                                    use_mmap=use_mmap, columnar=columnar)
+
+        # Межпроцессная блокировка: разделяемая на чтение, исключительная
+        # на цикл "чтение - проверка - запись".
+        self.lock = FileLock(f"{path}.lock", timeout=lock_timeout)
+
+        # Резидентная копия задач и подпись хранилища,
+        # с которой она загружена.
+        self._data = None
+        self._signature = None
+
+        # Записи изменений пакета, еще не сохраненные в хранилище
+        # (None - пакет не открыт, см. batch).
+        self._pending = None
+
+    @property
+    def path(self):
+        """Путь к файлу данных."""
+        return self.storage.path
+
+    @path.setter
+    def path(self, path: str):
+        self.storage = open_storage(path, journal=self.journal,
+                                    ndjson=self.ndjson,
+                                    serialization=self.serialization,
+                                    use_mmap=self.use_mmap,
+                                    columnar=self.columnar)
+        self.lock = FileLock(f"{path}.lock", timeout=self.lock_timeout)
+        self._data = None
+        self._signature = None
+
+    def _load_data(self):
+        """
+        Возвращает задачи из резидентной копии.
+
+        Хранилище читается повторно только если изменилась его подпись
+        (inode, размер или время изменения файлов). Чтение выполняется
+        под разделяемой блокировкой, чтобы не застать запись другого
+        процесса (например, сжатие журнала) посередине.
+
+        Возвращает:
+            TaskIndex: Задачи с операциями поиска и изменения
+                       (для SQLite - само хранилище).
+        """
+        # В пакете резидентная копия содержит еще не сохраненные изменения
+        if self._pending is not None and self._data is not None:
+            return self._data
+
+        signature = self.storage.signature()
+        if (self._data is None or signature is None
+                or signature != self._signature):
+            with self.lock.shared():
+                # Подпись берется под блокировкой, чтобы она
+                # соответствовала прочитанным данным.
+                signature = self.storage.signature()
+                self._data = self.storage.open_view()
+                self._signature = signature
+
+        return self._data
+
+    def _read_view(self):
         """
+        Возвращает задачи для запроса только на чтение.
+
+        При streaming файл данных читается потоково при каждом запросе
+        и в памяти остаются только подходящие задачи. Если хранилище
+        не поддерживает потоковое чтение (журнал) или открыт пакет
+        изменений (см. batch), используется резидентная копия.
+
+        Возвращает:
+            TaskIndex | TaskStream | SQLiteStorage: Задачи с операциями
+                                                    поиска.
+        """
+        if self.streaming and self._pending is None:
+            view = self.storage.stream_view()
+            if view is not None:
+                return view
+
+        return self._load_data()
+
+    def _commit(self, data, records: list):
+        """
+        Применяет изменение к резидентной копии и сохраняет его
+        в хранилище.
+
+        Если запись не удалась, резидентная копия сбрасывается, чтобы
+        следующий вызов перечитал хранилище. В открытом пакете изменение
+        только применяется к резидентной копии, а сохраняется при
+        завершении пакета (см. batch).
+
+        Аргументы:
+            data (TaskIndex): Задачи, полученные через _load_data.
+            records (list): Записи журнала, описывающие изменение.
+        """
+        if self._pending is not None:
+            data.apply(records)
+            self._pending.extend(records)
+            self._data = data
+            return
+
+        try:
+            self.storage.commit(data, records)
+        except Exception:
+            self._data = None
+            self._signature = None
+            raise
+
+        self._data = data
+        self._signature = self.storage.signature()
 
-        # Очистка всех строк из table.
-        table.clear_rows()
-
-        # Добавление задач в table через цикл.
-        for task in tasks:
-            table.add_row(
-                [
-                    task['id'],
-                    task['title'],
-                    task['description'],
-                    task['category'],
-                    task['due_date'],
-                    task['priority'],
-                    task['status']
-                ]
+    @contextmanager
+    def batch(self):
+        """
+        Пакет изменений: задачи загружаются один раз, а изменения всех
+        вызовов add_task, change_task, delete_task и их пакетных вариантов
+        внутри блока with сохраняются в хранилище одной записью
+        при выходе из блока.
+
+        На все время пакета удерживается исключительная блокировка файла
+        данных. Запросы внутри пакета видят еще не сохраненные изменения.
+        Если блок завершился исключением, изменения пакета не сохраняются.
+        Для SQLite изменения записываются в базу сразу.
+
+        Исключения:
+            TimeoutError: Блокировку не удалось получить за lock_timeout
+                          секунд.
+        """
+        with self.lock.exclusive():
+            # Вложенный пакет входит в уже открытый
+            if self._pending is not None:
+                yield
+                return
+
+            self._load_data()
+            self._pending = []
+            try:
+                yield
+                if self._pending:
+                    self.storage.persist(self._data, self._pending)
+                    self._signature = self.storage.signature()
+            except BaseException:
+                self._data = None
+                self._signature = None
+                raise
+            finally:
+                self._pending = None
+
+    def _report_lock_timeout(self, err: TimeoutError):
+        """
+        Сообщение о том, что файл данных занят другим процессом дольше
+        lock_timeout секунд.
+        """
+        message_error = f"Файл данных недоступен: {err}"
+        user_message_error = (
+            "Файл с задачами сейчас занят другим процессом. "
+            "Повторите попытку позже."
+        )
+        logger.error(message_error)
+        print(user_message_error)
+
+    def _check_selection(self, where: dict, all_tasks: bool,
+                         action: str) -> bool:
+        """
+        Проверяет, что условия where отбирают задачи.
+
+        Условия без отбора (пустой where или только order_by, limit
+        и т.д.) совпадают со всеми задачами и допускаются только
+        с all_tasks=True.
+
+        Аргументы:
+            where (dict): Аргументы query_tasks.
+            all_tasks (bool): Разрешено ли действие над всеми задачами.
+            action (str): Название действия для сообщения об ошибке.
+
+        Возвращает:
+            bool: True, если условия допустимы, иначе False.
+        """
+        if all_tasks or any(where.get(key) for key in SELECTION_KEYS):
+            return True
+
+        message_error = (
+            "Аргумент where не содержит условий отбора. Для "
+            f"{action} всех задач укажите all_tasks=True."
+        )
+        logger.error(message_error)
+        print(message_error)
+        return False
+
+    def compact(self):
+        """
+        Переносит журнал изменений в data.json.
+
+        Возвращает:
+            bool: True, если сжатие выполнено, иначе False.
+        """
+
+        try:
+            with self.lock.exclusive():
+                data = self._load_data()
+                self.storage.compact(data)
+                self._signature = self.storage.signature()
+
+        except TimeoutError as err:
+            self._report_lock_timeout(err)
+            return False
+
+        except Exception as err:
+            tb = traceback.format_exc()
+            message_critical = (
+                f"Произошла ошибка в функции \"compact\":{tb} {err}"
+            )
+            user_message_critical = (
+                "Произошли непредвиденные неполадки в программе."
             )
+            logger.critical(message_critical)
+            print(user_message_critical)
+            return False
+
+        return True
+
+    def format_tasks_table(self, tasks: list,
+                           width: Optional[int] = None):
+        """
+        Форматирование задач в таблицу
+
+        Таблица создается заново при каждом вызове и принадлежит
+        вызывающему: общего изменяемого состояния нет, поэтому метод
+        можно вызывать из нескольких потоков одновременно, а возвращенная
+        таблица не меняется при следующих запросах.
+
+        Аргументы:
+            tasks (list): Задачи.
+            width (Optional[int]): Ширина вывода. Если таблица шире,
+                                   текст столбцов Title и Description
+                                   переносится (см. column_widths).
+
+        Возвращает:
+            PrettyTable: Таблица с задачами.
+        """
+
+        # Таблицы нужны только для вывода в меню, поэтому prettytable
+        # не загружается при запуске команд командной строки.
+        from prettytable import PrettyTable
+
+        # Создание таблицы с именованиями заголовков
+        table = PrettyTable([header for header, _ in TABLE_COLUMNS])
+
+        # Добавление задач в table одним вызовом.
+        table.add_rows([[task[field] for _, field in TABLE_COLUMNS]
+                        for task in tasks])
+
+        # Ширина столбцов под ширину вывода
+        if width is not None:
+            for header, size in column_widths(tasks, width).items():
+                table.max_width[header] = size
 
         return table
 
-    def getting_task(self, value: str = "", option: str = ""):
+    def format_tasks(self, tasks: list, width: Optional[int] = None):
+        """
+        Форматирование задач в JSON или таблицу
+        в зависимости от pretty_printed_JSON.
+        """
+
+        if self.pretty_printed_JSON:
+            return json.dumps(tasks, indent=4, ensure_ascii=False)
+        else:
+            return self.format_tasks_table(tasks, width=width)
+
+    def _getting_result(self, tasks: list, as_records: bool):
+        """
+        Результат запроса задач: список копий задач, если as_records,
+        иначе отформатированный вывод (см. format_tasks).
+        """
+
+        if as_records:
+            return [dict(task) for task in tasks]
+        return self.format_tasks(tasks)
+
+    def getting_task(self, value: str = "", option: str = "",
+                     search_mode: str = "substring",
+                     as_records: bool = False):
         """
         Получает задачи из файла `data.json` на основе указанных фильтров.
 
@@ -149,16 +461,38 @@ class TaskManager():
                              (например, "title", "description").
                 - "due_date": Дата завершения задачи.
                         Используется для поиска просроченных задач.
+            search_mode (str): Режим поиска для option "keywords":
+                - "substring": value входит в одно из полей задачи.
+                - "words": каждое слово value совпадает со словом
+                           одного из полей задачи.
+            as_records (bool): Вернуть список задач (словарей) вместо
+                               таблицы или строки JSON. Отрисовать его
+                               можно отдельно через format_tasks.
 
         Возвращает:
-            list: Список задач, соответствующих фильтрам.
+            list | str | PrettyTable: Задачи, соответствующие фильтрам:
+                  список словарей (as_records), строка JSON
+                  (pretty_printed_JSON) или таблица.
                   Если задач не найдено, возвращает `False`.
         """
 
         try:
-            # Открытие файла data.json в режиме чтения и кодировкой UTF-8.
-            with open(self.path, "r", encoding="UTF-8") as file:
-                data = json.load(file)
+            # Резидентная копия задач общая для потоков, поэтому чтение
+            # не должно пересекаться с ее изменением (см. FileLock.local).
+            with self.lock.local():
+                return self._getting_task(value, option, search_mode,
+                                          as_records)
+
+        except TimeoutError as err:
+            self._report_lock_timeout(err)
+            return False
+
+    def _getting_task(self, value: str, option: str, search_mode: str,
+                      as_records: bool):
+        """Выполняет getting_task под блокировкой потоков."""
+
+        try:
+            data = self._read_view()
 
             if option == "due_date":
                 value = "Просрочено"
@@ -187,10 +521,7 @@ class TaskManager():
 
             # Проверка, если value и option пустые, возвращаются все данные.
             if value.strip() == "":
-                if self.pretty_printed_JSON:
-                    return json.dumps(data, indent=4, ensure_ascii=False)
-                else:
-                    return self.format_tasks_table(data)
+                return self._getting_result(data.all(), as_records)
 
             if value.strip() != "" and option not in ["id", "category",
                                                       "priority", "status",
@@ -255,17 +586,16 @@ class TaskManager():
 
                 # Фильтрация задач, добавление задачи,
                 # где значение поля option равно value.
-                new_data = [task for task in data if task[option] == value]
+                if option == "id":
+                    task = data.get(value)
+                    new_data = [task] if task is not None else []
+                else:
+                    new_data = data.find(option, value)
 
                 # Если new_data не пусто, выводим данные в формате
                 # JSON или таблицы, если данных нет, возвращаем False.
                 if new_data:
-                    if self.pretty_printed_JSON:
-                        return json.dumps(new_data,
-                                          indent=4,
-                                          ensure_ascii=False)
-                    else:
-                        return self.format_tasks_table(new_data)
+                    return self._getting_result(new_data, as_records)
                 else:
                     message_warning = (
                         f"Значение \"{value}\" не было найдено в файле."
@@ -282,26 +612,21 @@ class TaskManager():
             # Проверка, если option == "keywords"
             # для поиска по ключевым словам.
             if option == "keywords":
-                new_data = []
-                for task in data:
-                    if any(
-                        value.lower() in str(task[field]).lower()
-                        for field in ["title", "description", "category",
-                                      "due_date", "priority", "status"]
-                    ):
-                        # Избежание дублирования
-                        if task not in new_data:
-                            new_data.append(task)
+                if search_mode not in SEARCH_MODES:
+                    message_error = (
+                        "Аргумент \"search_mode\" должен принимать одно из "
+                        "допустимых значений: \"substring\" или \"words\""
+                    )
+                    logger.error(message_error)
+                    print(message_error)
+                    return False
+
+                new_data = data.search(value, mode=search_mode)
 
                 # Если new_data не пусто, выводим данные в формате
                 # JSON или таблицы, если данных нет, возвращаем False.
                 if new_data:
-                    if self.pretty_printed_JSON:
-                        return json.dumps(new_data,
-                                          indent=4,
-                                          ensure_ascii=False)
-                    else:
-                        return self.format_tasks_table(new_data)
+                    return self._getting_result(new_data, as_records)
                 else:
                     message_warning = (
                         f"Ключевого слова \"{value}\" "
@@ -323,20 +648,12 @@ class TaskManager():
 
                 # Добавление задач при условии что нынешняя дата
                 # больше или равна дате, указанной в задаче.
-                new_data = [
-                    task for task in data
-                    if now.strftime("%Y-%m-%d") >= task["due_date"]
-                ]
+                new_data = data.overdue(now.strftime("%Y-%m-%d"))
 
                 # Если new_data не пусто, выводим данные в формате JSON
                 # или таблицы, если данных нет, возвращаем False.
                 if new_data:
-                    if self.pretty_printed_JSON:
-                        return json.dumps(new_data,
-                                          indent=4,
-                                          ensure_ascii=False)
-                    else:
-                        return self.format_tasks_table(new_data)
+                    return self._getting_result(new_data, as_records)
                 else:
                     message_error = (
                         "Просроченных заданий не было найдено в таблице."
@@ -360,9 +677,260 @@ class TaskManager():
             print(user_message_critical)
             return False
 
+    def getting_task_due_between(self, start: str, end: str,
+                                 as_records: bool = False):
+        """
+        Получает задачи со сроком выполнения в диапазоне дат.
+
+        Задачи берутся из отсортированного индекса сроков выполнения
+        и возвращаются в порядке срока.
+
+        Аргументы:
+            start (str): Начало диапазона в формате YYYY-MM-DD.
+            end (str): Конец диапазона в формате YYYY-MM-DD (включительно).
+            as_records (bool): Вернуть список задач вместо таблицы или JSON.
+
+        Возвращает:
+            list | str | PrettyTable: Задачи (см. getting_task).
+                               Если задач не найдено, возвращает `False`.
+        """
+
+        try:
+            # Проверка формата дат
+            for value in (start, end):
+                try:
+                    datetime.strptime(value, "%Y-%m-%d")
+                except (TypeError, ValueError):
+                    message_error = (
+                        f"Дата \"{value}\" указана некорректно. "
+                        "Ожидается формат YYYY-MM-DD."
+                    )
+                    logger.error(message_error)
+                    print(message_error)
+                    return False
+
+            if start > end:
+                message_error = (
+                    f"Начало диапазона \"{start}\" не может быть позже "
+                    f"его конца \"{end}\"."
+                )
+                logger.error(message_error)
+                print(message_error)
+                return False
+
+            # Чтение под блокировкой потоков (см. getting_task)
+            with self.lock.local():
+                new_data = self._read_view().due_between(start, end)
+
+                # Если new_data не пусто, выводим данные в формате JSON
+                # или таблицы, если данных нет, возвращаем False.
+                if new_data:
+                    return self._getting_result(new_data, as_records)
+
+            message_warning = (
+                f"Задач со сроком выполнения с {start} по {end} "
+                "не было найдено в таблице."
+            )
+            user_message_warning = (
+                f"В вашей таблице нет задач со сроком с {start} "
+                f"по {end}."
+            )
+            logger.warning(message_warning)
+            print(user_message_warning)
+            return False
+
+        except TimeoutError as err:
+            self._report_lock_timeout(err)
+            return False
+
+        except Exception as err:
+            tb = traceback.format_exc()
+            message_critical = (
+                "Произошла ошибка в функции "
+                f"\"getting_task_due_between\":{tb}: {err}"
+            )
+            user_message_critical = (
+                "Произошли непредвиденные неполадки в программе."
+            )
+            logger.critical(message_critical)
+            print(user_message_critical)
+            return False
+
+    def getting_task_due_within(self, days: int, as_records: bool = False):
+        """
+        Получает задачи со сроком выполнения в ближайшие days дней,
+        начиная с сегодняшнего дня.
+
+        Аргументы:
+            days (int): Количество дней (не меньше 0).
+            as_records (bool): Вернуть список задач вместо таблицы или JSON.
+
+        Возвращает:
+            list | str | PrettyTable: Задачи (см. getting_task).
+                               Если задач не найдено, возвращает `False`.
+        """
+
+        try:
+            days = int(days)
+        except (TypeError, ValueError) as err:
+            message_error = (
+                f"Некорректное значение параметра days: {err}."
+            )
+            logger.error(message_error)
+            print(message_error)
+            return False
+
+        if days < 0:
+            message_error = (
+                "Значение параметра days не может быть отрицательным."
+            )
+            logger.error(message_error)
+            print(message_error)
+            return False
+
+        today = datetime.today().date()
+        return self.getting_task_due_between(
+            today.strftime("%Y-%m-%d"),
+            (today + timedelta(days=days)).strftime("%Y-%m-%d"),
+            as_records=as_records
+        )
+
+    def query_tasks(self, filters: Optional[dict] = None,
+                    keywords: str = "", search_mode: str = "substring",
+                    due_from: str = "", due_to: str = "",
+                    order_by="id", descending: bool = False,
+                    limit: Optional[int] = None, offset: int = 0):
+        """
+        Составной запрос к задачам.
+
+        Все условия объединяются через "И". Запрос выполняется по индексам
+        хранилища и лениво: задачи выдаются по мере перебора результата,
+        поэтому страницы большого результата можно получать через limit
+        и offset, не загружая весь результат целиком.
+
+        Аргументы:
+            filters (Optional[dict]): Условия на равенство {поле: значение},
+                где поле - одно из "id", "title", "description", "category",
+                "due_date", "priority", "status". Значением может быть
+                список, тогда подходит любое из значений.
+            keywords (str): Строка для поиска по ключевым словам.
+            search_mode (str): Режим поиска ("substring" или "words").
+            due_from (str): Начало диапазона сроков (YYYY-MM-DD).
+            due_to (str): Конец диапазона сроков (YYYY-MM-DD, включительно).
+            order_by (str | Sequence[str]): Поля сортировки из "due_date",
+                "priority", "id". ID всегда используется последним.
+            descending (bool): Сортировка по убыванию.
+            limit (Optional[int]): Наибольшее число задач в результате.
+            offset (int): Число пропускаемых задач.
+
+        Возвращает:
+            Iterator[dict]: Копии задач, удовлетворяющих запросу.
+                            При некорректных аргументах возвращает `False`.
+                            Результат следует получить до следующего
+                            изменения задач, иначе при чтении возникает
+                            RuntimeError.
+        """
+
+        try:
+            filters = dict(filters or {})
+            for column, value in filters.items():
+                if column not in FILTER_FIELDS:
+                    message_error = (
+                        f"Поле \"{column}\" недоступно для фильтрации. "
+                        "Допустимые значения: "
+                        f"{', '.join(FILTER_FIELDS)}."
+                    )
+                    logger.error(message_error)
+                    print(message_error)
+                    return False
+
+                if column == "id":
+                    values = (value if isinstance(value, (list, tuple, set))
+                              else [value])
+                    filters[column] = [int(_id) for _id in values]
+
+            if search_mode not in SEARCH_MODES:
+                message_error = (
+                    "Аргумент \"search_mode\" должен принимать одно из "
+                    "допустимых значений: \"substring\" или \"words\""
+                )
+                logger.error(message_error)
+                print(message_error)
+                return False
+
+            for value in (due_from, due_to):
+                if value:
+                    datetime.strptime(value, "%Y-%m-%d")
+
+            columns = [order_by] if isinstance(order_by, str) else order_by
+            for column in columns:
+                if column not in ORDER_FIELDS:
+                    message_error = (
+                        f"Сортировка по полю \"{column}\" недоступна. "
+                        "Допустимые значения: "
+                        f"{', '.join(ORDER_FIELDS)}."
+                    )
+                    logger.error(message_error)
+                    print(message_error)
+                    return False
+
+            offset = int(offset)
+            if limit is not None:
+                limit = int(limit)
+            if offset < 0 or (limit is not None and limit < 0):
+                raise ValueError("limit и offset не могут быть "
+                                 "отрицательными")
+
+        except (TypeError, ValueError) as err:
+            message_error = (
+                f"Некорректные аргументы запроса: {err}."
+            )
+            logger.error(message_error)
+            print(message_error)
+            return False
+
+        query = Query(filters=filters, keywords=keywords,
+                      search_mode=search_mode, due_from=due_from,
+                      due_to=due_to, order_by=order_by,
+                      descending=descending, limit=limit, offset=offset)
+
+        try:
+            # Запрос и чтение каждой задачи результата выполняются
+            # под блокировкой потоков (см. getting_task).
+            with self.lock.local():
+                tasks = self._read_view().run_query(query)
+            return self._locked(tasks)
+
+        except TimeoutError as err:
+            self._report_lock_timeout(err)
+            return False
+
+        except Exception as err:
+            tb = traceback.format_exc()
+            message_critical = (
+                f"Произошла ошибка в функции \"query_tasks\":{tb}: {err}"
+            )
+            user_message_critical = (
+                "Произошли непредвиденные неполадки в программе."
+            )
+            logger.critical(message_critical)
+            print(user_message_critical)
+            return False
+
+    def _locked(self, tasks: Iterator[dict]) -> Iterator[dict]:
+        """Перебирает задачи, получая каждую под блокировкой потоков."""
+        tasks = iter(tasks)
+        while True:
+            with self.lock.local():
+                task = next(tasks, None)
+            if task is None:
+                return
+            yield task
+
     def data_validation(self, column: str = "",
                         value: str = "", intention: str = "",
-                        _id: Optional[int] = None):
+                        _id: Optional[int] = None,
+                        data: Optional[TaskIndex] = None):
         """
         Функция валидации данных при добавлении или изменении задачи.
 
@@ -375,6 +943,11 @@ class TaskManager():
             value (str): Значение, которое проверяется.
             new_value (str): Новое значение, если задача изменяется.
             intention (str): Намерение (add/change/delete/search)
+            _id (Optional[int]): ID изменяемой задачи (для intention change).
+            data (Optional[TaskIndex]): Уже загруженные задачи. Нужны
+                                        только для intention change; если
+                                        не переданы, задачи берутся из
+                                        резидентной копии.
 
         Возвращает:
             bool: True, если валидация прошла успешно, иначе False.
@@ -539,7 +1112,14 @@ class TaskManager():
                 if column == "due_date":
                     # Шаблон даты
                     date_pattern = r'^\d{4}-\d{2}-\d{2}$'
-                    if not re.match(date_pattern, value.strip()):
+                    is_date = bool(re.match(date_pattern, value.strip()))
+                    # Шаблон пропускает несуществующие даты (2099-13-45)
+                    if is_date:
+                        try:
+                            datetime.strptime(value.strip(), "%Y-%m-%d")
+                        except ValueError:
+                            is_date = False
+                    if not is_date:
                         message_error = (
                             "Значение в поле \"due_date\" указано "
                             "некорректно. Ожидается формат YYYY-MM-DD."
@@ -585,10 +1165,6 @@ class TaskManager():
                     print(message_error)
                     return False
 
-                # Открытие файла data.json в режиме чтения и кодировкой UTF-8.
-                with open(self.path, "r", encoding="UTF-8") as file:
-                    data = json.load(file)
-
                 # Проверка на повторяющиеся значения, если намерение change
                 if intention == "change":
                     if _id is None:
@@ -599,23 +1175,25 @@ class TaskManager():
                         print(message_error)
                         return False
 
-                    for task in data:
-                        if task.get("id") == int(_id):
-                            if task.get(column) == value:
-                                message_error = (
-                                    f"Значение поля \"{column}\" не может"
-                                    f" быть изменено с \"{task.get(column)}"
-                                    f"\" на \"{value}\", поскольку значения"
-                                    " одинаковые."
-                                )
-                                user_message_error = (
-                                    "Значение, которое вы хотите изменить,"
-                                    f" уже является \"{value}\".\nПожалуйс"
-                                    "та, укажите новое значение."
-                                )
-                                logger.error(message_error)
-                                print(user_message_error)
-                                return False
+                    if data is None:
+                        data = self._load_data()
+
+                    task = data.get(int(_id))
+                    if task is not None and task.get(column) == value:
+                        message_error = (
+                            f"Значение поля \"{column}\" не может"
+                            f" быть изменено с \"{task.get(column)}"
+                            f"\" на \"{value}\", поскольку значения"
+                            " одинаковые."
+                        )
+                        user_message_error = (
+                            "Значение, которое вы хотите изменить,"
+                            f" уже является \"{value}\".\nПожалуйс"
+                            "та, укажите новое значение."
+                        )
+                        logger.error(message_error)
+                        print(user_message_error)
+                        return False
 
         except Exception as err:
             tb = traceback.format_exc()
@@ -631,6 +1209,39 @@ class TaskManager():
 
         return True
 
+    def validate_task_fields(self, fields: dict, intention: str = "add",
+                             _id: Optional[int] = None,
+                             data: Optional[TaskIndex] = None):
+        """
+        Валидация нескольких полей задачи по одному снимку данных.
+
+        Каждое поле проходит через data_validation. Данные загружаются
+        не более одного раза и только для intention change, где нужно
+        сравнение с текущим значением задачи.
+
+        Аргументы:
+            fields (dict): Проверяемые поля в виде {column: value}.
+            intention (str): Намерение (add/change/delete/search).
+            _id (Optional[int]): ID изменяемой задачи (для intention change).
+            data (Optional[TaskIndex]): Уже загруженные задачи.
+
+        Возвращает:
+            bool: True, если все поля прошли валидацию, иначе False.
+        """
+
+        if intention == "change" and data is None:
+            data = self._load_data()
+
+        for column, value in fields.items():
+            if not self.data_validation(column=column,
+                                        value=value,
+                                        intention=intention,
+                                        _id=_id,
+                                        data=data):
+                return False
+
+        return True
+
     def add_task(self, title: str = "", description: str = "",
                  category: str = "", due_date: str = "",
                  priority: str = "", status: str = "Не выполено"):
@@ -656,50 +1267,16 @@ class TaskManager():
         """
 
         try:
-            # Валидация title
-            if not self.data_validation(
-                column="title",
-                value=title,
-                intention="add"
-            ):
-                return False
-
-            # Валидация description
-            if not self.data_validation(
-                column="description",
-                value=description,
-                intention="add"
-            ):
-                return False
-
-            # Валидация category
-            if not self.data_validation(
-                column="category",
-                value=category,
-                intention="add"
-            ):
-                return False
-
-            # Валидация due_date
-            if not self.data_validation(
-                column="due_date",
-                value=due_date,
-                intention="add"
-            ):
-                return False
-
-            # Валидация priority
-            if not self.data_validation(
-                column="priority",
-                value=priority,
-                intention="add"
-            ):
-                return False
-
-            # Валидация status
-            if not self.data_validation(
-                column="status",
-                value=status,
+            # Валидация всех полей задачи без обращения к data.json
+            if not self.validate_task_fields(
+                {
+                    "title": title,
+                    "description": description,
+                    "category": category,
+                    "due_date": due_date,
+                    "priority": priority,
+                    "status": status
+                },
                 intention="add"
             ):
                 return False
@@ -715,25 +1292,26 @@ class TaskManager():
                 status=status
             )
 
-            # Открытие файла data.json в режиме чтения и кодировкой UTF-8.
-            with open(self.path, "r", encoding="UTF-8") as file:
-                data = json.load(file)
-
-            # Подсчет текущих задач в переменной data и
-            # присвоение уникального ID
-            self.last_id = max(task["id"] for task in data)
-            # Увеличение last_id на 1
-            new_task.id = self.last_id + 1
-            # Обновление last_id для будущего использования
-            self.last_id += 1
-
-            # Добавление новой задачи в data
-            data.append(new_task.__dict__)
-
-            # Открытие файла data.json в режиме записи и перезапись файла
-            # содержимым объекта data в формате JSON
-            with open(self.path, "w", encoding="utf-8") as file:
-                json.dump(data, file, indent=4, ensure_ascii=False)
+            # Выдача ID и запись выполняются под одной блокировкой,
+            # чтобы другой процесс не выдал тот же ID.
+            with self.lock.exclusive():
+                data = self._load_data()
+
+                # Поиск наибольшего ID в переменной data и
+                # присвоение уникального ID
+                self.last_id = data.max_id()
+                # Увеличение last_id на 1
+                new_task.id = self.last_id + 1
+                # Обновление last_id для будущего использования
+                self.last_id += 1
+
+                # Сохранение добавленной задачи
+                self._commit(data,
+                             [{"op": "add", "task": new_task.to_dict()}])
+
+        except TimeoutError as err:
+            self._report_lock_timeout(err)
+            return False
 
         except Exception as err:
             tb = traceback.format_exc()
@@ -755,6 +1333,107 @@ class TaskManager():
         print(message_success)
         return True
 
+    def add_tasks(self, tasks):
+        """
+        Пакетное добавление задач.
+
+        Все задачи проверяются за один проход, корректные получают
+        последовательные ID после наибольшего существующего и сохраняются
+        одной записью в хранилище. Задачи, не прошедшие валидацию,
+        пропускаются и попадают в отчет, остальные добавляются.
+
+        Аргументы:
+            tasks (Iterable[dict]): Задачи в виде словарей с полями
+                "title", "description", "category", "due_date", "priority"
+                и необязательным "status" (по умолчанию "Не выполнена").
+
+        Возвращает:
+            dict: Отчет {"added": [ID добавленных задач],
+                  "failed": [{"index": номер задачи в tasks,
+                              "field": поле, не прошедшее проверку}]}.
+                  При непредвиденной ошибке возвращает `False`.
+        """
+
+        fields = ("title", "description", "category",
+                  "due_date", "priority", "status")
+        report = {"added": [], "failed": []}
+        new_tasks = []
+
+        try:
+            # Валидация всех задач без обращения к хранилищу
+            for index, task in enumerate(tasks):
+                if not isinstance(task, dict):
+                    report["failed"].append({"index": index, "field": None})
+                    continue
+
+                task = {"status": "Не выполнена", **task}
+                # Пустой статус заменяется значением по умолчанию
+                if (isinstance(task["status"], str)
+                        and not task["status"].strip()):
+                    task["status"] = "Не выполнена"
+                unknown = [column for column in task if column not in fields]
+                if unknown:
+                    message_error = (
+                        f"Задача {index} содержит недопустимое поле "
+                        f"\"{unknown[0]}\"."
+                    )
+                    logger.error(message_error)
+                    print(message_error)
+                    report["failed"].append({"index": index,
+                                             "field": unknown[0]})
+                    continue
+
+                for column in fields:
+                    value = task.get(column)
+                    if not isinstance(value, str) or not self.data_validation(
+                        column=column, value=value, intention="add"
+                    ):
+                        report["failed"].append({"index": index,
+                                                 "field": column})
+                        break
+                else:
+                    new_tasks.append(Task(**task))
+
+            if new_tasks:
+                with self.lock.exclusive():
+                    data = self._load_data()
+
+                    # Последовательные ID после наибольшего существующего
+                    self.last_id = data.max_id()
+                    for new_task in new_tasks:
+                        self.last_id += 1
+                        new_task.id = self.last_id
+
+                    # Сохранение всех задач одной записью
+                    self._commit(data, [{"op": "add", "task": task.to_dict()}
+                                        for task in new_tasks])
+
+        except TimeoutError as err:
+            self._report_lock_timeout(err)
+            return False
+
+        except Exception as err:
+            tb = traceback.format_exc()
+            message_critical = (
+                f"Произошла ошибка в функции \"add_tasks\":{tb} {err}"
+            )
+            user_message_critical = (
+                "Произошли непредвиденные неполадки в программе."
+            )
+            logger.critical(message_critical)
+            print(user_message_critical)
+            return False
+
+        report["added"] = [task.id for task in new_tasks]
+
+        message_success = (
+            f"Добавлено задач: {len(report['added'])}, "
+            f"отклонено: {len(report['failed'])}."
+        )
+        logger.info(message_success)
+        print(message_success)
+        return report
+
     def delete_task(self, value: str = "", choice: str = ""):
         """
         Функция для удаления задачи из системы по заданному параметру.
@@ -817,49 +1496,44 @@ class TaskManager():
             ):
                 return False
 
-            new_data = []
+            with self.lock.exclusive():
+                deleted_ids = []
 
-            # Открытие файла data.json в режиме чтения и кодировкой UTF-8.
-            with open(self.path, "r", encoding="UTF-8") as file:
-                data = json.load(file)
+                data = self._load_data()
 
-            if choice == "category":
-                for task in data:
-                    if task["category"] == value:
-                        self.task_found = True
+                if choice == "category":
+                    deleted_ids = [task["id"]
+                                   for task in data.find("category", value)]
+                    self.task_found = bool(deleted_ids)
+
+                    if not self.task_found:
                         message_ = (
-                            f"Задача \"{task['title']}\" с "
-                            f"ID {task['id']}, с категорией "
-                            f"\"{value}\" была успешно удалена."
+                            f"Задачи с категорией \"{value}\" не найдены."
                         )
-                        logger.info(message_)
-                        print(message_)
-                        continue
+                        user_message_ = (
+                            "В Вашей таблице не найдены задачи с категор"
+                            f"ией \"{value}\""
+                        )
+                        logger.warning(message_)
+                        print(user_message_)
+                        return False
 
-                    new_data.append(task)
+                    # Запись измененных данных в файл
+                    self._commit(data, [{"op": "delete", "ids": deleted_ids}])
 
-                if not self.task_found:
+                    # Одно итоговое сообщение вместо сообщения на задачу
                     message_ = (
-                        f"Задачи с категорией \"{value}\" не найдены."
-                    )
-                    user_message_ = (
-                        "В Вашей таблице не найдены задачи с категор"
-                        f"ией \"{value}\""
+                        f"Задачи с категорией \"{value}\" успешно удалены: "
+                        f"{len(deleted_ids)}."
                     )
-                    logger.warning(message_)
-                    print(user_message_)
-                    return False
-
-                # Запись измененных данных в файл
-                with open(self.path, "w", encoding="utf-8") as file:
-                    json.dump(new_data, file, indent=4, ensure_ascii=False)
-
-                return True
+                    logger.info(message_)
+                    print(message_)
+                    return True
 
-            if choice == "id":
-                value = int(value)
-                for task in data:
-                    if task["id"] == value:
+                if choice == "id":
+                    value = int(value)
+                    task = data.get(value)
+                    if task is not None:
                         self.task_found = True
                         message_ = (
                             f"Задача \"{task['title']}\" с "
@@ -867,31 +1541,112 @@ class TaskManager():
                         )
                         logger.info(message_)
                         print(message_)
-                        continue
+                        deleted_ids.append(task["id"])
+
+                    if not self.task_found:
+                        message_ = (
+                            f"Задача с ID {value} не найдена."
+                        )
+                        user_message_ = (
+                            f"В Вашей таблице нет задачи с ID \"{value}\""
+                        )
+                        logger.warning(message_)
+                        print(user_message_)
+                        return False
 
-                    new_data.append(task)
+                    # Запись измененных данных в файл
+                    self._commit(data, [{"op": "delete", "ids": deleted_ids}])
 
-                if not self.task_found:
-                    message_ = (
-                        f"Задача с ID {value} не найдена."
-                    )
-                    user_message_ = (
-                        f"В Вашей таблице нет задачи с ID \"{value}\""
+                    return True
+
+        except TimeoutError as err:
+            self._report_lock_timeout(err)
+            return False
+
+        except Exception as err:
+            tb = traceback.format_exc()
+            message_critical = (
+                f"Произошла ошибка в функции \"delete_task\":{tb} {err}"
+            )
+            user_message_critical = (
+                "Произошли непредвиденные неполадки в программе."
+            )
+            logger.critical(message_critical)
+            print(user_message_critical)
+            return False
+
+    def delete_tasks(self, ids=None, where: Optional[dict] = None,
+                     all_tasks: bool = False):
+        """
+        Пакетное удаление задач одной записью в хранилище.
+
+        Задачи задаются списком ID или запросом where (аргументы
+        query_tasks: filters, keywords, search_mode, due_from, due_to).
+        ID, которых нет в таблице, пропускаются. Вместо сообщения
+        на каждую задачу выводится одно итоговое сообщение.
+
+        Условия без отбора (см. SELECTION_KEYS) удаляют все задачи
+        и допускаются только с all_tasks=True.
+
+        Аргументы:
+            ids (Optional[Iterable[int]]): ID удаляемых задач.
+            where (Optional[dict]): Условия отбора удаляемых задач.
+            all_tasks (bool): Разрешить where без условий отбора
+                              (удаление всех задач).
+
+        Возвращает:
+            bool: True, если задачи удалены, иначе False
+                  (в том числе если ни одной задачи не найдено).
+        """
+
+        if (ids is None) == (where is None):
+            message_error = (
+                "Необходимо указать либо аргумент ids, либо аргумент where."
+            )
+            logger.error(message_error)
+            print(message_error)
+            return False
+
+        if where is not None and not self._check_selection(where, all_tasks,
+                                                           "удаления"):
+            return False
+
+        try:
+            with self.lock.exclusive():
+                data = self._load_data()
+
+                if ids is None:
+                    tasks = self.query_tasks(**where)
+                    if tasks is False:
+                        return False
+                    deleted_ids = [task["id"] for task in tasks]
+                    missing = 0
+                else:
+                    requested = list(dict.fromkeys(int(_id) for _id in ids))
+                    deleted_ids = [_id for _id in requested
+                                   if data.get(_id) is not None]
+                    missing = len(requested) - len(deleted_ids)
+
+                if not deleted_ids:
+                    message_warning = "Задачи для удаления не найдены."
+                    user_message_warning = (
+                        "В Вашей таблице не найдены задачи для удаления."
                     )
-                    logger.warning(message_)
-                    print(user_message_)
+                    logger.warning(message_warning)
+                    print(user_message_warning)
                     return False
 
                 # Запись измененных данных в файл
-                with open(self.path, "w", encoding="utf-8") as file:
-                    json.dump(new_data, file, indent=4, ensure_ascii=False)
+                self._commit(data, [{"op": "delete", "ids": deleted_ids}])
 
-                return True
+        except TimeoutError as err:
+            self._report_lock_timeout(err)
+            return False
 
         except Exception as err:
             tb = traceback.format_exc()
             message_critical = (
-                f"Произошла ошибка в функции \"delete_task\":{tb} {err}"
+                f"Произошла ошибка в функции \"delete_tasks\":{tb} {err}"
             )
             user_message_critical = (
                 "Произошли непредвиденные неполадки в программе."
@@ -900,6 +1655,13 @@ class TaskManager():
             print(user_message_critical)
             return False
 
+        message_success = f"Удалено задач: {len(deleted_ids)}."
+        if missing:
+            message_success += f" Не найдено ID: {missing}."
+        logger.info(message_success)
+        print(message_success)
+        return True
+
     def change_task(self, _id: Optional[int] = None,
                     column: str = "", value: str = ""):
         """
@@ -973,66 +1735,188 @@ class TaskManager():
             return False
 
         try:
-            new_data = []
-
-            # Открытие файла data.json в режиме чтения и кодировкой UTF-8.
-            with open(self.path, "r", encoding="UTF-8") as file:
-                data = json.load(file)
+            with self.lock.exclusive():
+                data = self._load_data()
 
-            for task in data:
-                if task["id"] == _id:
+                if data.get(_id) is not None:
                     self.task_found = True  # Задача найдена
 
-                    # Валидация нового значения
-                    if not self.data_validation(
-                        column=column,
-                        value=value,
+                    # Валидация нового значения по тому же снимку данных
+                    if not self.validate_task_fields(
+                        {column: value},
                         intention="change",
-                        _id=_id
+                        _id=_id,
+                        data=data
                     ):
                         return False
 
-                    # Перезаписываем значение
-                    task[column] = value
+                # Если задача не была найдена
+                if not self.task_found:
+                    message_warning = (
+                        f"Задачи с ID {_id} не было найдено."
+                    )
+                    user_message_warning = (
+                        f"Не удалось найти задачу с ID {_id}."
+                        "Пожалуйста, проверьте, верно ли вы у"
+                        "казали искомое значение."
+                    )
+                    logger.warning(message_warning)
+                    print(user_message_warning)
+                    return False
 
-                # Добавление задачи в новый список (независимо,
-                # была ли она изменена)
-                new_data.append(task)
+                # Перезапись значения и сохранение изменения
+                self._commit(
+                    data,
+                    [{"op": "change", "id": _id, "changes": {column: value}}]
+                )
 
-            # Если задача не была найдена
-            if not self.task_found:
-                message_warning = (
-                    f"Задачи с ID {_id} не было найдено."
+                message_success = (
+                    f"Значение в задаче с ID {_id} в поле \"{column}\" "
+                    f"было изменено на \"{value}\"."
                 )
-                user_message_warning = (
-                    f"Не удалось найти задачу с ID {_id}."
-                    "Пожалуйста, проверьте, верно ли вы у"
-                    "казали искомое значение."
+                user_message_success = (
+                    f"Готово! Значение в задаче с ID {_id} "
+                    f"было изменено на \"{value}\"."
                 )
-                logger.warning(message_warning)
-                print(user_message_warning)
-                return False
+                logger.info(message_success)
+                print(user_message_success)
+                return True
 
-            # Запись измененных данных обратно в файл
-            with open(self.path, "w", encoding="utf-8") as file:
-                json.dump(new_data, file, indent=4, ensure_ascii=False)
+        except TimeoutError as err:
+            self._report_lock_timeout(err)
+            return False
 
-            message_success = (
-                f"Значение в задаче с ID {_id} в поле \"{column}\" "
-                f"было изменено на \"{value}\"."
+        except Exception as err:
+            tb = traceback.format_exc()
+            message_critical = (
+                f"Произошла ошибка в функции \"change_task\":{tb} {err}"
             )
-            user_message_success = (
-                f"Готово! Значение в задаче с ID {_id} "
-                f"было изменено на \"{value}\"."
+            user_message_critical = (
+                "Произошли непредвиденные неполадки в программе."
             )
-            logger.info(message_success)
-            print(user_message_success)
-            return True
+            logger.critical(message_critical)
+            print(user_message_critical)
+            return False
+
+    def change_tasks(self, changes: Optional[dict] = None,
+                     where: Optional[dict] = None,
+                     patch: Optional[dict] = None,
+                     all_tasks: bool = False):
+        """
+        Пакетное изменение задач одной записью в хранилище.
+
+        Изменения задаются либо словарем {ID: {column: value}}, либо
+        запросом where (аргументы query_tasks: filters, keywords,
+        search_mode, due_from, due_to) и общим набором изменений patch
+        для всех найденных задач. Все изменения проверяются заранее:
+        если хотя бы одно не проходит валидацию, не изменяется ничего.
+        Поля, значение которых уже совпадает с новым, пропускаются.
+
+        Вместе с patch аргумент where обязателен, а условия без отбора
+        (пустой where или только order_by, limit и т.д., см.
+        SELECTION_KEYS) изменяют все задачи и допускаются только
+        с all_tasks=True, чтобы опечатка не перезаписала всю таблицу.
+
+        Аргументы:
+            changes (Optional[dict]): Изменения по ID задач.
+            where (Optional[dict]): Условия отбора задач для patch.
+            patch (Optional[dict]): Изменения для задач, найденных по where.
+            all_tasks (bool): Разрешить patch с пустым where (изменение
+                              всех задач).
+
+        Возвращает:
+            bool: True, если изменения сохранены, иначе False.
+        """
+
+        valid_columns = ["title", "description", "category",
+                         "due_date", "priority", "status"]
+
+        if (changes is None) == (patch is None):
+            message_error = (
+                "Необходимо указать либо аргумент changes, "
+                "либо аргументы where и patch."
+            )
+            logger.error(message_error)
+            print(message_error)
+            return False
+
+        if patch is not None:
+            if where is None:
+                message_error = (
+                    "Вместе с аргументом patch необходимо указать "
+                    "аргумент where."
+                )
+                logger.error(message_error)
+                print(message_error)
+                return False
+
+            if not self._check_selection(where, all_tasks, "изменения"):
+                return False
+
+        try:
+            with self.lock.exclusive():
+                data = self._load_data()
+
+                if changes is None:
+                    tasks = self.query_tasks(**where)
+                    if tasks is False:
+                        return False
+                    changes = {task["id"]: patch for task in tasks}
+
+                records = []
+                for _id, fields in changes.items():
+                    _id = int(_id)
+                    task = data.get(_id)
+                    if task is None:
+                        message_error = f"Задачи с ID {_id} не было найдено."
+                        logger.error(message_error)
+                        print(message_error)
+                        return False
+
+                    fields = {str(column): str(value)
+                              for column, value in fields.items()}
+                    for column in fields:
+                        if column not in valid_columns:
+                            message_error = (
+                                "Аргумент column может включать в себя "
+                                "только следующие значения: "
+                                f"{', '.join(valid_columns)}."
+                            )
+                            logger.error(message_error)
+                            print(message_error)
+                            return False
+
+                    # Пустой статус заменяется значением по умолчанию
+                    if "status" in fields and not fields["status"].strip():
+                        fields["status"] = "Не выполнена"
+
+                    fields = {column: value
+                              for column, value in fields.items()
+                              if task[column] != value}
+                    if not fields:
+                        continue
+
+                    if not self.validate_task_fields(fields,
+                                                     intention="change",
+                                                     _id=_id,
+                                                     data=data):
+                        return False
+
+                    records.append({"op": "change", "id": _id,
+                                    "changes": fields})
+
+                # Сохранение всех изменений одной записью
+                if records:
+                    self._commit(data, records)
+
+        except TimeoutError as err:
+            self._report_lock_timeout(err)
+            return False
 
         except Exception as err:
             tb = traceback.format_exc()
             message_critical = (
-                f"Произошла ошибка в функции \"change_task\":{tb} {err}"
+                f"Произошла ошибка в функции \"change_tasks\":{tb} {err}"
             )
             user_message_critical = (
                 "Произошли непредвиденные неполадки в программе."
@@ -1040,3 +1924,8 @@ class TaskManager():
             logger.critical(message_critical)
             print(user_message_critical)
             return False
+
+        message_success = f"Изменено задач: {len(records)}."
+        logger.info(message_success)
+        print(message_success)
+        return True
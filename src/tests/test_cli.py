@@ -0,0 +1,141 @@
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+from task_manager.cli import EXIT_FAILURE, EXIT_OK, EXIT_USAGE, run
+
+# Каталог src для запуска CLI в отдельном процессе
+SRC_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Мок-данные для тестов
+MOCK_DATA = [
+    {
+        "id": 1,
+        "title": "Задача 1",
+        "description": "Описание задачи 1",
+        "category": "Работа",
+        "priority": "Высокий",
+        "status": "Не выполнена",
+        "due_date": "2099-12-25"
+    },
+    {
+        "id": 2,
+        "title": "Задача 2",
+        "description": "Описание задачи 2",
+        "category": "Личное",
+        "priority": "Низкий",
+        "status": "Выполнена",
+        "due_date": "2000-01-01"
+    }
+]
+
+
+@pytest.fixture()
+def data_path(tmp_path):
+    """Фикстура для создания файла data.json с мок-данными."""
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(MOCK_DATA, ensure_ascii=False),
+                    encoding="utf-8")
+    return str(path)
+
+
+def run_json(capsys, *argv):
+    """Выполнение команды и разбор ее вывода."""
+    code = run(list(argv))
+    out = capsys.readouterr().out
+    return code, json.loads(out) if out else None
+
+
+def test_list_outputs_json(capsys, data_path):
+    """Тест: list выводит задачи массивом JSON."""
+    code, tasks = run_json(capsys, "--path", data_path, "list")
+
+    assert code == EXIT_OK
+    assert tasks == MOCK_DATA
+
+
+def test_list_outputs_ndjson(capsys, data_path):
+    """Тест: в формате ndjson выводится одна задача на строку."""
+    code = run(["--path", data_path, "--format", "ndjson",
+                "list", "--order-by", "due_date"])
+    lines = capsys.readouterr().out.splitlines()
+
+    assert code == EXIT_OK
+    assert [json.loads(line)["id"] for line in lines] == [2, 1]
+
+
+def test_get_missing_task(capsys, data_path):
+    """Тест: get несуществующей задачи завершается с кодом ошибки."""
+    code, task = run_json(capsys, "--path", data_path, "get", "7")
+
+    assert code == EXIT_FAILURE
+    assert task is None
+
+
+def test_add_and_change(capsys, data_path):
+    """Тест: add и change выводят задачу после изменения."""
+    code, task = run_json(capsys, "--path", data_path, "add",
+                          "--title", "Новая задача",
+                          "--description", "Описание новой задачи",
+                          "--category", "Обучение",
+                          "--due-date", "2099-01-01",
+                          "--priority", "Средний")
+    assert code == EXIT_OK
+    assert task["id"] == 3
+    assert task["status"] == "Не выполнена"
+
+    code, task = run_json(capsys, "--path", data_path, "change", "3",
+                          "--status", "Выполнена")
+    assert code == EXIT_OK
+    assert task["status"] == "Выполнена"
+
+    code, _ = run_json(capsys, "--path", data_path, "change", "3",
+                       "--category", "Отдых")
+    assert code == EXIT_FAILURE
+
+
+def test_delete_and_overdue(capsys, data_path):
+    """Тест: delete выводит удаленные задачи, overdue - просроченные."""
+    code, tasks = run_json(capsys, "--path", data_path, "overdue")
+    assert code == EXIT_OK
+    assert [task["id"] for task in tasks] == [2]
+
+    code, tasks = run_json(capsys, "--path", data_path,
+                           "delete", "--category", "Работа")
+    assert code == EXIT_OK
+    assert [task["id"] for task in tasks] == [1]
+
+    code, tasks = run_json(capsys, "--path", data_path, "search", "задача")
+    assert [task["id"] for task in tasks] == [2]
+
+
+def test_messages_go_to_stderr(capsys, data_path):
+    """Тест: сообщения TaskManager не попадают в вывод результата."""
+    code = run(["--path", data_path, "delete", "2"])
+    captured = capsys.readouterr()
+
+    assert code == EXIT_OK
+    assert json.loads(captured.out)[0]["id"] == 2
+    assert "Удалено задач: 1." in captured.err
+
+
+def test_usage_error(capsys, data_path):
+    """Тест: некорректные аргументы завершаются кодом EXIT_USAGE."""
+    assert run(["--path", data_path, "delete"]) == EXIT_USAGE
+    assert run(["--path", data_path, "unknown"]) == EXIT_USAGE
+
+
+def test_import_skips_optional_modules():
+    """Тест: запуск CLI не загружает yaml, sqlite3 и модуль сценариев."""
+    code = (
+        "import sys, task_manager.cli; "
+        "print(sorted(name for name in ('yaml', 'sqlite3', "
+        "'task_manager.script') if name in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code],
+                            capture_output=True, text=True, check=True,
+                            env={**os.environ, "PYTHONPATH": SRC_PATH})
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,152 @@
+import json
+import tracemalloc
+import pytest
+
+from task_manager.columnar import ColumnarTaskIndex
+from task_manager.index import TaskIndex
+from task_manager.query import Query
+from task_manager.task_manager import TaskManager
+from tests.test_query import QUERIES, make_tasks
+
+RECORDS = [
+    {"op": "add", "task": dict(make_tasks(1)[0], id=501, title="Новая")},
+    {"op": "change", "id": 3, "changes": {"status": "Выполнена",
+                                          "due_date": "2025-01-01"}},
+    {"op": "change", "id": 4, "changes": {"category": "Отдых"}},
+    {"op": "delete", "ids": [5, 7, 999]},
+    {"op": "add", "task": dict(make_tasks(1)[0], id=2, title="Замена")},
+]
+
+
+@pytest.fixture()
+def indexes():
+    """Фикстура: одни и те же задачи в TaskIndex и ColumnarTaskIndex."""
+    return TaskIndex(make_tasks(400)), ColumnarTaskIndex(make_tasks(400))
+
+
+def test_columnar_round_trip(indexes):
+    """Тест: задачи возвращаются словарями без изменений."""
+    index, columnar = indexes
+    assert columnar.tasks == index.tasks
+    assert len(columnar) == 400
+    assert columnar.max_id() == 400
+    assert columnar.get(17) == index.get(17)
+    assert columnar.get(1000) is None
+
+
+def test_columnar_lookups_match_index(indexes):
+    """Тест: поиск по столбцам совпадает с TaskIndex."""
+    index, columnar = indexes
+
+    for column, value in [("category", "Работа"), ("priority", "Высокий"),
+                          ("status", "Выполнена"), ("category", "Отдых"),
+                          ("title", "Задача врач")]:
+        assert columnar.find(column, value) == index.find(column, value)
+
+    assert columnar.overdue("2025-03-01") == index.overdue("2025-03-01")
+    assert (columnar.due_between("2025-05-01", "2025-06-15")
+            == index.due_between("2025-05-01", "2025-06-15"))
+    assert columnar.search("отчет") == index.search("отчет")
+    assert (columnar.search("курсы 12", mode="words")
+            == index.search("курсы 12", mode="words"))
+
+
+@pytest.mark.parametrize("params", QUERIES)
+def test_columnar_query_matches_index(indexes, params):
+    """Тест: составной запрос по столбцам совпадает с TaskIndex."""
+    index, columnar = indexes
+    query = Query(**params)
+    assert list(columnar.run_query(query)) == list(index.run_query(query))
+
+
+def test_columnar_apply_matches_index(indexes):
+    """Тест: изменения применяются так же, как в TaskIndex."""
+    index, columnar = indexes
+    index.apply(RECORDS)
+    columnar.apply(RECORDS)
+
+    assert columnar.tasks == index.tasks
+    assert columnar.max_id() == index.max_id() == 501
+    assert (columnar.find("category", "Отдых")
+            == index.find("category", "Отдых"))
+
+    columnar.apply([{"op": "delete", "ids": [501]}])
+    assert columnar.max_id() == 400
+
+
+def test_columnar_uses_less_memory():
+    """Тест: столбцы занимают меньше памяти, чем список словарей."""
+    def measure(view_class):
+        tracemalloc.start()
+        try:
+            view = view_class(make_tasks(5000))
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        assert len(view) == 5000
+        return size
+
+    assert measure(ColumnarTaskIndex) < measure(TaskIndex) * 0.6
+
+
+def test_columnar_task_manager(tmp_path):
+    """Тест: TaskManager с резидентной копией по столбцам."""
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(make_tasks(50), ensure_ascii=False),
+                    encoding="utf-8")
+    manager = TaskManager(path=str(path), columnar=True)
+
+    assert isinstance(manager._load_data(), ColumnarTaskIndex)
+    assert manager.change_task(_id=1, column="title", value="Новая задача")
+    assert manager.delete_tasks(ids=[2, 3])
+    report = manager.add_tasks([{
+        "title": "Новая задача",
+        "description": "Описание новой задачи",
+        "category": "Работа",
+        "due_date": "2099-01-01",
+        "priority": "Средний",
+    }])
+    assert report["added"] == [51]
+
+    resident = TaskManager(path=str(path))
+    assert (manager.getting_task(as_records=True)
+            == resident.getting_task(as_records=True))
+    assert (manager.getting_task("Работа", "category", as_records=True)
+            == resident.getting_task("Работа", "category", as_records=True))
+
+
+def test_columnar_keeps_invalid_due_dates():
+    """Тест: сроки, не являющиеся датой, хранятся и ищутся как строки."""
+    tasks = make_tasks(6)
+    for task, due_date in zip(tasks, ["", "2024-02-30", "20991231"]):
+        task["due_date"] = due_date
+    index = TaskIndex([dict(task) for task in tasks])
+    columnar = ColumnarTaskIndex(tasks)
+
+    assert columnar.tasks == index.tasks
+    assert columnar.overdue("2025-03-01") == index.overdue("2025-03-01")
+    assert (columnar.due_between("2024-01-01", "2025-12-31")
+            == index.due_between("2024-01-01", "2025-12-31"))
+    for params in QUERIES:
+        query = Query(**params)
+        assert (list(columnar.run_query(query))
+                == list(index.run_query(query)))
+
+    records = [{"op": "change", "id": 1,
+                "changes": {"due_date": "2099-01-01"}},
+               {"op": "change", "id": 4, "changes": {"due_date": "-"}},
+               {"op": "delete", "ids": [2]}]
+    index.apply(records)
+    columnar.apply(records)
+    assert columnar.tasks == index.tasks
+
+
+def test_columnar_task_manager_invalid_due_date(tmp_path):
+    """Тест: файл с пустым сроком загружается по столбцам."""
+    tasks = make_tasks(3)
+    tasks[1]["due_date"] = ""
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(tasks, ensure_ascii=False), encoding="utf-8")
+    manager = TaskManager(path=str(path), columnar=True)
+
+    assert manager.getting_task(as_records=True) == tasks
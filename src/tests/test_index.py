@@ -0,0 +1,193 @@
+import threading
+from unittest.mock import patch
+
+from task_manager import index as index_module
+from task_manager.index import TaskIndex
+
+# Мок-данные для тестов
+MOCK_DATA = [
+    {
+        "id": 1,
+        "title": "Задача 1",
+        "description": "Описание задачи 1",
+        "category": "Работа",
+        "priority": "Высокий",
+        "status": "Не выполнена",
+        "due_date": "2024-12-25"
+    },
+    {
+        "id": 2,
+        "title": "Задача 2",
+        "description": "Описание задачи 2",
+        "category": "Личное",
+        "priority": "Низкий",
+        "status": "Выполнена",
+        "due_date": "2024-11-30"
+    }
+]
+
+
+def make_index():
+    """Создание TaskIndex с копией мок-данных."""
+    return TaskIndex([dict(task) for task in MOCK_DATA])
+
+
+def make_task(_id, **fields):
+    """Создание задачи на основе первой задачи мок-данных."""
+    return dict(MOCK_DATA[0], id=_id, **fields)
+
+# ID
+
+
+def test_index_get_by_id():
+    """Тест: получение задачи по ID."""
+    index = make_index()
+    assert index.get(2)["title"] == "Задача 2"
+    assert index.get(99) is None
+
+
+def test_index_keeps_order():
+    """Тест: изменения сохраняют порядок хранения задач."""
+    index = make_index()
+    index.apply([
+        {"op": "add", "task": make_task(3)},
+        {"op": "change", "id": 1, "changes": {"title": "Новая задача"}},
+    ])
+    assert [task["id"] for task in index.tasks] == [1, 2, 3]
+    assert index.tasks[0]["title"] == "Новая задача"
+
+
+def test_index_max_id():
+    """Тест: отслеживание наибольшего ID."""
+    index = make_index()
+    assert index.max_id() == 2
+
+    index.apply([{"op": "add", "task": make_task(7)}])
+    assert index.max_id() == 7
+
+    index.apply([{"op": "delete", "ids": [7]}])
+    assert index.max_id() == 2
+
+    index.apply([{"op": "delete", "ids": [1, 2]}])
+    assert index.max_id() == 0
+    assert len(index) == 0
+
+# POSTINGS
+
+
+def test_index_find_by_posting():
+    """Тест: фильтр по category, status и priority."""
+    index = make_index()
+    assert [task["id"] for task in index.find("category", "Работа")] == [1]
+    assert [task["id"] for task in index.find("status", "Выполнена")] == [2]
+    assert index.find("priority", "Средний") == []
+
+
+def test_index_postings_follow_changes():
+    """Тест: списки по значениям обновляются при изменениях."""
+    index = make_index()
+    index.apply([
+        {"op": "add", "task": make_task(3, category="Обучение")},
+        {"op": "change", "id": 1, "changes": {"category": "Личное"}},
+        {"op": "delete", "ids": [2]},
+    ])
+
+    assert index.find("category", "Работа") == []
+    assert [task["id"] for task in index.find("category", "Личное")] == [1]
+    assert [task["id"] for task in index.find("category", "Обучение")] == [3]
+    assert [task["id"]
+            for task in index.find("priority", "Высокий")] == [1, 3]
+
+
+def test_index_find_order_ignores_change_history():
+    """Тест: порядок результата find не зависит от истории изменений."""
+    index = make_index()
+    index.apply([{"op": "add", "task": make_task(3)}])
+    index.apply([{"op": "change", "id": 1,
+                  "changes": {"status": "Выполнена"}}])
+    index.apply([{"op": "change", "id": 1,
+                  "changes": {"status": "Не выполнена"}}])
+
+    assert [task["id"]
+            for task in index.find("status", "Не выполнена")] == [1, 3]
+
+# DUE_DATE
+
+
+def test_index_overdue_and_range():
+    """Тест: поиск по отсортированному индексу сроков выполнения."""
+    index = make_index()
+    index.apply([
+        {"op": "add", "task": make_task(3, due_date="2024-12-01")},
+        {"op": "change", "id": 1, "changes": {"due_date": "2024-11-01"}},
+    ])
+
+    assert [task["id"] for task in index.overdue("2024-11-30")] == [1, 2]
+    assert [task["id"]
+            for task in index.due_between("2024-11-30",
+                                          "2024-12-31")] == [2, 3]
+
+    index.apply([{"op": "delete", "ids": [2]}])
+    assert [task["id"] for task in index.overdue("2024-12-31")] == [1, 3]
+
+# KEYWORDS
+
+
+def test_index_search_substring():
+    """Тест: поиск подстроки через индекс n-грамм."""
+    index = make_index()
+    assert [task["id"] for task in index.search("ЗАДАЧИ 2")] == [2]
+    assert [task["id"] for task in index.search("адач")] == [1, 2]
+    assert [task["id"] for task in index.search("Ли")] == [2]
+    assert index.search("Несуществующее") == []
+
+
+def test_index_search_words():
+    """Тест: поиск целых слов через индекс слов."""
+    index = make_index()
+    assert [task["id"] for task in index.search("задачи 1",
+                                                mode="words")] == [1]
+    assert index.search("адач", mode="words") == []
+
+
+def test_index_search_follows_changes():
+    """Тест: поисковые индексы обновляются при изменениях."""
+    index = make_index()
+    index.search("задача")
+    index.search("задача", mode="words")
+
+    index.apply([
+        {"op": "add", "task": make_task(3, title="Прогулка в парке")},
+        {"op": "change", "id": 1, "changes": {"title": "Отчет"}},
+        {"op": "delete", "ids": [2]},
+    ])
+
+    assert [task["id"] for task in index.search("парк")] == [3]
+    assert [task["id"] for task in index.search("отчет",
+                                                mode="words")] == [1]
+    assert [task["id"] for task in index.search("задача 2")] == []
+    assert [task["id"] for task in index.search("задачи",
+                                                mode="words")] == [1, 3]
+
+
+def test_index_terms_built_before_concurrent_apply():
+    """Тест: изменение из другого потока ждет построения индекса поиска."""
+    index = make_index()
+    writer = threading.Thread(target=index.apply, args=(
+        [{"op": "add", "task": make_task(3, title="Прогулка в парке")}],
+    ))
+
+    def slow_terms(task, mode):
+        # Изменение начинается во время построения индекса
+        if not writer.is_alive() and writer.ident is None:
+            writer.start()
+            writer.join(0.1)
+            assert writer.is_alive()
+        return search_terms(task, mode)
+
+    search_terms = index_module.search_terms
+    with patch("task_manager.index.search_terms", side_effect=slow_terms):
+        assert [task["id"] for task in index.search("задача")] == [1, 2]
+    writer.join()
+
+    assert [task["id"] for task in index.search("парк")] == [3]
@@ -0,0 +1,121 @@
+import json
+import multiprocessing
+
+import pytest
+
+from task_manager.locking import FileLock, fcntl
+from task_manager.task_manager import TaskManager
+
+# Мок-данные для тестов
+MOCK_DATA = [
+    {
+        "id": 1,
+        "title": "Задача 1",
+        "description": "Описание задачи 1",
+        "category": "Работа",
+        "priority": "Высокий",
+        "status": "Не выполнена",
+        "due_date": "2099-12-25"
+    }
+]
+
+pytestmark = pytest.mark.skipif(fcntl is None,
+                                reason="fcntl недоступен на этой системе")
+
+
+@pytest.fixture()
+def data_path(tmp_path):
+    """Фикстура для создания файла data.json с мок-данными."""
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(MOCK_DATA, ensure_ascii=False),
+                    encoding="utf-8")
+    return path
+
+
+def add_tasks_worker(path, journal, count):
+    """Добавление count задач из отдельного процесса."""
+    manager = TaskManager(path=path, journal=journal)
+    for number in range(count):
+        assert manager.add_task(title=f"Задача {number}",
+                                description="Описание новой задачи",
+                                category="Работа",
+                                due_date="2099-01-01",
+                                priority="Средний",
+                                status="Не выполнена")
+
+
+def test_shared_locks_do_not_block(tmp_path):
+    """Тест: разделяемые блокировки разных владельцев совместимы."""
+    path = str(tmp_path / "data.json.lock")
+    first = FileLock(path, timeout=0)
+    second = FileLock(path, timeout=0)
+
+    with first.shared():
+        with second.shared():
+            pass
+
+
+def test_exclusive_lock_timeout(tmp_path):
+    """Тест: исключительная блокировка ждет не дольше timeout."""
+    path = str(tmp_path / "data.json.lock")
+    holder = FileLock(path)
+    waiter = FileLock(path, timeout=0.05)
+
+    with holder.shared():
+        with pytest.raises(TimeoutError):
+            with waiter.exclusive():
+                pass
+
+    with waiter.exclusive():
+        pass
+
+
+def test_lock_is_reentrant(tmp_path):
+    """Тест: чтение под исключительной блокировкой не блокирует себя."""
+    lock = FileLock(str(tmp_path / "data.json.lock"), timeout=0)
+
+    with lock.exclusive():
+        with lock.shared():
+            pass
+
+    with lock.shared():
+        with pytest.raises(RuntimeError):
+            with lock.exclusive():
+                pass
+
+
+def test_mutation_fails_while_store_is_locked(data_path):
+    """Тест: изменение не выполняется, пока файл занят другим процессом."""
+    manager = TaskManager(path=str(data_path), lock_timeout=0.05)
+    other = FileLock(f"{data_path}.lock")
+
+    with other.exclusive():
+        assert not manager.change_task(_id=1, column="status",
+                                       value="Выполнена")
+
+    assert json.loads(data_path.read_text(encoding="utf-8")) == MOCK_DATA
+    assert manager.change_task(_id=1, column="status", value="Выполнена")
+
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_concurrent_add_task_keeps_all_updates(data_path, journal):
+    """Тест: параллельные процессы не теряют задачи и не дублируют ID."""
+    workers, count = 4, 10
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=add_tasks_worker,
+                        args=(str(data_path), journal, count))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    tasks = TaskManager(path=str(data_path), journal=journal).getting_task(
+        as_records=True
+    )
+    ids = [task["id"] for task in tasks]
+    assert len(ids) == 1 + workers * count
+    assert sorted(ids) == list(range(1, 2 + workers * count))
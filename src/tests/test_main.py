@@ -0,0 +1,97 @@
+import sys
+import json
+from unittest.mock import patch
+
+import pytest
+
+import main
+from task_manager.task_manager import TaskManager
+
+# Мок-данные для тестов
+MOCK_DATA = [
+    {
+        "id": 1,
+        "title": "Задача 1",
+        "description": "Описание задачи 1",
+        "category": "Работа",
+        "priority": "Высокий",
+        "status": "Не выполнена",
+        "due_date": "2099-12-25"
+    }
+]
+
+
+@pytest.fixture()
+def tab(tmp_path):
+    """Фикстура TaskManager с файлом data.json из мок-данных."""
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(MOCK_DATA, ensure_ascii=False),
+                    encoding="utf-8")
+    return TaskManager(path=str(path))
+
+
+def run_session(tab, answers, clear_screen=None):
+    """Выполнение меню с ответами answers вместо ввода пользователя."""
+    with patch("builtins.input", side_effect=answers), \
+            patch("main.os.system", side_effect=clear_screen), \
+            patch("main.sleep"):
+        main.run_menu(tab)
+
+
+def test_long_session_keeps_stack_depth(tab):
+    """Тест: переходы между экранами не увеличивают глубину стека."""
+    depths = []
+
+    def clear_screen(command):
+        frame, depth = sys._getframe(), 0
+        while frame is not None:
+            frame, depth = frame.f_back, depth + 1
+        depths.append(depth)
+
+    # Больше переходов, чем допускает предел рекурсии
+    answers = ["1", "0"] * sys.getrecursionlimit() + ["0"]
+    run_session(tab, answers, clear_screen)
+
+    assert len(depths) > sys.getrecursionlimit()
+    assert len(set(depths)) == 1
+
+
+def test_create_task_through_menu(tab):
+    """Тест: задача создается через меню, пустой статус - по умолчанию."""
+    answers = ["2", "Новая задача", "Описание новой задачи", "Обучение",
+               "2099-01-01", "Средний", "", "1", "0"]
+    run_session(tab, answers)
+
+    task = tab.getting_task(value="2", option="id", as_records=True)[0]
+    assert task["title"] == "Новая задача"
+    assert task["status"] == "Не выполнена"
+
+
+def test_invalid_input_does_not_recurse(tab):
+    """Тест: ошибочный ввод повторяет экран без рекурсии."""
+    answers = ["4", "текст", "1", "99", "1", "0", "0"]
+    run_session(tab, answers)
+
+    assert tab.getting_task(value="1", option="id",
+                            as_records=True) is False
+
+
+def test_paged_listing(tab):
+    """Тест: список задач выводится постранично с переходом по ">"."""
+    tab.add_tasks([{"title": f"Задача номер {number}",
+                    "description": "Описание новой задачи",
+                    "category": "Личное",
+                    "due_date": "2099-01-01",
+                    "priority": "Низкий"} for number in range(30)])
+    screens = []
+
+    with patch("builtins.print", side_effect=screens.append):
+        run_session(tab, ["1", ">", ">", "<", "0", "0"])
+
+    pages = [screen for screen in screens if "Страница" in str(screen)]
+    # Первая страница: задача из мок-данных и 19 новых
+    assert [page.count("Личное") for page in pages[:4]] == [
+        19, 11, 11, 19
+    ]
+    assert "[>] Следующая страница" in pages[0]
+    assert "[>] Следующая страница" not in pages[1]
@@ -0,0 +1,52 @@
+import json
+from unittest.mock import patch
+
+from task_manager.paging import (MIN_COLUMN_WIDTH, NEXT_PAGE, PREVIOUS_PAGE,
+                                 TaskPager, column_widths)
+from task_manager.task_manager import TaskManager
+from tests.test_query import make_tasks
+
+
+def test_column_widths_fit_terminal():
+    """Тест: переносимые столбцы сужаются только на узком терминале."""
+    tasks = make_tasks(5)
+    tasks[0]["description"] = "Очень длинное описание задачи " * 5
+
+    assert column_widths(tasks, 1000) == {}
+
+    widths = column_widths(tasks, 100)
+    assert set(widths) == {"Title", "Description"}
+    assert min(widths.values()) >= MIN_COLUMN_WIDTH
+
+    manager = TaskManager()
+    lines = str(manager.format_tasks_table(tasks, width=100)).splitlines()
+    assert max(len(line) for line in lines) <= 100
+
+
+def test_pager_formats_only_visible_page(tmp_path):
+    """Тест: форматируется только текущая страница."""
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(make_tasks(45), ensure_ascii=False),
+                    encoding="utf-8")
+    manager = TaskManager(path=str(path))
+    pager = TaskPager(manager, page_size=20, width=200,
+                      filters={"id": list(range(1, 46))})
+
+    with patch.object(manager, "format_tasks",
+                      wraps=manager.format_tasks) as format_tasks:
+        pager.render()
+        assert len(format_tasks.call_args.args[0]) == 20
+        assert pager.has_next
+
+        assert pager.navigate(NEXT_PAGE)
+        assert pager.navigate(NEXT_PAGE)
+        text = pager.render()
+        assert [task["id"] for task in format_tasks.call_args.args[0]] == [
+            41, 42, 43, 44, 45
+        ]
+
+    assert not pager.has_next
+    assert "Страница 3." in text
+    assert pager.navigate(NEXT_PAGE) and pager.page == 2
+    assert pager.navigate(PREVIOUS_PAGE) and pager.page == 1
+    assert not pager.navigate("1")
@@ -0,0 +1,140 @@
+import json
+import random
+import pytest
+
+from unittest.mock import patch
+
+from task_manager.index import TaskIndex
+from task_manager.query import Query
+from task_manager.storage import SQLiteStorage
+from task_manager.task_manager import TaskManager
+
+CATEGORIES = ["Работа", "Личное", "Обучение"]
+PRIORITIES = ["Низкий", "Средний", "Высокий"]
+STATUSES = ["Выполнена", "Не выполнена"]
+WORDS = ["отчет", "врач", "курсы", "интернет", "парк", "проект"]
+
+
+def make_tasks(count, seed=13):
+    """Создание списка случайных задач."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": _id,
+            "title": f"Задача {rng.choice(WORDS)}",
+            "description": f"Описание {rng.choice(WORDS)} {_id}",
+            "category": rng.choice(CATEGORIES),
+            "due_date": f"2025-{rng.randint(1, 12):02d}-"
+                        f"{rng.randint(1, 28):02d}",
+            "priority": rng.choice(PRIORITIES),
+            "status": rng.choice(STATUSES)
+        }
+        for _id in range(1, count + 1)
+    ]
+
+
+def brute_force(tasks, query):
+    """Выполнение запроса перебором для сравнения."""
+    found = sorted((task for task in tasks if query.matches(task)),
+                   key=query.sort_key, reverse=query.descending)
+    stop = None if query.limit is None else query.offset + query.limit
+    return found[query.offset:stop]
+
+
+QUERIES = [
+    {},
+    {"filters": {"category": "Работа"}},
+    {"filters": {"category": "Работа", "priority": "Высокий",
+                 "status": "Не выполнена"},
+     "due_from": "2025-03-01", "due_to": "2025-03-31"},
+    {"filters": {"id": [5, 3, 999]}},
+    {"keywords": "отчет", "order_by": "due_date", "limit": 5},
+    {"keywords": "курсы проект", "search_mode": "words"},
+    {"order_by": "due_date", "descending": True, "limit": 10, "offset": 5},
+    {"order_by": ["priority", "due_date"], "limit": 7},
+    {"order_by": "priority", "descending": True, "offset": 390},
+    {"filters": {"priority": ["Высокий", "Средний"]},
+     "order_by": "priority", "limit": 20, "offset": 3},
+    {"due_to": "2025-02-01", "order_by": "id", "descending": True},
+]
+
+
+@pytest.mark.parametrize("params", QUERIES)
+def test_index_query_matches_brute_force(params):
+    """Тест: составной запрос по индексам совпадает с перебором."""
+    tasks = make_tasks(400)
+    query = Query(**params)
+
+    result = list(TaskIndex(tasks).run_query(query))
+    assert result == brute_force(tasks, query)
+
+
+@pytest.mark.parametrize("params", QUERIES)
+def test_sqlite_query_matches_brute_force(params, tmp_path):
+    """Тест: составной запрос в базе SQLite совпадает с перебором."""
+    tasks = make_tasks(400)
+    storage = SQLiteStorage(str(tmp_path / "data.sqlite"))
+    storage.apply([{"op": "add", "task": task} for task in tasks])
+    query = Query(**params)
+
+    try:
+        assert list(storage.run_query(query)) == brute_force(tasks, query)
+    finally:
+        storage.close()
+
+
+def test_index_query_is_lazy():
+    """Тест: страница по индексу сортировки не перебирает все задачи."""
+    index = TaskIndex(make_tasks(2000))
+    query = Query(filters={"status": "Не выполнена"},
+                  order_by="due_date", limit=10)
+
+    with patch.object(Query, "matches", autospec=True,
+                      side_effect=Query.matches) as mock_matches:
+        result = list(index.run_query(query))
+
+    assert len(result) == 10
+    assert mock_matches.call_count < 100
+
+
+def test_index_query_returns_copies():
+    """Тест: изменение результата запроса не затрагивает индекс."""
+    index = TaskIndex(make_tasks(20))
+
+    for task in index.run_query(Query(order_by="priority")):
+        task["priority"] = "Срочный"
+
+    assert index.find("priority", "Срочный") == []
+    assert all(task["priority"] != "Срочный" for task in index.all())
+
+
+def test_index_query_after_change():
+    """Тест: чтение результата после изменения задач - понятная ошибка."""
+    index = TaskIndex(make_tasks(20))
+    result = index.run_query(Query(order_by="priority"))
+    next(result)
+
+    index.apply([{"op": "delete", "ids": list(range(1, 21))}])
+
+    with pytest.raises(RuntimeError, match="изменены"):
+        next(result)
+
+
+def test_query_tasks(tmp_path):
+    """Тест: составной запрос через TaskManager."""
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(make_tasks(50), ensure_ascii=False),
+                    encoding="utf-8")
+    manager = TaskManager(path=str(path))
+
+    result = list(manager.query_tasks(filters={"category": "Работа",
+                                               "id": ["1", "2", "3"]},
+                                      order_by="due_date"))
+    assert all(task["category"] == "Работа" for task in result)
+    assert all(task["id"] in (1, 2, 3) for task in result)
+
+    assert manager.query_tasks(filters={"Неизвестное": 1}) is False
+    assert manager.query_tasks(order_by="title") is False
+    assert manager.query_tasks(due_from="2025-13-01") is False
+    assert manager.query_tasks(limit=-1) is False
+    assert manager.query_tasks(search_mode="regex") is False
@@ -0,0 +1,154 @@
+import json
+import importlib.util
+from unittest.mock import patch
+
+import pytest
+
+from task_manager.cli import EXIT_FAILURE, run
+from task_manager.script import load_script, run_script
+from task_manager.task_manager import TaskManager
+
+# Мок-данные для тестов
+MOCK_DATA = [
+    {
+        "id": 1,
+        "title": "Задача 1",
+        "description": "Описание задачи 1",
+        "category": "Работа",
+        "priority": "Высокий",
+        "status": "Не выполнена",
+        "due_date": "2099-12-25"
+    }
+]
+
+# Сценарий из операций всех видов
+OPERATIONS = [
+    {"op": "add", "task": {"title": "Задача 2",
+                           "description": "Описание задачи 2",
+                           "category": "Личное",
+                           "due_date": "2099-01-01",
+                           "priority": "Низкий"}},
+    {"op": "change", "id": 2, "changes": {"status": "Выполнена"}},
+    {"op": "change", "where": {"filters": {"category": "Работа"}},
+     "patch": {"priority": "Средний"}},
+    {"op": "delete", "id": 7},
+    {"op": "delete", "where": {"filters": {"status": "Выполнена"}}},
+]
+
+
+@pytest.fixture()
+def data_path(tmp_path):
+    """Фикстура для создания файла data.json с мок-данными."""
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(MOCK_DATA, ensure_ascii=False),
+                    encoding="utf-8")
+    return str(path)
+
+
+def test_run_script_persists_once(data_path):
+    """Тест: сценарий сохраняется в хранилище одной записью."""
+    manager = TaskManager(path=data_path)
+
+    with patch.object(manager.storage, "save",
+                      wraps=manager.storage.save) as save:
+        report = run_script(manager, OPERATIONS)
+
+    assert save.call_count == 1
+    assert [item["ok"] for item in report] == [True, True, True,
+                                               False, True]
+    assert report[0]["added"] == [2]
+
+    with open(data_path, encoding="utf-8") as file:
+        tasks = json.load(file)
+    assert tasks == [{**MOCK_DATA[0], "priority": "Средний"}]
+
+
+def test_batch_discards_changes_on_error(data_path):
+    """Тест: при исключении в пакете изменения не сохраняются."""
+    manager = TaskManager(path=data_path)
+
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            assert manager.delete_tasks(ids=[1])
+            raise RuntimeError
+
+    assert manager.getting_task(value="1", option="id", as_records=True)
+
+
+def test_batch_with_journal_and_streaming(data_path):
+    """Тест: запросы в пакете видят еще не сохраненные изменения."""
+    manager = TaskManager(path=data_path, journal=True, streaming=True)
+
+    with manager.batch():
+        assert manager.change_tasks(changes={1: {"title": "Задача 1б"}})
+        tasks = manager.getting_task(value="1", option="id",
+                                     as_records=True)
+        assert tasks[0]["title"] == "Задача 1б"
+
+    with open(f"{data_path}.journal", encoding="utf-8") as file:
+        assert len(file.readlines()) == 1
+
+
+def test_load_script_formats(tmp_path):
+    """Тест: сценарий читается из JSON, NDJSON и YAML."""
+    json_path = tmp_path / "script.json"
+    json_path.write_text(json.dumps(OPERATIONS), encoding="utf-8")
+    assert load_script(str(json_path)) == OPERATIONS
+
+    ndjson_path = tmp_path / "script.ndjson"
+    ndjson_path.write_text(
+        "".join(json.dumps(item) + "\n" for item in OPERATIONS) + "{\n",
+        encoding="utf-8"
+    )
+    operations = load_script(str(ndjson_path))
+    assert operations[:-1] == OPERATIONS
+    assert "error" in operations[-1]
+
+    yaml_path = tmp_path / "script.yaml"
+    yaml_path.write_text("- op: delete\n  ids: [1, 2]\n", encoding="utf-8")
+    if importlib.util.find_spec("yaml") is None:
+        with pytest.raises(ValueError):
+            load_script(str(yaml_path))
+    else:
+        assert load_script(str(yaml_path)) == [{"op": "delete",
+                                                "ids": [1, 2]}]
+
+
+def test_cli_run_reports_failures(capsys, tmp_path, data_path):
+    """Тест: команда run выводит отчет и код ошибки при сбое операции."""
+    path = tmp_path / "script.json"
+    path.write_text(json.dumps([{"op": "delete", "id": 1}, {"op": "fly"}]),
+                    encoding="utf-8")
+
+    code = run(["--path", data_path, "--format", "ndjson", "run", str(path)])
+    report = [json.loads(line)
+              for line in capsys.readouterr().out.splitlines()]
+
+    assert code == EXIT_FAILURE
+    assert [item["ok"] for item in report] == [True, False]
+    assert "error" in report[1]
+
+
+def test_change_with_mixed_keys_fails(data_path):
+    """Тест: операция change с ключами id и patch не выполняется."""
+    manager = TaskManager(path=data_path)
+
+    report = run_script(manager, [
+        {"op": "change", "id": 1, "patch": {"status": "Выполнена"}},
+        {"op": "change", "where": {"filters": {"category": "Работа"}},
+         "changes": {"status": "Выполнена"}},
+    ])
+
+    assert [item["ok"] for item in report] == [False, False]
+    assert all("error" in item for item in report)
+    assert manager.getting_task(as_records=True) == MOCK_DATA
+
+
+def test_delete_with_empty_where_fails(data_path):
+    """Тест: операция delete с пустым where не удаляет задачи."""
+    manager = TaskManager(path=data_path)
+
+    report = run_script(manager, [{"op": "delete", "where": {}}])
+
+    assert report[0]["ok"] is False
+    assert manager.getting_task(as_records=True) == MOCK_DATA
@@ -0,0 +1,386 @@
+import json
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from unittest.mock import patch
+
+from task_manager.index import TaskIndex
+from task_manager.serialization import SERIALIZATIONS
+from task_manager.storage import (JournalStorage, JsonStorage,
+                                  NdjsonStorage, SQLiteStorage, atomic_write,
+                                  convert_json_to_ndjson,
+                                  convert_ndjson_to_json,
+                                  migrate_json_to_sqlite, open_storage)
+from task_manager.task_manager import TaskManager
+
+# Мок-данные для тестов
+MOCK_DATA = [
+    {
+        "id": 1,
+        "title": "Задача 1",
+        "description": "Описание задачи 1",
+        "category": "Работа",
+        "priority": "Высокий",
+        "status": "Не выполнена",
+        "due_date": "2024-12-25"
+    },
+    {
+        "id": 2,
+        "title": "Задача 2",
+        "description": "Описание задачи 2",
+        "category": "Личное",
+        "priority": "Низкий",
+        "status": "Выполнена",
+        "due_date": "2024-11-30"
+    }
+]
+
+
+@pytest.fixture()
+def data_path(tmp_path):
+    """Фикстура для создания файла data.json с мок-данными."""
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(MOCK_DATA, ensure_ascii=False),
+                    encoding="utf-8")
+    return path
+
+
+def read_json(path):
+    """Чтение JSON-файла."""
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+# JOURNAL
+
+
+def test_apply_records_idempotent():
+    """Тест: повторное применение журнала не меняет результат."""
+    records = [
+        {"op": "add", "task": dict(MOCK_DATA[0], id=3)},
+        {"op": "change", "id": 1, "changes": {"title": "Новая задача"}},
+        {"op": "delete", "ids": [2]},
+    ]
+    index = TaskIndex([dict(task) for task in MOCK_DATA])
+    index.apply(records)
+    index.apply(records)
+
+    assert [task["id"] for task in index.all()] == [1, 3]
+    assert index.get(1)["title"] == "Новая задача"
+
+
+def test_journal_mutations_do_not_rewrite_snapshot(data_path):
+    """Тест: изменения дописываются в журнал, data.json не меняется."""
+    manager = TaskManager(path=str(data_path), journal=True)
+    snapshot = data_path.read_bytes()
+
+    assert manager.add_task(title="Новая задача",
+                            description="Описание новой задачи",
+                            category="Личное",
+                            due_date="2077-01-01",
+                            priority="Средний",
+                            status="Не выполнена")
+    assert manager.change_task(_id=1, column="status", value="Выполнена")
+    assert manager.delete_task(value="2", choice="id")
+
+    assert data_path.read_bytes() == snapshot
+
+    journal = manager.storage.read_journal()
+    assert [record["op"] for record in journal] == ["add",
+                                                    "change",
+                                                    "delete"]
+
+    # Новый экземпляр видит изменения, применяя журнал к снимку
+    tasks = TaskManager(path=str(data_path), journal=True)._load_data().all()
+    assert [task["id"] for task in tasks] == [1, 3]
+    assert tasks[0]["status"] == "Выполнена"
+
+
+def test_journal_compact(data_path):
+    """Тест: сжатие переносит журнал в data.json и очищает его."""
+    manager = TaskManager(path=str(data_path), journal=True)
+    assert manager.change_task(_id=1, column="title", value="Новая задача")
+
+    assert manager.compact() is True
+
+    assert read_json(data_path)[0]["title"] == "Новая задача"
+    assert manager.storage.read_journal() == []
+
+
+def test_journal_auto_compact(data_path, monkeypatch):
+    """Тест: журнал сжимается, когда становится больше снимка."""
+    monkeypatch.setattr(JournalStorage, "COMPACT_MIN_SIZE", 0)
+    manager = TaskManager(path=str(data_path), journal=True)
+
+    for title in ["Новая задача", "Другая задача", "Третья задача"] * 10:
+        assert manager.change_task(_id=1, column="title", value=title)
+
+    assert len(manager.storage.read_journal()) < 30
+    assert read_json(data_path)[0]["title"] != "Задача 1"
+
+
+def test_journal_skips_torn_line(data_path):
+    """Тест: недописанная строка журнала пропускается при чтении."""
+    storage = JournalStorage(str(data_path))
+    with open(storage.journal_path, "w", encoding="utf-8") as file:
+        file.write(json.dumps({"op": "delete", "ids": [1]}) + "\n")
+        file.write("{\"op\": \"delete\", \"ids\": [")
+
+    assert [task["id"] for task in storage.load()] == [2]
+
+# SQLITE
+
+
+@pytest.fixture()
+def sqlite_manager(data_path, tmp_path):
+    """Фикстура для создания TaskManager с базой SQLite."""
+    sqlite_path = tmp_path / "data.sqlite"
+    assert migrate_json_to_sqlite(str(data_path), str(sqlite_path)) == 2
+
+    manager = TaskManager(path=str(sqlite_path))
+    manager.pretty_printed_JSON = True
+    yield manager
+    manager.storage.close()
+
+
+def test_open_storage_by_extension(tmp_path):
+    """Тест: хранилище выбирается по расширению файла."""
+    assert isinstance(open_storage(str(tmp_path / "data.sqlite")),
+                      SQLiteStorage)
+    assert isinstance(open_storage(str(tmp_path / "data.json"),
+                                   journal=True),
+                      JournalStorage)
+    assert isinstance(open_storage(str(tmp_path / "data.json")),
+                      JsonStorage)
+    assert isinstance(open_storage(str(tmp_path / "data.ndjson")),
+                      NdjsonStorage)
+    assert isinstance(open_storage(str(tmp_path / "data.txt"), ndjson=True),
+                      NdjsonStorage)
+
+
+def test_sqlite_getting_task(sqlite_manager):
+    """Тест: поиск задач в базе SQLite."""
+    result = json.loads(sqlite_manager.getting_task(value="Работа",
+                                                    option="category"))
+    assert [task["id"] for task in result] == [1]
+
+    result = json.loads(sqlite_manager.getting_task(value="задача 2",
+                                                    option="keywords"))
+    assert [task["id"] for task in result] == [2]
+
+    assert sqlite_manager.getting_task(value="99", option="id") is False
+
+
+def test_sqlite_mutations(sqlite_manager):
+    """Тест: добавление, изменение и удаление задач в базе SQLite."""
+    assert sqlite_manager.add_task(title="Новая задача",
+                                   description="Описание новой задачи",
+                                   category="Обучение",
+                                   due_date="2077-01-01",
+                                   priority="Средний",
+                                   status="Не выполнена")
+    assert sqlite_manager.change_task(_id=3, column="priority",
+                                      value="Высокий")
+    assert sqlite_manager.delete_task(value="Работа", choice="category")
+
+    tasks = sqlite_manager.storage.all()
+    assert [task["id"] for task in tasks] == [2, 3]
+    assert tasks[1]["priority"] == "Высокий"
+
+
+def test_sqlite_uses_indexes(sqlite_manager):
+    """Тест: поиск по полям выполняется по индексам базы."""
+    connection = sqlite_manager.storage.connection
+    for column in ["category", "status", "priority", "due_date"]:
+        plan = connection.execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE {column} = ?",
+            ("value",)
+        ).fetchall()
+        assert f"tasks_{column}" in str([tuple(row) for row in plan])
+
+
+def test_sqlite_due_between(sqlite_manager):
+    """Тест: поиск задач в диапазоне дат в базе SQLite."""
+    tasks = sqlite_manager.storage.due_between("2024-11-01", "2024-12-31")
+    assert [task["id"] for task in tasks] == [2, 1]
+    assert sqlite_manager.storage.overdue("2024-12-01") == tasks[:1]
+
+
+def test_sqlite_search_words(sqlite_manager):
+    """Тест: поиск целых слов в базе SQLite."""
+    assert [task["id"] for task in sqlite_manager.storage.search(
+        "задачи 2", mode="words")] == [2]
+    assert sqlite_manager.storage.search("адач", mode="words") == []
+
+
+def test_sqlite_from_other_threads(sqlite_manager):
+    """Тест: хранилище SQLite доступно из нескольких потоков."""
+    storage = sqlite_manager.storage
+    storage.all()
+
+    def read(_id):
+        try:
+            return storage.get(_id)["id"]
+        finally:
+            storage.close()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(read, [1, 2] * 4)) == [1, 2] * 4
+
+# NDJSON
+
+
+@pytest.fixture()
+def ndjson_manager(data_path, tmp_path):
+    """Фикстура для создания TaskManager с файлом NDJSON."""
+    ndjson_path = tmp_path / "data.ndjson"
+    assert convert_json_to_ndjson(str(data_path), str(ndjson_path)) == 2
+
+    manager = TaskManager(path=str(ndjson_path))
+    yield manager
+
+
+def test_ndjson_one_task_per_line(ndjson_manager):
+    """Тест: в файле NDJSON каждая задача занимает одну строку."""
+    with open(ndjson_manager.path, "r", encoding="utf-8") as file:
+        lines = file.read().splitlines()
+
+    assert [json.loads(line) for line in lines] == MOCK_DATA
+
+
+def test_ndjson_add_appends(ndjson_manager):
+    """Тест: добавление задачи дописывает строку без перезаписи файла."""
+    with open(ndjson_manager.path, "r", encoding="utf-8") as file:
+        before = file.read()
+
+    with patch("task_manager.storage.atomic_write") as mock_write:
+        report = ndjson_manager.add_tasks([{
+            "title": "Новая задача",
+            "description": "Описание новой задачи",
+            "category": "Работа",
+            "due_date": "2099-01-01",
+            "priority": "Средний",
+        }])
+
+    mock_write.assert_not_called()
+    assert report["added"] == [3]
+
+    with open(ndjson_manager.path, "r", encoding="utf-8") as file:
+        after = file.read()
+    assert after.startswith(before)
+    assert json.loads(after[len(before):])["id"] == 3
+
+
+def test_ndjson_change_and_delete(ndjson_manager):
+    """Тест: изменение и удаление задач в файле NDJSON."""
+    assert ndjson_manager.change_task(_id=1, column="status",
+                                      value="Выполнена")
+    assert ndjson_manager.delete_task(value="2", choice="id")
+
+    tasks = NdjsonStorage(ndjson_manager.path).load()
+    assert tasks == [dict(MOCK_DATA[0], status="Выполнена")]
+
+
+def test_ndjson_torn_line(ndjson_manager):
+    """Тест: недописанная строка пропускается и не портит новые задачи."""
+    with open(ndjson_manager.path, "a", encoding="utf-8") as file:
+        file.write("{\"id\": 3, \"tit")
+
+    storage = NdjsonStorage(ndjson_manager.path)
+    assert storage.load() == MOCK_DATA
+
+    storage.commit(storage.open_view(), [
+        {"op": "add", "task": dict(MOCK_DATA[0], id=4)}
+    ])
+    assert [task["id"] for task in storage.load()] == [1, 2, 4]
+
+
+def test_ndjson_streaming(ndjson_manager):
+    """Тест: потоковые запросы по файлу NDJSON."""
+    manager = TaskManager(path=ndjson_manager.path, streaming=True)
+
+    assert manager.getting_task(value="Личное", option="category",
+                                as_records=True) == [MOCK_DATA[1]]
+    assert manager._data is None
+
+
+def test_convert_ndjson_to_json(ndjson_manager, tmp_path):
+    """Тест: перенос задач из NDJSON обратно в data.json."""
+    json_path = tmp_path / "restored.json"
+    assert convert_ndjson_to_json(ndjson_manager.path, str(json_path)) == 2
+    assert read_json(json_path) == MOCK_DATA
+
+# SERIALIZATION
+
+
+@pytest.mark.parametrize("serialization", SERIALIZATIONS)
+def test_serialization_round_trip(data_path, serialization):
+    """Тест: запись в каждом формате и чтение с определением формата."""
+    if serialization in ("orjson", "msgpack"):
+        pytest.importorskip(serialization)
+
+    manager = TaskManager(path=str(data_path), serialization=serialization)
+    assert manager.change_task(_id=1, column="status", value="Выполнена")
+
+    expected = [dict(MOCK_DATA[0], status="Выполнена"), MOCK_DATA[1]]
+    for reader in (TaskManager(path=str(data_path)),
+                   TaskManager(path=str(data_path), streaming=True)):
+        assert reader.getting_task(as_records=True) == expected
+
+
+def test_compact_serialization_is_smaller(data_path, tmp_path):
+    """Тест: компактный формат не содержит отступов и занимает меньше."""
+    compact_path = tmp_path / "compact.json"
+    JsonStorage(str(data_path)).save(MOCK_DATA)
+    JsonStorage(str(compact_path), "compact").save(MOCK_DATA)
+
+    text = compact_path.read_text(encoding="utf-8")
+    assert "\n" not in text and ": " not in text
+    assert "Задача 1" in text
+    assert compact_path.stat().st_size < data_path.stat().st_size
+    assert read_json(compact_path) == MOCK_DATA
+
+
+def test_compact_journal_lines(data_path):
+    """Тест: записи журнала в компактном формате."""
+    manager = TaskManager(path=str(data_path), journal=True,
+                          serialization="compact")
+    assert manager.change_task(_id=1, column="status", value="Выполнена")
+
+    with open(f"{data_path}.journal", "r", encoding="utf-8") as file:
+        assert file.read() == (
+            '{"op":"change","id":1,"changes":{"status":"Выполнена"}}\n'
+        )
+
+
+def test_unknown_serialization(data_path):
+    """Тест: неизвестный формат записи."""
+    with pytest.raises(ValueError):
+        TaskManager(path=str(data_path), serialization="xml")
+
+# ATOMIC WRITE
+
+
+def test_atomic_write_failure_keeps_file(data_path):
+    """Тест: сбой во время записи не повреждает data.json."""
+    snapshot = data_path.read_bytes()
+
+    def broken_dump(file):
+        file.write("[{\"id\": 1,")
+        raise RuntimeError("Сбой записи")
+
+    with pytest.raises(RuntimeError):
+        atomic_write(str(data_path), broken_dump)
+
+    assert data_path.read_bytes() == snapshot
+    assert [path.name for path in data_path.parent.iterdir()] == [
+        "data.json"
+    ]
+
+
+def test_atomic_write_keeps_mode(data_path):
+    """Тест: атомарная запись сохраняет права доступа файла."""
+    data_path.chmod(0o640)
+    JsonStorage(str(data_path)).save(MOCK_DATA[:1])
+
+    assert data_path.stat().st_mode & 0o777 == 0o640
+    assert read_json(data_path) == MOCK_DATA[:1]
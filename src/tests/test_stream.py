@@ -0,0 +1,166 @@
+import json
+import pytest
+
+from unittest.mock import patch
+
+from task_manager.query import Query
+from task_manager.serialization import SERIALIZATIONS, load_mapped
+from task_manager.storage import JsonStorage, open_storage
+from task_manager.stream import TaskStream, iter_json_array, iter_ndjson
+from task_manager.task_manager import TaskManager
+from tests.test_query import QUERIES, make_tasks
+
+
+@pytest.fixture()
+def data_path(tmp_path):
+    """Фикстура для создания файла data.json со случайными задачами."""
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(make_tasks(300), indent=4,
+                               ensure_ascii=False),
+                    encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_iter_json_array(data_path, chunk_size):
+    """Тест: потоковое чтение совпадает с json.load при любом блоке."""
+    tasks = list(iter_json_array(str(data_path), chunk_size=chunk_size))
+    assert tasks == make_tasks(300)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("[]", []),
+    (" [ ] ", []),
+    ("[{\"id\": 1}]", [{"id": 1}]),
+    ("[{\"id\": 1} , {\"id\": 2}]\n", [{"id": 1}, {"id": 2}]),
+])
+def test_iter_json_array_layouts(tmp_path, text, expected):
+    """Тест: потоковое чтение компактного и пустого массива."""
+    path = tmp_path / "data.json"
+    path.write_text(text, encoding="utf-8")
+    assert list(iter_json_array(str(path), chunk_size=2)) == expected
+
+
+@pytest.mark.parametrize("text", ["{}", "[{\"id\": 1}", "[{\"id\": 1} {}]"])
+def test_iter_json_array_invalid(tmp_path, text):
+    """Тест: ошибка при чтении файла, который не является JSON-массивом."""
+    path = tmp_path / "data.json"
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(str(path), chunk_size=3))
+
+
+@pytest.mark.parametrize("params", QUERIES)
+def test_stream_query_matches_index(data_path, params):
+    """Тест: составной запрос по потоку совпадает с запросом по индексу."""
+    streamed = TaskManager(path=str(data_path), streaming=True)
+    resident = TaskManager(path=str(data_path))
+
+    assert (list(streamed.query_tasks(**params))
+            == list(resident.query_tasks(**params)))
+
+
+def test_stream_getting_task_matches_index(data_path):
+    """Тест: потоковые запросы getting_task совпадают с резидентными."""
+    streamed = TaskManager(path=str(data_path), streaming=True)
+    resident = TaskManager(path=str(data_path))
+
+    for value, option in [("", ""), ("17", "id"), ("Работа", "category"),
+                          ("Высокий", "priority"), ("Выполнена", "status"),
+                          ("отчет", "keywords"), ("Ъ", "due_date")]:
+        assert (streamed.getting_task(value, option, as_records=True)
+                == resident.getting_task(value, option, as_records=True))
+
+    assert (streamed.getting_task("курсы 1", "keywords", search_mode="words",
+                                  as_records=True)
+            == resident.getting_task("курсы 1", "keywords",
+                                     search_mode="words", as_records=True))
+    assert (streamed.getting_task_due_between("2025-03-01", "2025-04-15",
+                                              as_records=True)
+            == resident.getting_task_due_between("2025-03-01", "2025-04-15",
+                                                 as_records=True))
+
+
+def test_stream_does_not_keep_resident_copy(data_path):
+    """Тест: потоковые запросы не загружают задачи в память целиком."""
+    manager = TaskManager(path=str(data_path), streaming=True)
+    manager.getting_task("Работа", "category", as_records=True)
+    list(manager.query_tasks(filters={"status": "Выполнена"}, limit=5))
+
+    assert manager._data is None
+
+
+def test_stream_reads_each_query_lazily():
+    """Тест: каждый запрос заново перебирает источник задач."""
+    calls = []
+
+    def source():
+        calls.append(1)
+        return iter(make_tasks(10))
+
+    stream = TaskStream(source)
+    assert stream.get(3)["id"] == 3
+    assert list(stream.run_query(Query(limit=2))) == make_tasks(2)
+    assert len(calls) == 2
+
+# MMAP
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+def test_iter_json_array_mmap(data_path, chunk_size):
+    """Тест: чтение через mmap совпадает с json.load при любом блоке."""
+    tasks = list(iter_json_array(str(data_path), chunk_size=chunk_size,
+                                 use_mmap=True))
+    assert tasks == make_tasks(300)
+
+
+def test_iter_ndjson_mmap(tmp_path):
+    """Тест: построчное чтение NDJSON через mmap."""
+    path = tmp_path / "data.ndjson"
+    path.write_text("".join(json.dumps(task, ensure_ascii=False) + "\n"
+                            for task in make_tasks(20)) + "{\"id\": 2",
+                    encoding="utf-8")
+
+    assert list(iter_ndjson(str(path), use_mmap=True)) == make_tasks(20)
+
+    path.write_text("", encoding="utf-8")
+    assert list(iter_ndjson(str(path), use_mmap=True)) == []
+
+
+@pytest.mark.parametrize("serialization", SERIALIZATIONS)
+def test_load_mapped(data_path, serialization):
+    """Тест: загрузка через mmap в каждом формате записи."""
+    if serialization in ("orjson", "msgpack"):
+        pytest.importorskip(serialization)
+
+    JsonStorage(str(data_path), serialization).save(make_tasks(50))
+    assert load_mapped(str(data_path)) == make_tasks(50)
+
+
+def test_load_mapped_without_orjson(data_path):
+    """Тест: без orjson JSON разбирается по блокам, без копии файла."""
+    JsonStorage(str(data_path)).save(make_tasks(50))
+
+    with patch("task_manager.serialization.orjson", None), \
+            patch("task_manager.serialization.json.loads") as loads:
+        assert load_mapped(str(data_path)) == make_tasks(50)
+
+    loads.assert_not_called()
+
+
+@pytest.mark.parametrize("path_name", ["data.json", "data.ndjson"])
+def test_mmap_task_manager(tmp_path, path_name):
+    """Тест: запросы и изменения при чтении файла через mmap."""
+    path = str(tmp_path / path_name)
+    open_storage(path).save(make_tasks(100))
+
+    params = {"filters": {"category": "Работа"}, "order_by": "due_date"}
+    expected = list(TaskManager(path=path).query_tasks(**params))
+    for streaming in (False, True):
+        manager = TaskManager(path=path, use_mmap=True, streaming=streaming)
+        assert list(manager.query_tasks(**params)) == expected
+
+    manager = TaskManager(path=path, use_mmap=True)
+    assert manager.change_task(_id=1, column="title", value="Новая задача")
+    assert manager.getting_task("1", "id",
+                                as_records=True)[0]["title"] == "Новая задача"
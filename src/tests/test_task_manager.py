@@ -1,9 +1,13 @@
 import json
 import pytest
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import mock_open, patch
 
-from task_manager.task_manager import TaskManager, logger
+from task_manager.index import TaskIndex
+from task_manager.storage import atomic_write as storage_atomic_write
+from task_manager.task_manager import Task, TaskManager, logger
 
 # Мок-данные для тестов
 MOCK_DATA = [
@@ -29,11 +33,16 @@ MOCK_DATA = [
 
 
 @pytest.fixture()
-def mock_task_manager():
+def mock_task_manager(tmp_path, monkeypatch):
     """Фикстура для создания объекта TaskManager с мок-данными."""
+    # Lock-файл создается рядом с data.json, поэтому тесты
+    # выполняются во временном каталоге.
+    monkeypatch.chdir(tmp_path)
     with patch("builtins.open",
                mock_open(read_data=json.dumps(MOCK_DATA))
-               ):
+               ), \
+         patch("task_manager.storage.os.replace"), \
+         patch("task_manager.storage.os.fsync"):
         manager = TaskManager()
         manager.path = "data.json"
         manager.pretty_printed_JSON = True
@@ -235,6 +244,20 @@ def test_add_task_invalid_due_date(mock_task_manager):
     assert result is False
 
 
+def test_add_task_nonexistent_due_date(mock_task_manager):
+    """Тест: добавление задачи с несуществующей датой выполнения."""
+    result = mock_task_manager.add_task(
+        title="Задача",
+        description="Описание задачи",
+        category="Работа",
+        due_date="2099-13-45",
+        priority="Средний",
+        status="Не выполнена"
+    )
+    # Дата в формате YYYY-MM-DD, но такого дня нет
+    assert result is False
+
+
 def test_add_task_past_due_date(mock_task_manager):
     """Тест: добавление задачи с недопустимой датой из прошлого."""
     result = mock_task_manager.add_task(
@@ -312,14 +335,18 @@ def test_delete_task_by_id_success(mock_task_manager):
     """Тест: успешное удаление задачи по ID."""
     with patch("builtins.open",
                mock_open(read_data=json.dumps(MOCK_DATA))
-               ) as mock_file:
+               ) as mock_file, \
+         patch("task_manager.storage.os.replace") as mock_replace:
         result = mock_task_manager.delete_task(value="1", choice="id")
 
         # Проверка успешного результата
         assert result is True
 
-        # Проверка открытия файла на запись
-        mock_file.assert_called_with("data.json", "w", encoding="utf-8")
+        # Проверка записи во временный файл и его замены data.json
+        temp_path, path = mock_replace.call_args.args
+        assert path == "data.json"
+        assert temp_path.startswith("data.json.")
+        mock_file.assert_called_with(temp_path, "w", encoding="utf-8")
 
         # Проверка финальных данных, записанных в файл
         written_data = "".join(
@@ -338,15 +365,19 @@ def test_delete_task_by_category_success(mock_task_manager):
     """Тест: успешное удаление задач по категории."""
     with patch("builtins.open",
                mock_open(read_data=json.dumps(MOCK_DATA))
-               ) as mock_file:
+               ) as mock_file, \
+         patch("task_manager.storage.os.replace") as mock_replace:
         result = mock_task_manager.delete_task(value="Работа",
                                                choice="category")
 
         # Проверка успешного результата
         assert result is True
 
-        # Проверка открытия файла на запись
-        mock_file.assert_called_with("data.json", "w", encoding="utf-8")
+        # Проверка записи во временный файл и его замены data.json
+        temp_path, path = mock_replace.call_args.args
+        assert path == "data.json"
+        assert temp_path.startswith("data.json.")
+        mock_file.assert_called_with(temp_path, "w", encoding="utf-8")
 
         # Проверка финальных данных, записанных в файл
         written_data = "".join(
@@ -423,15 +454,19 @@ def test_change_title_task_success(mock_task_manager):
     """Тест: успешное изменение заголовка задачи."""
     with patch("builtins.open",
                mock_open(read_data=json.dumps(MOCK_DATA))
-               ) as mock_file:
+               ) as mock_file, \
+         patch("task_manager.storage.os.replace") as mock_replace:
         result = mock_task_manager.change_task(_id=1, column="title",
                                                value="Новая задача")
 
         # Проверка успешного результата
         assert result is True
 
-        # Проверка открытия файла на запись
-        mock_file.assert_called_with("data.json", "w", encoding="utf-8")
+        # Проверка записи во временный файл и его замены data.json
+        temp_path, path = mock_replace.call_args.args
+        assert path == "data.json"
+        assert temp_path.startswith("data.json.")
+        mock_file.assert_called_with(temp_path, "w", encoding="utf-8")
 
         # Проверка финальных данных, записанных в файл
         written_data = "".join(
@@ -450,15 +485,19 @@ def test_change_description_task_success(mock_task_manager):
     """Тест: успешное изменение описания задачи."""
     with patch("builtins.open",
                mock_open(read_data=json.dumps(MOCK_DATA))
-               ) as mock_file:
+               ) as mock_file, \
+         patch("task_manager.storage.os.replace") as mock_replace:
         result = mock_task_manager.change_task(_id=1, column="description",
                                                value="Новое Описание")
 
         # Проверка успешного результата
         assert result is True
 
-        # Проверка открытия файла на запись
-        mock_file.assert_called_with("data.json", "w", encoding="utf-8")
+        # Проверка записи во временный файл и его замены data.json
+        temp_path, path = mock_replace.call_args.args
+        assert path == "data.json"
+        assert temp_path.startswith("data.json.")
+        mock_file.assert_called_with(temp_path, "w", encoding="utf-8")
 
         # Проверка финальных данных, записанных в файл
         written_data = "".join(
@@ -477,7 +516,8 @@ def test_change_category_task_success(mock_task_manager):
     """Тест: успешное изменение категории задачи."""
     with patch("builtins.open",
                mock_open(read_data=json.dumps(MOCK_DATA))
-               ) as mock_file:
+               ) as mock_file, \
+         patch("task_manager.storage.os.replace") as mock_replace:
         result = mock_task_manager.change_task(_id=1,
                                                column="category",
                                                value="Обучение")
@@ -485,8 +525,11 @@ def test_change_category_task_success(mock_task_manager):
         # Проверка успешного результата
         assert result is True
 
-        # Проверка открытия файла на запись
-        mock_file.assert_called_with("data.json", "w", encoding="utf-8")
+        # Проверка записи во временный файл и его замены data.json
+        temp_path, path = mock_replace.call_args.args
+        assert path == "data.json"
+        assert temp_path.startswith("data.json.")
+        mock_file.assert_called_with(temp_path, "w", encoding="utf-8")
 
         # Проверка финальных данных, записанных в файл
         written_data = "".join(
@@ -505,7 +548,8 @@ def test_change_due_date_task_success(mock_task_manager):
     """Тест: успешное изменение сроков задачи."""
     with patch("builtins.open",
                mock_open(read_data=json.dumps(MOCK_DATA))
-               ) as mock_file:
+               ) as mock_file, \
+         patch("task_manager.storage.os.replace") as mock_replace:
         result = mock_task_manager.change_task(_id=1,
                                                column="due_date",
                                                value="2077-01-01")
@@ -513,8 +557,11 @@ def test_change_due_date_task_success(mock_task_manager):
         # Проверка успешного результата
         assert result is True
 
-        # Проверка открытия файла на запись
-        mock_file.assert_called_with("data.json", "w", encoding="utf-8")
+        # Проверка записи во временный файл и его замены data.json
+        temp_path, path = mock_replace.call_args.args
+        assert path == "data.json"
+        assert temp_path.startswith("data.json.")
+        mock_file.assert_called_with(temp_path, "w", encoding="utf-8")
 
         # Проверка финальных данных, записанных в файл
         written_data = "".join(
@@ -533,7 +580,8 @@ def test_change_priority_task_success(mock_task_manager):
     """Тест: успешное изменение приоритета задачи."""
     with patch("builtins.open",
                mock_open(read_data=json.dumps(MOCK_DATA))
-               ) as mock_file:
+               ) as mock_file, \
+         patch("task_manager.storage.os.replace") as mock_replace:
         result = mock_task_manager.change_task(_id=1,
                                                column="priority",
                                                value="Средний")
@@ -541,8 +589,11 @@ def test_change_priority_task_success(mock_task_manager):
         # Проверка успешного результата
         assert result is True
 
-        # Проверка открытия файла на запись
-        mock_file.assert_called_with("data.json", "w", encoding="utf-8")
+        # Проверка записи во временный файл и его замены data.json
+        temp_path, path = mock_replace.call_args.args
+        assert path == "data.json"
+        assert temp_path.startswith("data.json.")
+        mock_file.assert_called_with(temp_path, "w", encoding="utf-8")
 
         # Проверка финальных данных, записанных в файл
         written_data = "".join(
@@ -561,7 +612,8 @@ def test_change_status_task_success(mock_task_manager):
     """Тест: успешное изменение статуса задачи."""
     with patch("builtins.open",
                mock_open(read_data=json.dumps(MOCK_DATA))
-               ) as mock_file:
+               ) as mock_file, \
+         patch("task_manager.storage.os.replace") as mock_replace:
         result = mock_task_manager.change_task(_id=1,
                                                column="status",
                                                value="Выполнена")
@@ -569,8 +621,11 @@ def test_change_status_task_success(mock_task_manager):
         # Проверка успешного результата
         assert result is True
 
-        # Проверка открытия файла на запись
-        mock_file.assert_called_with("data.json", "w", encoding="utf-8")
+        # Проверка записи во временный файл и его замены data.json
+        temp_path, path = mock_replace.call_args.args
+        assert path == "data.json"
+        assert temp_path.startswith("data.json.")
+        mock_file.assert_called_with(temp_path, "w", encoding="utf-8")
 
         # Проверка финальных данных, записанных в файл
         written_data = "".join(
@@ -663,3 +718,423 @@ def test_change_status_task_doubles(mock_task_manager):
 
         # Проверка что валидация не прошла
         assert result is False
+
+# RESIDENT STORE
+
+
+@pytest.fixture()
+def file_task_manager(tmp_path):
+    """Фикстура для создания объекта TaskManager с настоящим файлом."""
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(MOCK_DATA, ensure_ascii=False),
+                    encoding="utf-8")
+    manager = TaskManager(path=str(path))
+    manager.pretty_printed_JSON = True
+    yield manager
+
+
+def test_resident_store_parses_file_once(file_task_manager):
+    """Тест: повторные запросы не перечитывают неизмененный файл."""
+    with patch("task_manager.task_manager.json.load",
+               wraps=json.load) as mock_load:
+        file_task_manager.getting_task()
+        file_task_manager.getting_task(value="1", option="id")
+        file_task_manager.getting_task(value="Работа", option="category")
+        assert file_task_manager.data_validation(column="title",
+                                                 value="Новая задача",
+                                                 intention="change",
+                                                 _id=1)
+
+    assert mock_load.call_count == 1
+
+
+def test_resident_store_reloads_changed_file(file_task_manager):
+    """Тест: изменение файла другим процессом сбрасывает резидентную копию."""
+    file_task_manager.getting_task()
+
+    with open(file_task_manager.path, "w", encoding="utf-8") as file:
+        json.dump(MOCK_DATA[:1], file, ensure_ascii=False)
+
+    result = file_task_manager.getting_task()
+    assert "Задача 1" in result
+    assert "Задача 2" not in result
+
+
+def test_resident_store_updated_after_write(file_task_manager):
+    """Тест: после записи резидентная копия соответствует файлу."""
+    assert file_task_manager.change_task(_id=1, column="title",
+                                         value="Новая задача")
+
+    with patch("task_manager.task_manager.json.load",
+               wraps=json.load) as mock_load:
+        result = file_task_manager.getting_task(value="1", option="id")
+
+    assert mock_load.call_count == 0
+    assert "Новая задача" in result
+
+
+def test_add_task_single_read(file_task_manager):
+    """Тест: добавление задачи читает файл один раз и пишет один раз."""
+    with patch("task_manager.task_manager.json.load",
+               wraps=json.load) as mock_load, \
+         patch("task_manager.task_manager.json.dump",
+               wraps=json.dump) as mock_dump:
+        result = file_task_manager.add_task(
+            title="Новая задача",
+            description="Описание новой задачи",
+            category="Личное",
+            due_date="2077-01-01",
+            priority="Средний",
+            status="Не выполнена"
+        )
+
+    assert result is True
+    assert mock_load.call_count == 1
+    assert mock_dump.call_count == 1
+
+
+def test_validate_task_fields_add_without_data(mock_task_manager):
+    """Тест: валидация для add не обращается к данным."""
+    with patch.object(mock_task_manager, "_load_data") as mock_load:
+        result = mock_task_manager.validate_task_fields(
+            {"title": "Новая задача", "priority": "Средний"},
+            intention="add"
+        )
+
+    assert result is True
+    mock_load.assert_not_called()
+
+
+def test_validate_task_fields_change_doubles(mock_task_manager):
+    """Тест: валидация для change сравнивает с переданным снимком."""
+    result = mock_task_manager.validate_task_fields(
+        {"status": "Не выполнена"},
+        intention="change",
+        _id=1,
+        data=TaskIndex(MOCK_DATA)
+    )
+    assert result is False
+
+# DUE_DATE RANGE
+
+
+def test_getting_task_due_between(mock_task_manager):
+    """Тест: получение задач в диапазоне дат."""
+    result = mock_task_manager.getting_task_due_between("2024-12-01",
+                                                        "2024-12-31")
+    assert isinstance(result, str)
+    assert "Задача 1" in result
+    assert "Задача 2" not in result
+
+
+def test_getting_task_due_between_invalid(mock_task_manager):
+    """Тест: диапазон дат с некорректными значениями."""
+    assert mock_task_manager.getting_task_due_between("2024-12",
+                                                      "2024-12-31") is False
+    assert mock_task_manager.getting_task_due_between("2024-12-31",
+                                                      "2024-12-01") is False
+
+
+def test_getting_task_due_within(mock_task_manager):
+    """Тест: получение задач на ближайшие дни."""
+    assert mock_task_manager.getting_task_due_within(-1) is False
+    assert mock_task_manager.getting_task_due_within(7) is False
+
+# RECORDS
+
+
+def test_getting_task_as_records(mock_task_manager):
+    """Тест: получение задач списком словарей."""
+    result = mock_task_manager.getting_task(value="Работа",
+                                            option="category",
+                                            as_records=True)
+    assert result == [MOCK_DATA[0]]
+
+    result = mock_task_manager.getting_task(as_records=True)
+    assert result == MOCK_DATA
+
+
+def test_getting_task_as_records_not_found(mock_task_manager):
+    """Тест: отсутствие задач при получении списком словарей."""
+    result = mock_task_manager.getting_task(value="99", option="id",
+                                            as_records=True)
+    assert result is False
+
+
+def test_getting_task_as_records_are_copies(file_task_manager):
+    """Тест: изменение полученных задач не меняет резидентную копию."""
+    result = file_task_manager.getting_task(value="1", option="id",
+                                            as_records=True)
+    result[0]["title"] = "Измененная задача"
+
+    result = file_task_manager.getting_task(value="1", option="id",
+                                            as_records=True)
+    assert result[0]["title"] == "Задача 1"
+
+
+def test_format_tasks(mock_task_manager):
+    """Тест: отрисовка полученных задач отдельным шагом."""
+    tasks = mock_task_manager.getting_task(as_records=True)
+    assert json.loads(mock_task_manager.format_tasks(tasks)) == MOCK_DATA
+
+    mock_task_manager.pretty_printed_JSON = False
+    assert "Задача 2" in str(mock_task_manager.format_tasks(tasks))
+
+
+def test_format_tasks_table_is_per_call(file_task_manager):
+    """Тест: каждая отрисовка возвращает свою таблицу, в том числе
+    при одновременных вызовах из нескольких потоков."""
+    first = file_task_manager.format_tasks_table([MOCK_DATA[0]])
+    second = file_task_manager.format_tasks_table([MOCK_DATA[1]])
+    assert first is not second
+    assert "Задача 1" in str(first) and "Задача 2" not in str(first)
+
+    file_task_manager.pretty_printed_JSON = False
+
+    def render(_id):
+        tasks = file_task_manager.getting_task(value=str(_id), option="id")
+        return _id, [row[0] for row in tasks.rows]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(render, [1, 2] * 100))
+
+    assert all(rows == [_id] for _id, rows in results)
+
+
+def test_reads_wait_for_writes_in_threads(file_task_manager):
+    """Тест: изменение из другого потока не пересекается с чтением."""
+    search = TaskIndex.search
+    writer = threading.Thread(target=file_task_manager.delete_tasks,
+                              kwargs={"ids": [2]})
+    blocked = []
+
+    def slow_search(index, keyword, mode="substring"):
+        # Изменение начинается посреди чтения и должно его дождаться
+        writer.start()
+        writer.join(0.1)
+        blocked.append(writer.is_alive())
+        return search(index, keyword, mode)
+
+    with patch.object(TaskIndex, "search", autospec=True,
+                      side_effect=slow_search):
+        tasks = file_task_manager.getting_task(
+            value="Задача", option="keywords", as_records=True
+        )
+    writer.join()
+
+    assert blocked == [True]
+    assert [task["id"] for task in tasks] == [1, 2]
+    assert file_task_manager.getting_task(value="2", option="id") is False
+
+# BATCH
+
+
+def make_new_task(number):
+    """Новая задача для пакетных операций."""
+    return {
+        "title": f"Пакетная задача {number}",
+        "description": "Описание пакетной задачи",
+        "category": "Обучение",
+        "due_date": "2099-01-01",
+        "priority": "Средний",
+    }
+
+
+def test_add_tasks(file_task_manager):
+    """Тест: пакетное добавление задач одной записью с отчетом."""
+    tasks = [make_new_task(number) for number in range(3)]
+    tasks.insert(1, dict(make_new_task(9), category="Отдых"))
+    tasks.append(dict(make_new_task(10), color="Красный"))
+
+    with patch("task_manager.storage.atomic_write",
+               wraps=storage_atomic_write) as mock_write:
+        report = file_task_manager.add_tasks(tasks)
+
+    assert mock_write.call_count == 1
+    assert report == {
+        "added": [3, 4, 5],
+        "failed": [{"index": 1, "field": "category"},
+                   {"index": 4, "field": "color"}]
+    }
+
+    with open(file_task_manager.path, "r", encoding="utf-8") as file:
+        saved = json.load(file)
+    assert [task["id"] for task in saved] == [1, 2, 3, 4, 5]
+    assert saved[2]["title"] == "Пакетная задача 0"
+    assert saved[2]["status"] == "Не выполнена"
+
+
+def test_add_tasks_all_invalid(file_task_manager):
+    """Тест: пакет без корректных задач не изменяет файл."""
+    with patch("task_manager.storage.atomic_write") as mock_write:
+        report = file_task_manager.add_tasks(
+            [dict(make_new_task(0), title=""), "Задача"]
+        )
+
+    mock_write.assert_not_called()
+    assert report == {"added": [],
+                      "failed": [{"index": 0, "field": "title"},
+                                 {"index": 1, "field": None}]}
+
+
+def test_empty_status_defaults(file_task_manager):
+    """Тест: пустой статус при добавлении и изменении - "Не выполнена"."""
+    report = file_task_manager.add_tasks([dict(make_new_task(0),
+                                               status=" ")])
+    assert report == {"added": [3], "failed": []}
+    assert file_task_manager.change_tasks({2: {"status": ""}}) is True
+
+    tasks = file_task_manager.getting_task(as_records=True)
+    assert [task["status"] for task in tasks[1:]] == ["Не выполнена"] * 2
+
+
+def test_change_tasks_by_id(file_task_manager):
+    """Тест: изменение нескольких полей нескольких задач одной записью."""
+    with patch("task_manager.storage.atomic_write",
+               wraps=storage_atomic_write) as mock_write:
+        result = file_task_manager.change_tasks({
+            1: {"title": "Новая задача", "priority": "Низкий",
+                "due_date": "2099-05-01"},
+            2: {"status": "Не выполнена", "priority": "Низкий"},
+        })
+
+    assert result is True
+    assert mock_write.call_count == 1
+
+    tasks = file_task_manager.getting_task(as_records=True)
+    assert tasks[0]["title"] == "Новая задача"
+    assert tasks[0]["priority"] == "Низкий"
+    assert tasks[0]["due_date"] == "2099-05-01"
+    assert tasks[1]["status"] == "Не выполнена"
+
+
+def test_change_tasks_by_query(file_task_manager):
+    """Тест: изменение задач, найденных по запросу."""
+    result = file_task_manager.change_tasks(
+        where={"filters": {"category": "Личное"}},
+        patch={"category": "Обучение"}
+    )
+    assert result is True
+
+    tasks = file_task_manager.getting_task(as_records=True)
+    assert [task["category"] for task in tasks] == ["Работа", "Обучение"]
+
+
+def test_change_tasks_patch_requires_where(file_task_manager):
+    """Тест: patch без условий отбора не изменяет задачи без all_tasks."""
+    with patch("task_manager.storage.atomic_write") as mock_write:
+        assert file_task_manager.change_tasks(
+            patch={"category": "Обучение"}
+        ) is False
+        assert file_task_manager.change_tasks(
+            where={"filters": {}, "search_mode": "any"},
+            patch={"category": "Обучение"}
+        ) is False
+        assert file_task_manager.change_tasks(
+            where={"order_by": "id", "limit": 1},
+            patch={"category": "Обучение"}
+        ) is False
+
+    mock_write.assert_not_called()
+
+    assert file_task_manager.change_tasks(
+        where={}, patch={"category": "Обучение"}, all_tasks=True
+    ) is True
+    tasks = file_task_manager.getting_task(as_records=True)
+    assert [task["category"] for task in tasks] == ["Обучение", "Обучение"]
+
+
+def test_change_tasks_invalid_changes_nothing(file_task_manager):
+    """Тест: ошибка валидации одного изменения отменяет весь пакет."""
+    with patch("task_manager.storage.atomic_write") as mock_write:
+        assert file_task_manager.change_tasks({
+            1: {"title": "Новая задача"},
+            2: {"priority": "Срочный"},
+        }) is False
+        assert file_task_manager.change_tasks({
+            1: {"title": "Новая задача"},
+            99: {"title": "Новая задача"},
+        }) is False
+        assert file_task_manager.change_tasks({1: {"id": "5"}}) is False
+
+    mock_write.assert_not_called()
+    assert file_task_manager.getting_task(as_records=True) == MOCK_DATA
+
+
+def test_delete_tasks_by_ids(file_task_manager, capsys):
+    """Тест: удаление списка ID одной записью и одним сообщением."""
+    file_task_manager.add_tasks([make_new_task(number) for number in range(3)])
+    capsys.readouterr()
+
+    with patch("task_manager.storage.atomic_write",
+               wraps=storage_atomic_write) as mock_write:
+        result = file_task_manager.delete_tasks(ids=[1, 3, 5, 99])
+
+    assert result is True
+    assert mock_write.call_count == 1
+    assert capsys.readouterr().out == (
+        "Удалено задач: 3. Не найдено ID: 1.\n"
+    )
+    tasks = file_task_manager.getting_task(as_records=True)
+    assert [task["id"] for task in tasks] == [2, 4]
+
+
+def test_delete_tasks_by_query(file_task_manager):
+    """Тест: удаление задач, найденных по запросу."""
+    file_task_manager.add_tasks([make_new_task(number) for number in range(3)])
+
+    assert file_task_manager.delete_tasks(
+        where={"filters": {"category": "Обучение"}, "keywords": "задача 1"}
+    ) is True
+    tasks = file_task_manager.getting_task(as_records=True)
+    assert [task["id"] for task in tasks] == [1, 2, 3, 5]
+
+
+def test_delete_tasks_not_found(file_task_manager):
+    """Тест: удаление несуществующих задач не изменяет файл."""
+    with patch("task_manager.storage.atomic_write") as mock_write:
+        assert file_task_manager.delete_tasks(ids=[99]) is False
+        assert file_task_manager.delete_tasks(
+            where={"filters": {"category": "Обучение"}}
+        ) is False
+        assert file_task_manager.delete_tasks() is False
+
+    mock_write.assert_not_called()
+
+
+def test_delete_tasks_where_requires_selection(file_task_manager):
+    """Тест: where без условий отбора не удаляет задачи без all_tasks."""
+    with patch("task_manager.storage.atomic_write") as mock_write:
+        assert file_task_manager.delete_tasks(where={}) is False
+        assert file_task_manager.delete_tasks(
+            where={"order_by": "id", "limit": 1}
+        ) is False
+
+    mock_write.assert_not_called()
+    assert file_task_manager.getting_task(as_records=True) == MOCK_DATA
+
+    assert file_task_manager.delete_tasks(where={}, all_tasks=True) is True
+    assert file_task_manager.query_tasks() is not False
+    assert list(file_task_manager.query_tasks()) == []
+
+
+def test_delete_task_by_category_single_message(file_task_manager, capsys):
+    """Тест: удаление по категории выводит одно итоговое сообщение."""
+    file_task_manager.add_tasks([make_new_task(number) for number in range(3)])
+    capsys.readouterr()
+
+    assert file_task_manager.delete_task(value="Обучение",
+                                         choice="category") is True
+    assert capsys.readouterr().out.count("\n") == 1
+
+# TASK
+
+
+def test_task_slots():
+    """Тест: задача без словаря атрибутов и ее преобразование в словарь."""
+    task = Task.from_dict(dict(MOCK_DATA[0]))
+
+    assert not hasattr(task, "__dict__")
+    assert task.to_dict() == MOCK_DATA[0]
+    with pytest.raises(AttributeError):
+        task.color = "Красный"